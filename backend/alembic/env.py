@@ -14,10 +14,13 @@ from app.models import (
     Decision,
     Document,
     Embedding,
+    EmbeddingCache,
     Explanation,
     Extraction,
     Job,
+    JobExtraction,
     JobsQueue,
+    RescoreRun,
     Score,
     ScoreConfig,
 )
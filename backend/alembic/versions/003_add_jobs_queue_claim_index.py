@@ -0,0 +1,32 @@
+"""Add composite index for claiming jobs from the queue
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Workers claim batches with
+    #   WHERE status = 'READY' AND job_type = ? ORDER BY created_at LIMIT n
+    #   FOR UPDATE SKIP LOCKED
+    # so the index covers the filter and the sort order.
+    op.create_index(
+        "ix_jobs_queue_status_type_created",
+        "jobs_queue",
+        ["status", "job_type", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_queue_status_type_created", table_name="jobs_queue")
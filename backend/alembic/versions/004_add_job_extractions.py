@@ -0,0 +1,41 @@
+"""Add job_extractions table for cached job requirements
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-02-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Job requirements are extracted once per (job, job text, model) and
+    # shared by every candidate of the job.
+    op.create_table(
+        "job_extractions",
+        sa.Column(
+            "job_id",
+            sa.String(36),
+            sa.ForeignKey("jobs.job_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("job_text_hash", sa.String(64), primary_key=True),
+        sa.Column("llm_model", sa.String(100), primary_key=True),
+        sa.Column("requirements_json", sa.JSON, nullable=True),
+        sa.Column("evidence_json", sa.JSON, nullable=True),
+        sa.Column("extract_version", sa.String(50), nullable=True),
+        sa.Column("created_at", sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_extractions")
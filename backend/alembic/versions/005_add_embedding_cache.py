@@ -0,0 +1,34 @@
+"""Add embedding_cache table for content-addressed embeddings
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-02-08 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Vectors keyed by (embedding_model, sha256(text)); nice requirement
+    # embeddings are shared by every candidate of a job instead of being
+    # copied into per-candidate NICE_REQ rows.
+    op.create_table(
+        "embedding_cache",
+        sa.Column("embedding_model", sa.String(100), primary_key=True),
+        sa.Column("text_hash", sa.String(64), primary_key=True),
+        sa.Column("vector", sa.JSON, nullable=True),
+        sa.Column("created_at", sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_cache")
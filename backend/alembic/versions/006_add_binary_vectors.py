@@ -0,0 +1,36 @@
+"""Add binary vector columns to embeddings and embedding_cache
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-02-12 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("embeddings", "embedding_cache")
+
+
+def upgrade() -> None:
+    # Vectors are stored as little-endian float32/float16 bytes. The JSON
+    # vector column is kept for rows not yet converted by
+    # `python -m worker.backfill_vectors`.
+    for table in TABLES:
+        op.add_column(table, sa.Column("vector_blob", sa.LargeBinary, nullable=True))
+        op.add_column(table, sa.Column("vector_dim", sa.Integer, nullable=True))
+        op.add_column(table, sa.Column("vector_dtype", sa.String(10), nullable=True))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "vector_dtype")
+        op.drop_column(table, "vector_dim")
+        op.drop_column(table, "vector_blob")
@@ -0,0 +1,51 @@
+"""Add rescore_runs table for bulk rescoring
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-02-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rescore_runs",
+        sa.Column("run_id", sa.String(36), primary_key=True),
+        sa.Column(
+            "score_config_version",
+            sa.Integer,
+            sa.ForeignKey("score_config.version"),
+            nullable=False,
+        ),
+        sa.Column(
+            "job_id",
+            sa.String(36),
+            sa.ForeignKey("jobs.job_id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("status", sa.String(20), nullable=False, server_default="PENDING"),
+        sa.Column("total", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("processed", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("last_error", sa.Text, nullable=True),
+        sa.Column("started_at", sa.DateTime, nullable=True),
+        sa.Column("finished_at", sa.DateTime, nullable=True),
+        sa.Column("created_at", sa.DateTime, server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+    # Workers poll for the oldest PENDING run
+    op.create_index("ix_rescore_runs_status_created", "rescore_runs", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rescore_runs_status_created", table_name="rescore_runs")
+    op.drop_table("rescore_runs")
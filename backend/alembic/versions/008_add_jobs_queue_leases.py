@@ -0,0 +1,41 @@
+"""Add lease and backoff columns to jobs_queue
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-02-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs_queue", sa.Column("worker_id", sa.String(64), nullable=True))
+    op.add_column("jobs_queue", sa.Column("leased_until", sa.DateTime, nullable=True))
+    op.add_column("jobs_queue", sa.Column("available_at", sa.DateTime, nullable=True))
+
+    # Jobs left RUNNING by crashed workers get an already expired lease, so
+    # the reaper returns them to the queue
+    op.execute("UPDATE jobs_queue SET leased_until = updated_at WHERE status = 'RUNNING'")
+
+    # The reaper looks for RUNNING jobs whose lease has expired
+    op.create_index(
+        "ix_jobs_queue_status_leased_until",
+        "jobs_queue",
+        ["status", "leased_until"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_queue_status_leased_until", table_name="jobs_queue")
+    op.drop_column("jobs_queue", "available_at")
+    op.drop_column("jobs_queue", "leased_until")
+    op.drop_column("jobs_queue", "worker_id")
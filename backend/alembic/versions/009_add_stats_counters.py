@@ -0,0 +1,64 @@
+"""Add stats_counters table for dashboard statistics
+
+Revision ID: 009
+Revises: 008
+Create Date: 2024-02-25 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUSES = ["NEW", "PROCESSING", "DONE", "ERROR"]
+DECISIONS = ["pass", "hold", "reject"]
+
+
+def upgrade() -> None:
+    stats_counters = op.create_table(
+        "stats_counters",
+        sa.Column("name", sa.String(64), primary_key=True),
+        sa.Column("value", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime, server_default=sa.func.now(), nullable=False),
+    )
+
+    # Backfill from the current data
+    conn = op.get_bind()
+    counters = {"jobs": conn.execute(sa.text("SELECT COUNT(*) FROM jobs")).scalar() or 0}
+    counters.update({f"status:{status}": 0 for status in STATUSES})
+    counters.update({f"decision:{decision}": 0 for decision in DECISIONS + ["undecided"]})
+
+    rows = conn.execute(
+        sa.text(
+            """
+            SELECT c.status, d.decision, COUNT(*)
+            FROM candidates c
+            LEFT JOIN (
+                SELECT candidate_id, decision,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY candidate_id ORDER BY decided_at DESC
+                       ) AS rn
+                FROM decisions
+            ) d ON d.candidate_id = c.candidate_id AND d.rn = 1
+            GROUP BY c.status, d.decision
+            """
+        )
+    )
+    for status, decision, count in rows:
+        counters[f"status:{status}"] = counters.get(f"status:{status}", 0) + count
+        name = f"decision:{decision or 'undecided'}"
+        counters[name] = counters.get(name, 0) + count
+
+    op.bulk_insert(
+        stats_counters, [{"name": name, "value": value} for name, value in counters.items()]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stats_counters")
@@ -0,0 +1,48 @@
+"""Add latest decision columns to candidates
+
+Revision ID: 010
+Revises: 009
+Create Date: 2024-03-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("candidates", sa.Column("latest_decision", sa.String(20), nullable=True))
+    op.add_column("candidates", sa.Column("latest_decided_at", sa.DateTime, nullable=True))
+
+    # Backfill from the newest decision of each candidate
+    op.execute(
+        """
+        UPDATE candidates c
+        JOIN (
+            SELECT candidate_id, decision, decided_at,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY candidate_id ORDER BY decided_at DESC
+                   ) AS rn
+            FROM decisions
+        ) d ON d.candidate_id = c.candidate_id AND d.rn = 1
+        SET c.latest_decision = d.decision, c.latest_decided_at = d.decided_at
+        """
+    )
+
+    # For listing a job's candidates by decision
+    op.create_index(
+        "ix_candidates_job_latest_decision", "candidates", ["job_id", "latest_decision"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_candidates_job_latest_decision", table_name="candidates")
+    op.drop_column("candidates", "latest_decided_at")
+    op.drop_column("candidates", "latest_decision")
@@ -0,0 +1,44 @@
+"""Add rank_fit to candidates for keyset-paginated rankings
+
+Revision ID: 011
+Revises: 010
+Create Date: 2024-03-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # -1 marks unscored candidates, which rank after every score (0-100)
+    op.add_column(
+        "candidates",
+        sa.Column("rank_fit", sa.Integer, nullable=False, server_default="-1"),
+    )
+    op.execute(
+        """
+        UPDATE candidates c
+        JOIN scores s ON s.candidate_id = c.candidate_id
+        SET c.rank_fit = s.total_fit_0_100
+        """
+    )
+
+    # Ranked candidate lists are read in this order, backwards
+    op.create_index(
+        "ix_candidates_job_rank",
+        "candidates",
+        ["job_id", "rank_fit", "submitted_at", "candidate_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_candidates_job_rank", table_name="candidates")
+    op.drop_column("candidates", "rank_fit")
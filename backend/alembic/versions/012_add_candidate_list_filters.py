@@ -0,0 +1,36 @@
+"""Add must_gaps_count and indexes for candidate list filters
+
+Revision ID: 012
+Revises: 011
+Create Date: 2024-03-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "scores",
+        sa.Column("must_gaps_count", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE scores SET must_gaps_count = COALESCE(JSON_LENGTH(must_gaps_json), 0)"
+    )
+
+    # Filtering and faceting a job's candidates by status; decisions and
+    # score ranges use ix_candidates_job_latest_decision and ix_candidates_job_rank
+    op.create_index("ix_candidates_job_status", "candidates", ["job_id", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_candidates_job_status", table_name="candidates")
+    op.drop_column("scores", "must_gaps_count")
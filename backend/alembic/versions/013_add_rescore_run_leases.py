@@ -0,0 +1,31 @@
+"""Add lease columns to rescore_runs
+
+Revision ID: 013
+Revises: 012
+Create Date: 2024-03-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("rescore_runs", sa.Column("worker_id", sa.String(64), nullable=True))
+    op.add_column("rescore_runs", sa.Column("leased_until", sa.DateTime, nullable=True))
+
+    # Runs left RUNNING by crashed workers get an already expired lease, so
+    # the next worker to poll takes them over
+    op.execute("UPDATE rescore_runs SET leased_until = updated_at WHERE status = 'RUNNING'")
+
+
+def downgrade() -> None:
+    op.drop_column("rescore_runs", "leased_until")
+    op.drop_column("rescore_runs", "worker_id")
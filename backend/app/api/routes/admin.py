@@ -3,7 +3,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.repositories.score_config_repository import ScoreConfigRepository
+from app.schemas.rescore import RescoreRunCreate, RescoreRunResponse
 from app.schemas.score_config import ScoreConfigCreate, ScoreConfigResponse
+from app.services.rescore_service import RescoreService
 
 router = APIRouter()
 
@@ -42,7 +44,11 @@ async def update_score_config(
     data: ScoreConfigCreate,
     db: AsyncSession = Depends(get_db),
 ) -> ScoreConfigResponse:
-    """Create a new version of the score configuration."""
+    """Create a new version of the score configuration.
+
+    Unless ``rescore`` is false, a rescore run is queued so that existing
+    scores are recomputed with the new version.
+    """
     repo = ScoreConfigRepository(db)
 
     # Get current config for role_distance default
@@ -64,4 +70,44 @@ async def update_score_config(
         nice_top_n=data.nice_top_n,
         role_distance_json=role_distance,
     )
-    return ScoreConfigResponse.model_validate(config)
+    response = ScoreConfigResponse.model_validate(config)
+
+    if data.rescore:
+        run = await RescoreService(db).start_run(score_config_version=config.version)
+        response.rescore_run_id = run.run_id
+
+    return response
+
+
+@router.post(
+    "/rescore-runs",
+    response_model=RescoreRunResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def start_rescore_run(
+    data: RescoreRunCreate,
+    db: AsyncSession = Depends(get_db),
+) -> RescoreRunResponse:
+    """Recompute scores with the current score config, for all jobs or one job."""
+    service = RescoreService(db)
+    return await service.start_run(job_id=data.job_id)
+
+
+@router.get("/rescore-runs", response_model=list[RescoreRunResponse])
+async def list_rescore_runs(
+    limit: int = 20,
+    db: AsyncSession = Depends(get_db),
+) -> list[RescoreRunResponse]:
+    """List recent rescore runs."""
+    service = RescoreService(db)
+    return await service.list_runs(limit)
+
+
+@router.get("/rescore-runs/{run_id}", response_model=RescoreRunResponse)
+async def get_rescore_run(
+    run_id: str,
+    db: AsyncSession = Depends(get_db),
+) -> RescoreRunResponse:
+    """Get progress and throughput of a rescore run."""
+    service = RescoreService(db)
+    return await service.get_run(run_id)
@@ -1,14 +1,44 @@
-from fastapi import APIRouter, Depends, status
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.models.candidate import CandidateStatus
-from app.schemas.candidate import CandidateCreate, CandidateDetail, CandidateListItem, CandidateUpdate
+from app.schemas.candidate import (
+    CandidateCreate,
+    CandidateDetail,
+    CandidateFilters,
+    CandidateListItem,
+    CandidateListResponse,
+    CandidateUpdate,
+)
 from app.services.candidate_service import CandidateService
 
 router = APIRouter()
 
 
+def candidate_filters(
+    status: list[CandidateStatus] | None = Query(None),
+    decision: list[Literal["pass", "hold", "reject", "undecided"]] | None = Query(None),
+    min_score: int | None = Query(None, ge=0, le=100),
+    max_score: int | None = Query(None, ge=0, le=100),
+    has_must_gaps: bool | None = None,
+) -> CandidateFilters:
+    """Read candidate list filters from the query string.
+
+    ``status`` and ``decision`` may be repeated to match any of the values.
+    """
+    return CandidateFilters(
+        status=status,
+        decision=decision,
+        min_score=min_score,
+        max_score=max_score,
+        has_must_gaps=has_must_gaps,
+    )
+
+
 @router.post(
     "/jobs/{job_id}/candidates",
     response_model=CandidateDetail,
@@ -24,17 +54,42 @@ async def create_candidate(
     return await service.create_candidate(job_id, data)
 
 
-@router.get("/jobs/{job_id}/candidates", response_model=list[CandidateListItem])
+@router.get(
+    "/jobs/{job_id}/candidates",
+    response_model=list[CandidateListItem] | CandidateListResponse,
+)
 async def list_candidates(
     job_id: str,
-    limit: int = 100,
-    offset: int = 0,
+    response: Response,
+    filters: CandidateFilters = Depends(candidate_filters),
+    limit: int = Query(100, ge=1),
+    offset: int = Query(0, ge=0),
     sort_by_score: bool = True,
+    cursor: str | None = None,
+    include_facets: bool = False,
     db: AsyncSession = Depends(get_db),
-) -> list[CandidateListItem]:
-    """List candidates for a job, optionally ranked by score."""
+) -> list[CandidateListItem] | CandidateListResponse:
+    """List candidates for a job, optionally ranked by score and filtered.
+
+    When a ranked list has more candidates, the cursor of the next page is
+    returned in the X-Next-Cursor header; pass it back as ``cursor``. With
+    ``include_facets`` the candidates are wrapped in an object together
+    with the next cursor and per-filter counts.
+    """
     service = CandidateService(db)
-    return await service.list_candidates(job_id, limit, offset, sort_by_score)
+    candidates, next_cursor = await service.list_candidates(
+        job_id, limit, offset, sort_by_score, cursor, filters
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if not include_facets:
+        return candidates
+
+    return CandidateListResponse(
+        items=candidates,
+        next_cursor=next_cursor,
+        facets=await service.get_facets(job_id, filters),
+    )
 
 
 @router.get("/candidates/{candidate_id}", response_model=CandidateDetail)
@@ -1,12 +1,19 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.models.candidate import Candidate
-from app.models.decision import Decision
+from app.models.candidate import Candidate, CandidateStatus
+from app.models.decision import DecisionType
 from app.models.job import Job
 from app.models.score import Score
+from app.repositories.stats_repository import (
+    JOBS_COUNTER,
+    UNDECIDED,
+    StatsRepository,
+    decision_counter,
+    status_counter,
+)
 from app.schemas.dashboard import DashboardStatsResponse, RecentCandidate
 
 router = APIRouter()
@@ -15,57 +22,20 @@ router = APIRouter()
 @router.get("/stats", response_model=DashboardStatsResponse)
 async def get_dashboard_stats(db: AsyncSession = Depends(get_db)):
     """Get dashboard statistics."""
-    # Total jobs
-    total_jobs_result = await db.execute(select(func.count(Job.job_id)))
-    total_jobs = total_jobs_result.scalar() or 0
+    # Counters are kept up to date as candidates change; a database that
+    # never had them built (no migration 009) is aggregated on the fly
+    stats_repo = StatsRepository(db)
+    counters = await stats_repo.get_counters() or await stats_repo.compute_counters()
 
-    # Total candidates
-    total_candidates_result = await db.execute(select(func.count(Candidate.candidate_id)))
-    total_candidates = total_candidates_result.scalar() or 0
-
-    # Candidates by status
-    status_counts = {}
-    for status in ["NEW", "PROCESSING", "DONE", "ERROR"]:
-        result = await db.execute(
-            select(func.count(Candidate.candidate_id)).where(Candidate.status == status)
-        )
-        status_counts[status] = result.scalar() or 0
-
-    # Candidates by decision
-    # Get latest decision for each candidate
-    subquery = (
-        select(
-            Decision.candidate_id,
-            Decision.decision,
-            func.row_number()
-            .over(partition_by=Decision.candidate_id, order_by=Decision.decided_at.desc())
-            .label("rn"),
-        )
-    ).subquery()
-
-    latest_decisions = select(subquery.c.candidate_id, subquery.c.decision).where(
-        subquery.c.rn == 1
-    )
-
-    decision_counts = {"pass": 0, "hold": 0, "reject": 0, "undecided": 0}
-
-    # Count by decision type
-    for decision_type in ["pass", "hold", "reject"]:
-        result = await db.execute(
-            select(func.count()).select_from(
-                latest_decisions.where(subquery.c.decision == decision_type).subquery()
-            )
-        )
-        decision_counts[decision_type] = result.scalar() or 0
-
-    # Count undecided (candidates without any decision)
-    candidates_with_decision = select(Decision.candidate_id).distinct()
-    undecided_result = await db.execute(
-        select(func.count(Candidate.candidate_id)).where(
-            Candidate.candidate_id.notin_(candidates_with_decision)
-        )
-    )
-    decision_counts["undecided"] = undecided_result.scalar() or 0
+    total_jobs = counters.get(JOBS_COUNTER, 0)
+    status_counts = {
+        status.value: counters.get(status_counter(status), 0) for status in CandidateStatus
+    }
+    total_candidates = sum(status_counts.values())
+    decision_counts = {
+        decision.value: counters.get(decision_counter(decision), 0) for decision in DecisionType
+    }
+    decision_counts[UNDECIDED] = counters.get(decision_counter(None), 0)
 
     # Recent candidates (last 10)
     recent_candidates_query = (
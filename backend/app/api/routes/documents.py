@@ -1,13 +1,41 @@
-from fastapi import APIRouter, Depends, File, Form, UploadFile, status
-from fastapi.responses import Response
+from collections.abc import AsyncIterator
+from datetime import UTC
+from email.utils import formatdate
+
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile, status
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.core.database import get_db
 from app.models.document import DocumentType
 from app.schemas.document import DocumentResponse
 from app.services.document_service import DocumentService
 
 router = APIRouter()
+settings = get_settings()
+
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "doc": "application/msword",
+}
+
+
+async def iter_upload(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in chunks."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in tags
 
 
 @router.post(
@@ -23,10 +51,9 @@ async def upload_document(
 ) -> DocumentResponse:
     """Upload a document for a candidate and start processing."""
     service = DocumentService(db)
-    content = await file.read()
     return await service.upload_document(
         candidate_id=candidate_id,
-        file_content=content,
+        chunks=iter_upload(file, settings.upload_chunk_size),
         filename=file.filename or "document",
         doc_type=type,
     )
@@ -55,26 +82,36 @@ async def get_document(
 @router.get("/documents/{document_id}/download")
 async def download_document(
     document_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> Response:
-    """Download the original document file."""
+    """Download the original document file.
+
+    The file is streamed from storage (sendfile where the server supports
+    it). Stored files are immutable, so the ETag is the content hash, and
+    Range requests are served as 206 partial content.
+    """
     service = DocumentService(db)
-    content, filename = await service.get_document_content(document_id)
+    document, path = await service.get_document_file(document_id)
+    filename = document.original_filename
 
     # Determine content type
     ext = filename.lower().split(".")[-1] if "." in filename else ""
-    content_types = {
-        "pdf": "application/pdf",
-        "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "doc": "application/msword",
+    content_type = CONTENT_TYPES.get(ext, "application/octet-stream")
+
+    headers = {
+        "Cache-Control": "private, no-cache",
+        "Last-Modified": formatdate(
+            document.created_at.replace(tzinfo=UTC).timestamp(), usegmt=True
+        ),
     }
-    content_type = content_types.get(ext, "application/octet-stream")
+    if document.file_hash:
+        etag = f'"{document.file_hash}"'
+        headers["ETag"] = etag
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    return Response(
-        content=content,
-        media_type=content_type,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return FileResponse(path, media_type=content_type, headers=headers, filename=filename)
 
 
 @router.get("/documents/{document_id}/text")
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.storage import StorageService, get_storage
 from app.schemas.job import JobCreate, JobDetail, JobListItem, JobUpdate
 from app.services.job_service import JobService
 
@@ -53,8 +54,13 @@ async def update_job(
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job(
     job_id: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage),
 ) -> None:
     """Delete a job posting."""
     service = JobService(db)
-    await service.delete_job(job_id)
+    unreferenced = await service.delete_job(job_id)
+    # Background tasks run after the session has been committed
+    background_tasks.add_task(storage.delete_unreferenced_files, unreferenced)
+    background_tasks.add_task(storage.delete_job_texts, job_id)
@@ -0,0 +1,204 @@
+"""Benchmark the ranked candidate list: ORM objects vs. column projection.
+
+Usage:
+    python -m app.benchmark_candidate_list [--candidates N] [--limit N] [--pages N]
+        [--database-url URL]
+
+Creates a job with ``--candidates`` scored and explained candidates (each
+with a few decisions), then pages through its ranking with both query
+paths and prints the mean time per page. By default it runs against an
+in-memory SQLite database; with ``--database-url`` the benchmark job is
+created in that database and deleted afterwards.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from app.core.database import Base
+from app.models import Candidate, Decision, Explanation, Job, Score
+from app.schemas.candidate import CandidateListItem
+from app.services.candidate_service import CandidateService
+
+SQLITE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+async def create_data(db: AsyncSession, job_id: str, count: int) -> None:
+    """Create a job with ``count`` candidates and their scores, explanations and decisions."""
+    db.add(Job(job_id=job_id, title="Benchmark job", job_text_raw="Benchmark"))
+    await db.flush()
+
+    started = datetime(2024, 1, 1)
+    sentences = [f"Sentence {i} of an explanation written by the LLM." for i in range(8)]
+    for i in range(count):
+        candidate_id = str(uuid.uuid4())
+        total_fit = random.randint(0, 100)
+        db.add(
+            Candidate(
+                candidate_id=candidate_id,
+                job_id=job_id,
+                display_name=f"Candidate {i}",
+                status="DONE",
+                rank_fit=total_fit,
+                latest_decision="hold",
+                latest_decided_at=started,
+                submitted_at=started + timedelta(minutes=i),
+            )
+        )
+        db.add(
+            Score(
+                candidate_id=candidate_id,
+                total_fit_0_100=total_fit,
+                must_gaps_json=["Kubernetes", "Go"],
+                must_gaps_count=2,
+                score_config_version=1,
+            )
+        )
+        db.add(
+            Explanation(
+                candidate_id=candidate_id,
+                explanation_json={
+                    "summary": " ".join(sentences),
+                    "strengths": sentences[:5],
+                    "concerns": sentences[:4],
+                    "unknowns": sentences[:3],
+                    "must_gaps": sentences[:2],
+                },
+            )
+        )
+        for decision in ["pass", "reject", "hold"]:
+            db.add(
+                Decision(
+                    decision_id=str(uuid.uuid4()),
+                    candidate_id=candidate_id,
+                    decision=decision,
+                    decided_at=started,
+                )
+            )
+        if i % 500 == 499:
+            await db.flush()
+    await db.commit()
+
+
+async def list_with_orm(
+    db: AsyncSession, job_id: str, limit: int, offset: int
+) -> list[CandidateListItem]:
+    """Build list items from ORM objects with their relationships loaded."""
+    stmt = (
+        select(Candidate)
+        .where(Candidate.job_id == job_id)
+        .options(
+            selectinload(Candidate.score),
+            selectinload(Candidate.explanation),
+            selectinload(Candidate.decisions),
+        )
+        .order_by(
+            Candidate.rank_fit.desc(),
+            Candidate.submitted_at.desc(),
+            Candidate.candidate_id.desc(),
+        )
+        .limit(limit)
+        .offset(offset)
+    )
+    candidates = (await db.execute(stmt)).scalars().all()
+
+    items = []
+    for candidate in candidates:
+        explanation = (candidate.explanation and candidate.explanation.explanation_json) or {}
+        latest = max(candidate.decisions, key=lambda d: d.decided_at, default=None)
+        items.append(
+            CandidateListItem(
+                candidate_id=candidate.candidate_id,
+                display_name=candidate.display_name,
+                status=candidate.status,
+                total_fit_0_100=candidate.score.total_fit_0_100 if candidate.score else None,
+                must_gaps_count=len(candidate.score.must_gaps_json or [])
+                if candidate.score
+                else 0,
+                strengths_top3=explanation.get("strengths", [])[:3],
+                concerns_top3=explanation.get("concerns", [])[:3],
+                decided_state=latest.decision if latest else None,
+                submitted_at=candidate.submitted_at,
+            )
+        )
+    return items
+
+
+async def list_with_projection(
+    db: AsyncSession, job_id: str, limit: int, offset: int
+) -> list[CandidateListItem]:
+    """Build list items the way the API does."""
+    items, _ = await CandidateService(db).list_candidates(job_id, limit, offset)
+    return items
+
+
+async def time_pages(
+    session_factory: async_sessionmaker[AsyncSession],
+    list_fn: Callable[[AsyncSession, str, int, int], Awaitable[list[CandidateListItem]]],
+    job_id: str,
+    limit: int,
+    pages: int,
+) -> float:
+    """Get the mean seconds per page, each page read in a fresh session."""
+    elapsed = 0.0
+    for page in range(pages):
+        async with session_factory() as db:
+            started = time.perf_counter()
+            items = await list_fn(db, job_id, limit, page * limit)
+            elapsed += time.perf_counter() - started
+        if not items:
+            raise RuntimeError(f"Page {page} is empty; lower --pages or raise --candidates")
+    return elapsed / pages
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    if args.database_url == SQLITE_URL:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    job_id = str(uuid.uuid4())
+    try:
+        async with session_factory() as db:
+            await create_data(db, job_id, args.candidates)
+
+        print(f"{args.candidates} candidates, {args.pages} pages of {args.limit}")
+        # Warm up both paths before timing
+        await time_pages(session_factory, list_with_orm, job_id, args.limit, 1)
+        await time_pages(session_factory, list_with_projection, job_id, args.limit, 1)
+
+        orm = await time_pages(session_factory, list_with_orm, job_id, args.limit, args.pages)
+        projection = await time_pages(
+            session_factory, list_with_projection, job_id, args.limit, args.pages
+        )
+        print(f"  ORM objects:       {orm * 1000:8.2f} ms/page")
+        print(f"  Column projection: {projection * 1000:8.2f} ms/page")
+        print(f"  Speedup:           {orm / projection:8.2f}x")
+    finally:
+        if args.database_url != SQLITE_URL:
+            async with session_factory() as db:
+                await db.execute(delete(Job).where(Job.job_id == job_id))
+                await db.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=2000, help="Candidates in the job")
+    parser.add_argument("--limit", type=int, default=100, help="Candidates per page")
+    parser.add_argument("--pages", type=int, default=10, help="Pages to read per path")
+    parser.add_argument("--database-url", default=SQLITE_URL, help="Defaults to in-memory SQLite")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
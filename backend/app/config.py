@@ -14,6 +14,11 @@ class Settings(BaseSettings):
 
     # Storage
     storage_path: str = "/storage"
+    max_upload_size: int = 50 * 1024 * 1024  # bytes
+    upload_chunk_size: int = 1024 * 1024  # bytes read per chunk while streaming uploads
+
+    # Worker
+    worker_wakeup_enabled: bool = True  # notify workers when jobs are enqueued
 
     # Application
     debug: bool = False
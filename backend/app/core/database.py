@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
+from app.core.wakeup import NOTIFY_WORKERS_KEY, notify_workers
 
 settings = get_settings()
 
@@ -32,6 +33,8 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            if session.info.pop(NOTIFY_WORKERS_KEY, False):
+                notify_workers()
         except Exception:
             await session.rollback()
             raise
@@ -22,6 +22,13 @@ class ConflictException(HTTPException):
         super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
 
+class PayloadTooLargeException(HTTPException):
+    """Raised when an uploaded file exceeds the size limit."""
+
+    def __init__(self, detail: str = "Payload too large"):
+        super().__init__(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+
 class ProcessingException(HTTPException):
     """Raised when processing fails."""
 
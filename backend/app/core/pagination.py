@@ -0,0 +1,30 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from app.core.exceptions import BadRequestException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    data = json.dumps(values, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list[Any]:
+    """Decode a cursor made by ``encode_cursor``.
+
+    Raises:
+        BadRequestException: If the cursor is malformed
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+    except (binascii.Error, ValueError):
+        raise BadRequestException("Invalid cursor") from None
+    if not isinstance(values, list) or len(values) != length:
+        raise BadRequestException("Invalid cursor")
+    return values
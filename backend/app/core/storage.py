@@ -1,13 +1,46 @@
+import asyncio
+import fcntl
+import hashlib
 import os
+import shutil
+import time
 import uuid
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import aiofiles
 
 from app.config import get_settings
+from app.core.exceptions import PayloadTooLargeException
 
 settings = get_settings()
 
+# A raw file reused by an upload this recently may belong to a document that
+# is not committed yet, so it is not deleted even if no document references it
+RAW_REUSE_GRACE_SECONDS = 300
+
+
+@dataclass
+class StoredFile:
+    """Result of streaming a file into storage."""
+
+    uri: str
+    sha256: str
+    size: int
+    created: bool
+
+
+@dataclass
+class UnreferencedFiles:
+    """Stored files that no document referenced when ``checked_at`` was taken."""
+
+    raw_uris: list[str]
+    # Content hashes whose cached text (text/ab/cd/<sha256>.*) is unreferenced
+    text_hashes: list[str]
+    checked_at: float = field(default_factory=time.time)
+
 
 class StorageService:
     """Local file storage service for documents and extracted content."""
@@ -22,20 +55,95 @@ class StorageService:
         for path in [self.raw_path, self.text_path, self.evidence_path]:
             path.mkdir(parents=True, exist_ok=True)
 
-    def _generate_filename(self, original_filename: str) -> str:
-        """Generate a unique filename while preserving extension."""
-        ext = Path(original_filename).suffix
-        return f"{uuid.uuid4()}{ext}"
-
-    async def save_raw_file(self, content: bytes, original_filename: str) -> str:
-        """Save an uploaded raw file and return its URI."""
-        filename = self._generate_filename(original_filename)
-        filepath = self.raw_path / filename
-
-        async with aiofiles.open(filepath, "wb") as f:
-            await f.write(content)
-
-        return f"raw/{filename}"
+    @contextmanager
+    def _raw_lock(self) -> Iterator[None]:
+        """Hold the lock that orders raw file reuse against deletion.
+
+        The lock is a file lock, so it also holds between API processes
+        sharing the storage directory. Waiting for it blocks, so it is only
+        taken in worker threads and nothing is awaited while holding it.
+        """
+        with open(self.base_path / ".raw.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def raw_uri(file_hash: str) -> str:
+        """Get the content-addressed URI of a raw file (``raw/ab/cd/<sha256>``)."""
+        return f"raw/{file_hash[:2]}/{file_hash[2:4]}/{file_hash}"
+
+    def reuse_marker_path(self, file_hash: str) -> Path:
+        """Get the file whose mtime records when a raw file was last reused."""
+        return self.base_path / "reuse" / file_hash[:2] / file_hash[2:4] / file_hash
+
+    async def save_raw_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        original_filename: str,
+        max_size: int | None = None,
+    ) -> StoredFile:
+        """Stream an upload into raw storage, hashing it on the way.
+
+        Chunks are written to a temporary file in the raw directory, which is
+        renamed to its content-addressed path once complete, so a partially
+        written file is never visible under its final name. If identical
+        content is already stored, the temporary file is discarded instead.
+
+        Args:
+            chunks: Async iterator of file content chunks
+            original_filename: Original filename (kept for the caller's records)
+            max_size: Maximum size in bytes; larger uploads are rejected
+
+        Returns:
+            URI, SHA-256 hex digest and size of the stored file, and whether
+            it was newly written
+        """
+        tmp_path = self.raw_path / f".{uuid.uuid4()}.tmp"
+
+        sha256 = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise PayloadTooLargeException(
+                            f"File exceeds the maximum upload size of {max_size} bytes"
+                        )
+                    sha256.update(chunk)
+                    await f.write(chunk)
+
+            file_hash = sha256.hexdigest()
+            created = await asyncio.to_thread(self._store_raw_file, tmp_path, file_hash)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return StoredFile(uri=self.raw_uri(file_hash), sha256=file_hash, size=size, created=created)
+
+    def _store_raw_file(self, tmp_path: Path, file_hash: str) -> bool:
+        """Move a complete upload to its content-addressed path.
+
+        Returns:
+            Whether the file was newly stored (False if the content was
+            already stored and ``tmp_path`` was discarded)
+        """
+        filepath = self.base_path / self.raw_uri(file_hash)
+        with self._raw_lock():
+            if not filepath.exists():
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, filepath)
+                return True
+
+            # Mark the file as reused so a pending deletion keeps it
+            marker = self.reuse_marker_path(file_hash)
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+            tmp_path.unlink()
+            return False
 
     async def save_text_file(self, content: str, candidate_id: str) -> str:
         """Save extracted text content and return its URI."""
@@ -86,6 +194,45 @@ class StorageService:
             return True
         return False
 
+    async def delete_unreferenced_files(self, files: UnreferencedFiles) -> None:
+        """Delete raw files and cached texts that no document references.
+
+        Run once the transaction that found them unreferenced has been
+        committed. A raw file reused by an upload since shortly before that
+        check is kept, together with its cached text, since the upload's
+        document may not have been visible to the check.
+        """
+        await asyncio.to_thread(self._delete_unreferenced, files)
+
+    def _delete_unreferenced(self, files: UnreferencedFiles) -> None:
+        cutoff = files.checked_at - RAW_REUSE_GRACE_SECONDS
+        with self._raw_lock():
+            for uri in files.raw_uris:
+                file_hash = Path(uri).name
+                if uri == self.raw_uri(file_hash) and self._reused_since(file_hash, cutoff):
+                    continue
+                (self.base_path / uri).unlink(missing_ok=True)
+
+            # Cached text is shared by every document with the same content
+            for file_hash in files.text_hashes:
+                if self._reused_since(file_hash, cutoff):
+                    continue
+                text_dir = self.text_path / file_hash[:2] / file_hash[2:4]
+                for path in text_dir.glob(f"{file_hash}.*"):
+                    path.unlink(missing_ok=True)
+                self.reuse_marker_path(file_hash).unlink(missing_ok=True)
+
+    def _reused_since(self, file_hash: str, cutoff: float) -> bool:
+        """Check whether an upload reused the raw file of a hash after ``cutoff``."""
+        try:
+            return self.reuse_marker_path(file_hash).stat().st_mtime >= cutoff
+        except FileNotFoundError:
+            return False
+
+    async def delete_job_texts(self, job_id: str) -> None:
+        """Delete the candidate text artifacts the worker wrote for a job."""
+        shutil.rmtree(self.text_path / "candidates" / job_id, ignore_errors=True)
+
     def get_full_path(self, uri: str) -> Path:
         """Get the full filesystem path for a URI."""
         return self.base_path / uri
@@ -0,0 +1,61 @@
+"""Notify workers that new queue jobs are ready.
+
+Workers listen on Unix datagram sockets in ``<storage_path>/.wakeup`` (the
+storage volume is shared with the worker). A notification only tells them
+to poll the queue now; if it is lost, they pick the job up on their next
+regular poll.
+"""
+
+import logging
+import socket
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Session.info key set when the transaction enqueued jobs
+NOTIFY_WORKERS_KEY = "notify_workers"
+
+
+def get_wakeup_dir() -> Path:
+    """Get the directory of the worker wakeup sockets."""
+    return Path(settings.storage_path) / ".wakeup"
+
+
+def request_worker_wakeup(db: AsyncSession) -> None:
+    """Notify workers once the current transaction has been committed."""
+    db.info[NOTIFY_WORKERS_KEY] = True
+
+
+def notify_workers() -> int:
+    """Send a wakeup to every listening worker.
+
+    Returns:
+        Number of workers notified
+    """
+    directory = get_wakeup_dir()
+    if not settings.worker_wakeup_enabled or not hasattr(socket, "AF_UNIX"):
+        return 0
+    if not directory.is_dir():
+        return 0
+
+    notified = 0
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.setblocking(False)
+        for path in directory.glob("*.sock"):
+            try:
+                sock.sendto(b"", str(path))
+                notified += 1
+            except BlockingIOError:
+                # Receive buffer is full, so a wakeup is already pending
+                notified += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Socket left behind by a worker that is gone
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not notify {path}: {e}")
+    return notified
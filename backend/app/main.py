@@ -9,6 +9,7 @@ from sqlalchemy import text
 from app.api.routes import api_router
 from app.config import get_settings
 from app.core.database import AsyncSessionLocal
+from app.core.pagination import NEXT_CURSOR_HEADER
 
 settings = get_settings()
 
@@ -64,6 +65,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include API routes
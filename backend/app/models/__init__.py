@@ -3,15 +3,20 @@ from app.models.candidate import Candidate, CandidateStatus
 from app.models.decision import Decision, DecisionType
 from app.models.document import Document, DocumentType
 from app.models.embedding import Embedding, EmbeddingKind
+from app.models.embedding_cache import EmbeddingCache
 from app.models.explanation import Explanation
 from app.models.extraction import Extraction
 from app.models.job import Job
+from app.models.job_extraction import JobExtraction
 from app.models.jobs_queue import JobsQueue, JobType, QueueStatus
+from app.models.rescore_run import RescoreRun, RescoreStatus
 from app.models.score import Score
 from app.models.score_config import ScoreConfig
+from app.models.stats_counter import StatsCounter
 
 __all__ = [
     "Job",
+    "JobExtraction",
     "Candidate",
     "CandidateStatus",
     "Document",
@@ -19,12 +24,16 @@ __all__ = [
     "Extraction",
     "Embedding",
     "EmbeddingKind",
+    "EmbeddingCache",
     "Score",
     "Explanation",
     "Decision",
     "DecisionType",
     "AuditEvent",
     "ScoreConfig",
+    "StatsCounter",
+    "RescoreRun",
+    "RescoreStatus",
     "JobsQueue",
     "JobType",
     "QueueStatus",
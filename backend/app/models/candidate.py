@@ -18,6 +18,9 @@ if TYPE_CHECKING:
     from app.models.score import Score
 
 
+UNSCORED_RANK = -1
+
+
 class CandidateStatus(str, Enum):
     NEW = "NEW"
     PROCESSING = "PROCESSING"
@@ -39,6 +42,13 @@ class Candidate(Base):
         String(20), default=CandidateStatus.NEW, nullable=False
     )
     error_message: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    # Copy of the newest decision, kept in step by DecisionService.create_decision
+    latest_decision: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    latest_decided_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # Copy of scores.total_fit_0_100 for index-ordered ranking; UNSCORED_RANK if no score
+    rank_fit: Mapped[int] = mapped_column(
+        Integer, default=UNSCORED_RANK, server_default=str(UNSCORED_RANK), nullable=False
+    )
     submitted_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
     )
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Integer, LargeBinary, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -27,7 +27,10 @@ class Embedding(Base):
     )
     kind: Mapped[EmbeddingKind] = mapped_column(String(50), nullable=False)
     ref_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    vector: Mapped[list[float] | None] = mapped_column(JSON, nullable=True)
+    vector: Mapped[list[float] | None] = mapped_column(JSON, nullable=True)  # legacy
+    vector_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    vector_dim: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    vector_dtype: Mapped[str | None] = mapped_column(String(10), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
     )
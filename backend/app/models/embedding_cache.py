@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Integer, LargeBinary, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class EmbeddingCache(Base):
+    """Content-addressed embedding vectors shared across candidates and jobs."""
+
+    __tablename__ = "embedding_cache"
+
+    embedding_model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    vector: Mapped[list[float] | None] = mapped_column(JSON, nullable=True)  # legacy
+    vector_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    vector_dim: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    vector_dtype: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
@@ -9,6 +9,7 @@ from app.core.database import Base
 
 if TYPE_CHECKING:
     from app.models.candidate import Candidate
+    from app.models.job_extraction import JobExtraction
 
 
 class JobStatus(str, Enum):
@@ -39,3 +40,6 @@ class Job(Base):
     candidates: Mapped[list["Candidate"]] = relationship(
         "Candidate", back_populates="job", cascade="all, delete-orphan"
     )
+    extractions: Mapped[list["JobExtraction"]] = relationship(
+        "JobExtraction", back_populates="job", cascade="all, delete-orphan"
+    )
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import JSON, DateTime, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+if TYPE_CHECKING:
+    from app.models.job import Job
+
+
+class JobExtraction(Base):
+    """LLM-extracted job requirements, cached per job text and model."""
+
+    __tablename__ = "job_extractions"
+
+    job_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("jobs.job_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    job_text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    llm_model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    requirements_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    evidence_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    extract_version: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    # Relationships
+    job: Mapped["Job"] = relationship("Job", back_populates="extractions")
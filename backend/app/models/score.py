@@ -26,6 +26,10 @@ class Score(Base):
     role_score: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
     total_fit_0_100: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     must_gaps_json: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    # len(must_gaps_json), for filtering without reading the JSON
+    must_gaps_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
     score_config_version: Mapped[int] = mapped_column(Integer, nullable=False)
     computed_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
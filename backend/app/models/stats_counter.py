@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class StatsCounter(Base):
+    """Running count of candidates in a dashboard bucket.
+
+    Counters are adjusted in the same transaction as the change they count,
+    so the dashboard reads them instead of aggregating the candidates table.
+    """
+
+    __tablename__ = "stats_counters"
+
+    # e.g. "jobs", "status:DONE", "decision:pass", "decision:undecided"
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
@@ -6,8 +6,10 @@ from app.repositories.explanation_repository import ExplanationRepository
 from app.repositories.extraction_repository import ExtractionRepository
 from app.repositories.job_repository import JobRepository
 from app.repositories.queue_repository import QueueRepository
+from app.repositories.rescore_run_repository import RescoreRunRepository
 from app.repositories.score_config_repository import ScoreConfigRepository
 from app.repositories.score_repository import ScoreRepository
+from app.repositories.stats_repository import StatsRepository
 
 __all__ = [
     "JobRepository",
@@ -20,4 +22,6 @@ __all__ = [
     "DecisionRepository",
     "AuditRepository",
     "ScoreConfigRepository",
+    "RescoreRunRepository",
+    "StatsRepository",
 ]
@@ -1,16 +1,25 @@
 import uuid
+from datetime import datetime
+from itertools import chain
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, case, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.candidate import Candidate, CandidateStatus
-from app.models.decision import Decision
+from app.models.decision import Decision, DecisionType
 from app.models.document import Document
 from app.models.explanation import Explanation
 from app.models.extraction import Extraction
 from app.models.score import Score
 from app.repositories.base import BaseRepository
+from app.repositories.stats_repository import UNDECIDED, StatsRepository
+from app.schemas.candidate import CandidateFilters
+
+
+def rank_key(candidate: Candidate | Row) -> tuple[int, datetime, str]:
+    """Get the position of a candidate (or list row) in the ranked order."""
+    return candidate.rank_fit, candidate.submitted_at, candidate.candidate_id
 
 
 class CandidateRepository(BaseRepository[Candidate]):
@@ -18,6 +27,7 @@ class CandidateRepository(BaseRepository[Candidate]):
 
     def __init__(self, db: AsyncSession):
         super().__init__(Candidate, db)
+        self.stats_repo = StatsRepository(db)
 
     async def get_by_id(self, candidate_id: str) -> Candidate | None:
         """Get a candidate by ID."""
@@ -25,6 +35,21 @@ class CandidateRepository(BaseRepository[Candidate]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_id_for_update(self, candidate_id: str) -> Candidate | None:
+        """Get a candidate by ID, locking its row until the transaction ends.
+
+        Values already loaded into the session are overwritten, so counter
+        deltas are computed from the locked row.
+        """
+        stmt = (
+            select(Candidate)
+            .where(Candidate.candidate_id == candidate_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_by_id_with_details(self, candidate_id: str) -> Candidate | None:
         """Get a candidate by ID with all related data."""
         stmt = (
@@ -41,51 +66,155 @@ class CandidateRepository(BaseRepository[Candidate]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_by_job_id(
-        self, job_id: str, limit: int = 100, offset: int = 0
-    ) -> list[Candidate]:
-        """Get all candidates for a job."""
-        stmt = (
-            select(Candidate)
-            .where(Candidate.job_id == job_id)
-            .options(
-                selectinload(Candidate.score),
-                selectinload(Candidate.explanation),
-                selectinload(Candidate.decisions),
+    def _filter_clauses(self, filters: CandidateFilters | None) -> dict[str, list]:
+        """Build the WHERE clauses of candidate list filters, keyed by facet.
+
+        Conditions on must gaps refer to Score, so queries using them must
+        join it.
+        """
+        if filters is None:
+            return {}
+        clauses: dict[str, list] = {}
+
+        if filters.status:
+            clauses["status"] = [Candidate.status.in_([s.value for s in filters.status])]
+
+        if filters.decision:
+            decided = [d for d in filters.decision if d != UNDECIDED]
+            conditions = []
+            if decided:
+                conditions.append(Candidate.latest_decision.in_(decided))
+            if UNDECIDED in filters.decision:
+                conditions.append(Candidate.latest_decision.is_(None))
+            clauses["decision"] = [or_(*conditions)]
+
+        score = []
+        if filters.min_score is not None:
+            score.append(Candidate.rank_fit >= filters.min_score)
+        if filters.max_score is not None:
+            # Unscored candidates have a negative rank_fit
+            score += [Candidate.rank_fit <= filters.max_score, Candidate.rank_fit >= 0]
+        if score:
+            clauses["score"] = score
+
+        if filters.has_must_gaps is not None:
+            clauses["must_gaps"] = [
+                Score.must_gaps_count > 0 if filters.has_must_gaps else Score.must_gaps_count == 0
+            ]
+        return clauses
+
+    def _list_rows_query(self, job_id: str, filters: CandidateFilters | None = None) -> Select:
+        """Select only the columns a candidate list item is built from.
+
+        Explanations are large; only their strengths and concerns are
+        extracted from the JSON, in the database.
+        """
+        clauses = self._filter_clauses(filters)
+        return (
+            select(
+                Candidate.candidate_id,
+                Candidate.display_name,
+                Candidate.status,
+                Candidate.submitted_at,
+                Candidate.latest_decision,
+                Candidate.rank_fit,
+                Score.total_fit_0_100,
+                Score.must_gaps_count,
+                Explanation.explanation_json["strengths"].label("strengths"),
+                Explanation.explanation_json["concerns"].label("concerns"),
             )
+            .outerjoin(Score, Score.candidate_id == Candidate.candidate_id)
+            .outerjoin(Explanation, Explanation.candidate_id == Candidate.candidate_id)
+            .where(Candidate.job_id == job_id, *chain(*clauses.values()))
+        )
+
+    async def get_list_rows_by_job_id(
+        self,
+        job_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        filters: CandidateFilters | None = None,
+    ) -> list[Row]:
+        """Get list rows for a job's candidates, newest first."""
+        stmt = (
+            self._list_rows_query(job_id, filters)
             .order_by(Candidate.submitted_at.desc())
             .limit(limit)
             .offset(offset)
         )
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
 
-    async def get_by_job_id_ranked(
-        self, job_id: str, limit: int = 100, offset: int = 0
-    ) -> list[Candidate]:
-        """Get candidates for a job ranked by total_fit score."""
-        from sqlalchemy import case
+    async def get_list_rows_by_job_id_ranked(
+        self,
+        job_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[int, datetime, str] | None = None,
+        filters: CandidateFilters | None = None,
+    ) -> list[Row]:
+        """Get list rows for a job's candidates ranked by total_fit score.
 
-        # MySQL doesn't support NULLS LAST, so we use CASE to sort NULLs at the end
+        Unscored candidates come last. The order follows the
+        ``(job_id, rank_fit, submitted_at, candidate_id)`` index, so paging
+        with ``after`` (the ``rank_key`` of the previous page's last row)
+        does not scan the skipped rows the way ``offset`` does.
+        """
         stmt = (
-            select(Candidate)
-            .where(Candidate.job_id == job_id)
-            .outerjoin(Score, Candidate.candidate_id == Score.candidate_id)
-            .options(
-                selectinload(Candidate.score),
-                selectinload(Candidate.explanation),
-                selectinload(Candidate.decisions),
-            )
+            self._list_rows_query(job_id, filters)
             .order_by(
-                case((Score.total_fit_0_100.is_(None), 1), else_=0),
-                Score.total_fit_0_100.desc(),
+                Candidate.rank_fit.desc(),
                 Candidate.submitted_at.desc(),
+                Candidate.candidate_id.desc(),
             )
             .limit(limit)
             .offset(offset)
         )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(Candidate.rank_fit, Candidate.submitted_at, Candidate.candidate_id)
+                < tuple_(*after)
+            )
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
+
+    async def get_facets(
+        self, job_id: str, filters: CandidateFilters | None = None
+    ) -> dict[str, dict[str, int]]:
+        """Count a job's candidates per status, latest decision and must-gap presence.
+
+        Each facet applies every filter except its own.
+        """
+        clauses = self._filter_clauses(filters)
+        must_gaps = case(
+            (Score.must_gaps_count > 0, "some"),
+            (Score.must_gaps_count == 0, "none"),
+        )
+        dimensions = {
+            "status": (Candidate.status, [s.value for s in CandidateStatus]),
+            "decision": (
+                func.coalesce(Candidate.latest_decision, UNDECIDED),
+                [d.value for d in DecisionType] + [UNDECIDED],
+            ),
+            "must_gaps": (must_gaps, ["none", "some"]),
+        }
+
+        facets = {}
+        for facet, (column, values) in dimensions.items():
+            others = [c for name, group in clauses.items() if name != facet for c in group]
+            stmt = (
+                select(column.label("value"), func.count())
+                .select_from(Candidate)
+                .outerjoin(Score, Score.candidate_id == Candidate.candidate_id)
+                .where(Candidate.job_id == job_id, *others)
+                .group_by("value")
+            )
+            counts = dict.fromkeys(values, 0)
+            for value, count in (await self.db.execute(stmt)).all():
+                if value is not None:
+                    counts[value] = count
+            facets[facet] = counts
+        return facets
 
     async def create_candidate(self, job_id: str, display_name: str | None = None) -> Candidate:
         """Create a new candidate."""
@@ -97,11 +226,31 @@ class CandidateRepository(BaseRepository[Candidate]):
         )
         return await self.create(candidate)
 
-    async def update_status(
-        self, candidate: Candidate, status: CandidateStatus, error_message: str | None = None
-    ) -> Candidate:
-        """Update candidate status."""
+    async def set_status(
+        self, candidate_id: str, status: CandidateStatus, error_message: str | None = None
+    ) -> Candidate | None:
+        """Update a candidate's status and the status counters.
+
+        Every candidate status change goes through here. The row is locked
+        first, so concurrent changes of one candidate move it between
+        counters one at a time.
+
+        Returns:
+            The updated candidate, or None if it does not exist
+        """
+        candidate = await self.get_by_id_for_update(candidate_id)
+        if not candidate:
+            return None
+
+        await self.stats_repo.record_status_change(candidate.status, status)
         update_data = {"status": status}
         if error_message is not None:
             update_data["error_message"] = error_message
         return await self.update(candidate, update_data)
+
+    async def set_latest_decision(self, candidate: Candidate, decision: Decision) -> Candidate:
+        """Record a decision as the candidate's latest."""
+        return await self.update(
+            candidate,
+            {"latest_decision": decision.decision, "latest_decided_at": decision.decided_at},
+        )
@@ -3,6 +3,7 @@ import uuid
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.candidate import Candidate
 from app.models.document import Document, DocumentType
 from app.repositories.base import BaseRepository
 
@@ -31,10 +32,74 @@ class DocumentRepository(BaseRepository[Document]):
 
     async def get_by_hash(self, file_hash: str) -> Document | None:
         """Get a document by file hash (for idempotency)."""
-        stmt = select(Document).where(Document.file_hash == file_hash)
+        stmt = select(Document).where(Document.file_hash == file_hash).limit(1)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_by_candidate_and_hash(
+        self, candidate_id: str, file_hash: str
+    ) -> Document | None:
+        """Get a candidate's document by file hash."""
+        stmt = (
+            select(Document)
+            .where(Document.candidate_id == candidate_id)
+            .where(Document.file_hash == file_hash)
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_object_uris_by_job(self, job_id: str) -> list[str]:
+        """Get the distinct raw file URIs of all documents of a job's candidates."""
+        stmt = (
+            select(Document.object_uri)
+            .join(Candidate, Candidate.candidate_id == Document.candidate_id)
+            .where(Candidate.job_id == job_id)
+            .distinct()
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_referenced_object_uris(self, object_uris: list[str]) -> set[str]:
+        """Get which of the given raw file URIs are still referenced by a document.
+
+        Raw files are shared by every document with the same content, so the
+        document rows act as the reference count of each stored file.
+        """
+        if not object_uris:
+            return set()
+        stmt = (
+            select(Document.object_uri)
+            .where(Document.object_uri.in_(object_uris))
+            .distinct()
+        )
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+
+    async def get_file_hashes_by_job(self, job_id: str) -> list[str]:
+        """Get the distinct content hashes of all documents of a job's candidates."""
+        stmt = (
+            select(Document.file_hash)
+            .join(Candidate, Candidate.candidate_id == Document.candidate_id)
+            .where(Candidate.job_id == job_id, Document.file_hash.isnot(None))
+            .distinct()
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_referenced_file_hashes(self, file_hashes: list[str]) -> set[str]:
+        """Get which of the given content hashes are still referenced by a document.
+
+        The worker caches extracted text by content hash, so the cache of a
+        hash is shared by every document with that hash, including documents
+        whose raw file is not stored by hash.
+        """
+        if not file_hashes:
+            return set()
+        stmt = select(Document.file_hash).where(Document.file_hash.in_(file_hashes)).distinct()
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+
     async def create_document(
         self,
         candidate_id: str,
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.wakeup import request_worker_wakeup
 from app.models.jobs_queue import JobsQueue, JobType, QueueStatus
 from app.repositories.base import BaseRepository
 
@@ -66,6 +67,7 @@ class QueueRepository(BaseRepository[JobsQueue]):
             status=QueueStatus.READY,
             attempts=0,
         )
+        request_worker_wakeup(self.db)
         return await self.create(job)
 
     async def mark_running(self, job: JobsQueue) -> JobsQueue:
@@ -93,8 +95,17 @@ class QueueRepository(BaseRepository[JobsQueue]):
         )
 
     async def retry_job(self, job: JobsQueue) -> JobsQueue:
-        """Reset a job to ready status for retry."""
-        return await self.update(job, {"status": QueueStatus.READY})
+        """Reset a job to ready status for an immediate retry."""
+        request_worker_wakeup(self.db)
+        return await self.update(
+            job,
+            {
+                "status": QueueStatus.READY,
+                "available_at": None,
+                "worker_id": None,
+                "leased_until": None,
+            },
+        )
 
     async def get_failed_jobs(self, limit: int = 100) -> list[JobsQueue]:
         """Get failed jobs."""
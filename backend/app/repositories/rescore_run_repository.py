@@ -0,0 +1,52 @@
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.candidate import Candidate
+from app.models.extraction import Extraction
+from app.models.rescore_run import RescoreRun, RescoreStatus
+from app.repositories.base import BaseRepository
+
+
+class RescoreRunRepository(BaseRepository[RescoreRun]):
+    """Repository for rescore run operations."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(RescoreRun, db)
+
+    async def get_by_id(self, run_id: str) -> RescoreRun | None:
+        """Get a rescore run by ID."""
+        stmt = select(RescoreRun).where(RescoreRun.run_id == run_id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_recent(self, limit: int = 20) -> list[RescoreRun]:
+        """Get the most recent rescore runs."""
+        stmt = select(RescoreRun).order_by(RescoreRun.created_at.desc()).limit(limit)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def count_scorable_candidates(self, job_id: str | None = None) -> int:
+        """Count candidates that have an extraction and can be rescored."""
+        stmt = select(func.count()).select_from(Extraction)
+        if job_id:
+            stmt = stmt.join(Candidate, Candidate.candidate_id == Extraction.candidate_id).where(
+                Candidate.job_id == job_id
+            )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+
+    async def create_run(
+        self, score_config_version: int, job_id: str | None, total: int
+    ) -> RescoreRun:
+        """Create a pending rescore run."""
+        run = RescoreRun(
+            run_id=str(uuid.uuid4()),
+            score_config_version=score_config_version,
+            job_id=job_id,
+            status=RescoreStatus.PENDING,
+            total=total,
+            processed=0,
+        )
+        return await self.create(run)
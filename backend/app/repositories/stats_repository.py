@@ -0,0 +1,101 @@
+from enum import Enum
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.candidate import Candidate, CandidateStatus
+from app.models.decision import DecisionType
+from app.models.job import Job
+from app.models.stats_counter import StatsCounter
+from app.repositories.base import BaseRepository
+
+JOBS_COUNTER = "jobs"
+UNDECIDED = "undecided"
+
+
+def status_counter(status: str | CandidateStatus) -> str:
+    """Get the counter name for candidates with a status."""
+    return f"status:{status.value if isinstance(status, Enum) else status}"
+
+
+def decision_counter(decision: str | DecisionType | None) -> str:
+    """Get the counter name for candidates whose latest decision is ``decision``."""
+    if decision is None:
+        return f"decision:{UNDECIDED}"
+    return f"decision:{decision.value if isinstance(decision, Enum) else decision}"
+
+
+def empty_counters() -> dict[str, int]:
+    """Get every counter name with a zero value."""
+    names = [JOBS_COUNTER]
+    names += [status_counter(status) for status in CandidateStatus]
+    names += [decision_counter(decision) for decision in DecisionType]
+    names.append(decision_counter(None))
+    return dict.fromkeys(names, 0)
+
+
+class StatsRepository(BaseRepository[StatsCounter]):
+    """Repository for the dashboard statistics counters."""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(StatsCounter, db)
+
+    async def get_counters(self) -> dict[str, int]:
+        """Get the current counter values (empty if they were never built)."""
+        result = await self.db.execute(select(StatsCounter.name, StatsCounter.value))
+        return {name: value for name, value in result.all()}
+
+    async def increment(self, deltas: dict[str, int]) -> None:
+        """Add ``deltas`` to the counters in the current transaction.
+
+        Counters are updated in name order so that concurrent transactions
+        lock the rows in the same order.
+        """
+        for name in sorted(deltas):
+            if deltas[name]:
+                await self.db.execute(
+                    update(StatsCounter)
+                    .where(StatsCounter.name == name)
+                    .values(value=StatsCounter.value + deltas[name])
+                )
+
+    async def record_status_change(
+        self, old: str | CandidateStatus, new: str | CandidateStatus
+    ) -> None:
+        """Move a candidate between status counters."""
+        if status_counter(old) != status_counter(new):
+            await self.increment({status_counter(old): -1, status_counter(new): 1})
+
+    async def compute_counters(self, job_id: str | None = None) -> dict[str, int]:
+        """Count jobs and candidates per status and latest decision from the tables.
+
+        Args:
+            job_id: Only count this job and its candidates
+        """
+        counters = empty_counters()
+
+        jobs_stmt = select(func.count(Job.job_id))
+        if job_id:
+            jobs_stmt = jobs_stmt.where(Job.job_id == job_id)
+        counters[JOBS_COUNTER] = (await self.db.execute(jobs_stmt)).scalar() or 0
+
+        # Every status and decision bucket in one grouped query
+        stmt = select(Candidate.status, Candidate.latest_decision, func.count()).group_by(
+            Candidate.status, Candidate.latest_decision
+        )
+        if job_id:
+            stmt = stmt.where(Candidate.job_id == job_id)
+
+        for status, decision, count in (await self.db.execute(stmt)).all():
+            counters[status_counter(status)] = counters.get(status_counter(status), 0) + count
+            name = decision_counter(decision)
+            counters[name] = counters.get(name, 0) + count
+        return counters
+
+    async def rebuild(self) -> dict[str, int]:
+        """Recompute every counter from the tables."""
+        counters = await self.compute_counters()
+        await self.db.execute(delete(StatsCounter))
+        self.db.add_all(StatsCounter(name=name, value=value) for name, value in counters.items())
+        await self.db.flush()
+        return counters
@@ -1,12 +1,16 @@
 from app.schemas.candidate import (
     CandidateCreate,
     CandidateDetail,
+    CandidateFacets,
+    CandidateFilters,
     CandidateListItem,
+    CandidateListResponse,
     CandidateUpdate,
 )
 from app.schemas.decision import DecisionCreate, DecisionResponse
 from app.schemas.document import DocumentCreate, DocumentResponse
 from app.schemas.job import JobCreate, JobDetail, JobListItem, JobUpdate
+from app.schemas.rescore import RescoreRunCreate, RescoreRunResponse
 from app.schemas.score_config import ScoreConfigCreate, ScoreConfigResponse
 
 __all__ = [
@@ -17,6 +21,9 @@ __all__ = [
     "CandidateCreate",
     "CandidateUpdate",
     "CandidateListItem",
+    "CandidateListResponse",
+    "CandidateFilters",
+    "CandidateFacets",
     "CandidateDetail",
     "DocumentCreate",
     "DocumentResponse",
@@ -24,4 +31,6 @@ __all__ = [
     "DecisionResponse",
     "ScoreConfigCreate",
     "ScoreConfigResponse",
+    "RescoreRunCreate",
+    "RescoreRunResponse",
 ]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -35,6 +35,36 @@ class CandidateListItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class CandidateFilters(BaseModel):
+    """Filters for a job's candidate list."""
+
+    status: list[CandidateStatus] | None = None
+    decision: list[Literal["pass", "hold", "reject", "undecided"]] | None = None
+    min_score: int | None = Field(None, ge=0, le=100)
+    max_score: int | None = Field(None, ge=0, le=100)
+    has_must_gaps: bool | None = None
+
+
+class CandidateFacets(BaseModel):
+    """Candidate counts per filter value.
+
+    Each facet counts the candidates matching every filter except its own,
+    so that selecting a status still shows how many the other statuses have.
+    """
+
+    status: dict[str, int]
+    decision: dict[str, int]
+    must_gaps: dict[str, int]
+
+
+class CandidateListResponse(BaseModel):
+    """Schema for a candidate list page with facet counts."""
+
+    items: list[CandidateListItem]
+    next_cursor: str | None = None
+    facets: CandidateFacets
+
+
 class ScoreDetail(BaseModel):
     """Score breakdown detail."""
 
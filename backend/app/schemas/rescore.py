@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from pydantic import BaseModel, computed_field
+
+from app.models.rescore_run import RescoreStatus
+
+
+class RescoreRunCreate(BaseModel):
+    """Schema for starting a rescore run."""
+
+    job_id: str | None = None  # None = every job
+
+
+class RescoreRunResponse(BaseModel):
+    """Schema for rescore run progress."""
+
+    run_id: str
+    score_config_version: int
+    job_id: str | None
+    status: RescoreStatus
+    total: int
+    processed: int
+    last_error: str | None
+    started_at: datetime | None
+    finished_at: datetime | None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def progress(self) -> float:
+        """Fraction of candidates processed (0-1)."""
+        if self.total <= 0:
+            return 1.0 if self.status == RescoreStatus.DONE else 0.0
+        return min(1.0, self.processed / self.total)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def candidates_per_second(self) -> float | None:
+        """Rescoring throughput since the run started."""
+        if not self.started_at:
+            return None
+        end = self.finished_at or datetime.utcnow()
+        elapsed = (end - self.started_at).total_seconds()
+        if elapsed <= 0:
+            return None
+        return round(self.processed / elapsed, 1)
@@ -21,6 +21,7 @@ class ScoreConfigCreate(BaseModel):
     must_cap_value: float = Field(20.0, ge=0, le=100)
     nice_top_n: int = Field(3, ge=1, le=10)
     role_distance: dict[str, dict[str, float]] | None = None
+    rescore: bool = True  # Recompute existing scores with the new version
 
 
 class ScoreConfigResponse(BaseModel):
@@ -33,5 +34,6 @@ class ScoreConfigResponse(BaseModel):
     nice_top_n: int
     role_distance_json: dict[str, dict[str, float]]
     created_at: datetime
+    rescore_run_id: str | None = None
 
     model_config = {"from_attributes": True}
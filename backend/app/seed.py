@@ -19,6 +19,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
+from app.repositories.stats_repository import StatsRepository
 
 
 # ==================================================
@@ -2283,8 +2284,16 @@ async def seed_data():
                 score = candidate_data["score"]
                 await session.execute(
                     text("""
-                        INSERT INTO scores (candidate_id, must_score, nice_score, year_score, role_score, total_fit_0_100, must_gaps_json, score_config_version, computed_at)
-                        VALUES (:candidate_id, :must_score, :nice_score, :year_score, :role_score, :total_fit_0_100, :must_gaps_json, :score_config_version, NOW())
+                        INSERT INTO scores (
+                            candidate_id, must_score, nice_score, year_score, role_score,
+                            total_fit_0_100, must_gaps_json, must_gaps_count,
+                            score_config_version, computed_at
+                        )
+                        VALUES (
+                            :candidate_id, :must_score, :nice_score, :year_score, :role_score,
+                            :total_fit_0_100, :must_gaps_json, :must_gaps_count,
+                            :score_config_version, NOW()
+                        )
                     """),
                     {
                         "candidate_id": candidate_id,
@@ -2294,9 +2303,17 @@ async def seed_data():
                         "role_score": score["role_score"],
                         "total_fit_0_100": score["total_fit_0_100"],
                         "must_gaps_json": json.dumps(score["must_gaps"], ensure_ascii=False),
+                        "must_gaps_count": len(score["must_gaps"]),
                         "score_config_version": score_config_version,
                     },
                 )
+                await session.execute(
+                    text("""
+                        UPDATE candidates SET rank_fit = :rank_fit
+                        WHERE candidate_id = :candidate_id
+                    """),
+                    {"candidate_id": candidate_id, "rank_fit": score["total_fit_0_100"]},
+                )
 
                 # 説明
                 explanation = candidate_data["explanation"]
@@ -2379,6 +2396,21 @@ async def seed_data():
                     "decided_at": decided_at,
                 },
             )
+            await session.execute(
+                text("""
+                    UPDATE candidates
+                    SET latest_decision = :decision, latest_decided_at = :decided_at
+                    WHERE candidate_id = :candidate_id
+                """),
+                {
+                    "candidate_id": decision_data["candidate_id"],
+                    "decision": decision_data["decision"],
+                    "decided_at": decided_at,
+                },
+            )
+
+        # ダッシュボード集計カウンターを再計算
+        await StatsRepository(session).rebuild()
 
         await session.commit()
 
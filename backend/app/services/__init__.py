@@ -4,6 +4,7 @@ from app.services.decision_service import DecisionService
 from app.services.document_service import DocumentService
 from app.services.job_service import JobService
 from app.services.queue_service import QueueService
+from app.services.rescore_service import RescoreService
 
 __all__ = [
     "JobService",
@@ -12,4 +13,5 @@ __all__ = [
     "QueueService",
     "DecisionService",
     "AuditService",
+    "RescoreService",
 ]
@@ -1,13 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import BadRequestException, NotFoundException
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.job import JobStatus
 from app.models.candidate import Candidate, CandidateStatus
-from app.repositories.candidate_repository import CandidateRepository
+from app.repositories.candidate_repository import CandidateRepository, rank_key
 from app.repositories.job_repository import JobRepository
+from app.repositories.stats_repository import StatsRepository, decision_counter, status_counter
 from app.schemas.candidate import (
     CandidateCreate,
     CandidateDetail,
+    CandidateFacets,
+    CandidateFilters,
     CandidateListItem,
     DecisionDetail,
     DocumentDetail,
@@ -24,6 +31,7 @@ class CandidateService:
         self.db = db
         self.candidate_repo = CandidateRepository(db)
         self.job_repo = JobRepository(db)
+        self.stats_repo = StatsRepository(db)
 
     async def create_candidate(self, job_id: str, data: CandidateCreate) -> CandidateDetail:
         """Create a new candidate for a job."""
@@ -40,6 +48,9 @@ class CandidateService:
             job_id=job_id,
             display_name=data.display_name,
         )
+        await self.stats_repo.increment(
+            {status_counter(candidate.status): 1, decision_counter(None): 1}
+        )
         return self._to_detail(candidate)
 
     async def get_candidate(self, candidate_id: str) -> CandidateDetail:
@@ -55,19 +66,57 @@ class CandidateService:
         limit: int = 100,
         offset: int = 0,
         sort_by_score: bool = True,
-    ) -> list[CandidateListItem]:
-        """List candidates for a job."""
+        cursor: str | None = None,
+        filters: CandidateFilters | None = None,
+    ) -> tuple[list[CandidateListItem], str | None]:
+        """List candidates for a job, optionally filtered.
+
+        Ranked lists can be paged with ``cursor`` instead of ``offset``; the
+        two cannot be combined.
+
+        Returns:
+            The candidates, and the cursor of the next page of a ranked list
+            (None on the last page)
+        """
         # Verify job exists
         job = await self.job_repo.get_by_id(job_id)
         if not job:
             raise NotFoundException(f"Job {job_id} not found")
 
-        if sort_by_score:
-            candidates = await self.candidate_repo.get_by_job_id_ranked(job_id, limit, offset)
-        else:
-            candidates = await self.candidate_repo.get_by_job_id(job_id, limit, offset)
+        if not sort_by_score:
+            if cursor:
+                raise BadRequestException("cursor requires sort_by_score")
+            rows = await self.candidate_repo.get_list_rows_by_job_id(
+                job_id, limit, offset, filters
+            )
+            return [self._to_list_item(row) for row in rows], None
+
+        after = None
+        if cursor:
+            if offset:
+                raise BadRequestException("cursor cannot be combined with offset")
+            rank_fit, submitted_at, candidate_id = decode_cursor(cursor, 3)
+            try:
+                after = (int(rank_fit), datetime.fromisoformat(submitted_at), str(candidate_id))
+            except (TypeError, ValueError):
+                raise BadRequestException("Invalid cursor") from None
+
+        # One extra row tells whether there is a next page
+        rows = await self.candidate_repo.get_list_rows_by_job_id_ranked(
+            job_id, limit + 1, offset, after, filters
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(list(rank_key(rows[-1])))
+
+        return [self._to_list_item(row) for row in rows], next_cursor
 
-        return [self._to_list_item(c) for c in candidates]
+    async def get_facets(
+        self, job_id: str, filters: CandidateFilters | None = None
+    ) -> CandidateFacets:
+        """Count a job's candidates per filter value."""
+        return CandidateFacets(**await self.candidate_repo.get_facets(job_id, filters))
 
     async def update_status(
         self,
@@ -76,46 +125,23 @@ class CandidateService:
         error_message: str | None = None,
     ) -> CandidateDetail:
         """Update candidate status."""
-        candidate = await self.candidate_repo.get_by_id(candidate_id)
+        candidate = await self.candidate_repo.set_status(candidate_id, status, error_message)
         if not candidate:
             raise NotFoundException(f"Candidate {candidate_id} not found")
+        return await self.get_candidate(candidate_id)
 
-        candidate = await self.candidate_repo.update_status(candidate, status, error_message)
-        return self._to_detail(candidate)
-
-    def _to_list_item(self, candidate: Candidate) -> CandidateListItem:
-        """Convert candidate to list item schema."""
-        # Get score info
-        total_fit = None
-        must_gaps_count = 0
-        if candidate.score:
-            total_fit = candidate.score.total_fit_0_100
-            must_gaps_count = len(candidate.score.must_gaps_json or [])
-
-        # Get explanation info
-        strengths = []
-        concerns = []
-        if candidate.explanation and candidate.explanation.explanation_json:
-            exp = candidate.explanation.explanation_json
-            strengths = exp.get("strengths", [])[:3]
-            concerns = exp.get("concerns", [])[:3]
-
-        # Get latest decision
-        decided_state = None
-        if candidate.decisions:
-            latest_decision = max(candidate.decisions, key=lambda d: d.decided_at)
-            decided_state = latest_decision.decision
-
+    def _to_list_item(self, row: Row) -> CandidateListItem:
+        """Convert a candidate list row to a list item schema."""
         return CandidateListItem(
-            candidate_id=candidate.candidate_id,
-            display_name=candidate.display_name,
-            status=candidate.status,
-            total_fit_0_100=total_fit,
-            must_gaps_count=must_gaps_count,
-            strengths_top3=strengths,
-            concerns_top3=concerns,
-            decided_state=decided_state,
-            submitted_at=candidate.submitted_at,
+            candidate_id=row.candidate_id,
+            display_name=row.display_name,
+            status=row.status,
+            total_fit_0_100=row.total_fit_0_100,
+            must_gaps_count=row.must_gaps_count or 0,
+            strengths_top3=(row.strengths or [])[:3],
+            concerns_top3=(row.concerns or [])[:3],
+            decided_state=row.latest_decision,
+            submitted_at=row.submitted_at,
         )
 
     def _to_detail(self, candidate: Candidate) -> CandidateDetail:
@@ -5,6 +5,7 @@ from app.models.decision import DecisionType
 from app.repositories.audit_repository import AuditRepository
 from app.repositories.candidate_repository import CandidateRepository
 from app.repositories.decision_repository import DecisionRepository
+from app.repositories.stats_repository import StatsRepository, decision_counter
 from app.schemas.decision import DecisionCreate, DecisionResponse
 
 
@@ -16,6 +17,7 @@ class DecisionService:
         self.decision_repo = DecisionRepository(db)
         self.candidate_repo = CandidateRepository(db)
         self.audit_repo = AuditRepository(db)
+        self.stats_repo = StatsRepository(db)
 
     async def create_decision(
         self,
@@ -23,18 +25,27 @@ class DecisionService:
         data: DecisionCreate,
     ) -> DecisionResponse:
         """Create a decision for a candidate."""
-        # Verify candidate exists
-        candidate = await self.candidate_repo.get_by_id(candidate_id)
+        # Verify candidate exists; the row stays locked so that concurrent
+        # decisions move it between decision counters one at a time
+        candidate = await self.candidate_repo.get_by_id_for_update(candidate_id)
         if not candidate:
             raise NotFoundException(f"Candidate {candidate_id} not found")
 
         # Create decision
+        previous = candidate.latest_decision
         decision = await self.decision_repo.create_decision(
             candidate_id=candidate_id,
             decision=data.decision,
             reason=data.reason,
             decided_by=data.decided_by,
         )
+        await self.candidate_repo.set_latest_decision(candidate, decision)
+
+        # Move the candidate to the bucket of its new latest decision
+        old_bucket = decision_counter(previous)
+        new_bucket = decision_counter(data.decision)
+        if old_bucket != new_bucket:
+            await self.stats_repo.increment({old_bucket: -1, new_bucket: 1})
 
         # Log audit event
         await self.audit_repo.log_event(
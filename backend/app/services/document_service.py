@@ -1,17 +1,21 @@
-import hashlib
+from collections.abc import AsyncIterator
+from pathlib import Path
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.core.exceptions import BadRequestException, NotFoundException
 from app.core.storage import StorageService, get_storage
 from app.models.candidate import CandidateStatus
-from app.models.document import DocumentType
+from app.models.document import Document, DocumentType
 from app.models.jobs_queue import JobType
 from app.repositories.candidate_repository import CandidateRepository
 from app.repositories.document_repository import DocumentRepository
 from app.repositories.queue_repository import QueueRepository
 from app.schemas.document import DocumentResponse
 
+settings = get_settings()
+
 
 class DocumentService:
     """Service for document operations."""
@@ -26,11 +30,17 @@ class DocumentService:
     async def upload_document(
         self,
         candidate_id: str,
-        file_content: bytes,
+        chunks: AsyncIterator[bytes],
         filename: str,
         doc_type: DocumentType,
     ) -> DocumentResponse:
-        """Upload a document for a candidate and queue processing."""
+        """Upload a document for a candidate and queue processing.
+
+        The file is streamed to storage in chunks and hashed on the way, so
+        the upload is never held in memory as a whole. Raw files are stored
+        by content hash, so the same file uploaded for several candidates
+        is kept on disk once.
+        """
         # Verify candidate exists
         candidate = await self.candidate_repo.get_by_id(candidate_id)
         if not candidate:
@@ -41,17 +51,19 @@ class DocumentService:
         if ext not in ["pdf", "docx", "doc"]:
             raise BadRequestException(f"Unsupported file type: {ext}")
 
-        # Calculate hash for idempotency
-        file_hash = hashlib.sha256(file_content).hexdigest()
+        # Stream file to storage, calculating the hash for idempotency
+        stored = await self.storage.save_raw_stream(
+            chunks, filename, max_size=settings.max_upload_size
+        )
+        file_hash = stored.sha256
+        object_uri = stored.uri
 
-        # Check if document with same hash already exists
-        existing = await self.document_repo.get_by_hash(file_hash)
-        if existing and existing.candidate_id == candidate_id:
+        # Check if the candidate already uploaded the same file; the stored
+        # file is shared by content hash, so there is nothing to clean up
+        existing = await self.document_repo.get_by_candidate_and_hash(candidate_id, file_hash)
+        if existing:
             return DocumentResponse.model_validate(existing)
 
-        # Save file to storage
-        object_uri = await self.storage.save_raw_file(file_content, filename)
-
         # Create document record
         document = await self.document_repo.create_document(
             candidate_id=candidate_id,
@@ -62,7 +74,7 @@ class DocumentService:
         )
 
         # Update candidate status
-        await self.candidate_repo.update_status(candidate, CandidateStatus.PROCESSING)
+        await self.candidate_repo.set_status(candidate_id, CandidateStatus.PROCESSING)
 
         # Queue text extraction job
         await self.queue_repo.create_job(candidate_id, JobType.TEXT_EXTRACT)
@@ -81,14 +93,19 @@ class DocumentService:
         documents = await self.document_repo.get_by_candidate_id(candidate_id)
         return [DocumentResponse.model_validate(d) for d in documents]
 
-    async def get_document_content(self, document_id: str) -> tuple[bytes, str]:
-        """Get document file content and filename."""
+    async def get_document_file(self, document_id: str) -> tuple[Document, Path]:
+        """Get a document and the path of its stored file.
+
+        The file itself is not read, so the caller can stream it.
+        """
         document = await self.document_repo.get_by_id(document_id)
         if not document:
             raise NotFoundException(f"Document {document_id} not found")
 
-        content = await self.storage.read_file(document.object_uri)
-        return content, document.original_filename
+        path = self.storage.get_full_path(document.object_uri)
+        if not path.is_file():
+            raise NotFoundException(f"File for document {document_id} not found")
+        return document, path
 
     async def get_extracted_text(self, document_id: str) -> str | None:
         """Get extracted text for a document."""
@@ -1,8 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundException
+from app.core.storage import UnreferencedFiles
 from app.models.job import Job
+from app.repositories.document_repository import DocumentRepository
 from app.repositories.job_repository import JobRepository
+from app.repositories.stats_repository import JOBS_COUNTER, StatsRepository
 from app.schemas.job import JobCreate, JobDetail, JobListItem, JobUpdate
 
 
@@ -12,6 +15,8 @@ class JobService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.job_repo = JobRepository(db)
+        self.document_repo = DocumentRepository(db)
+        self.stats_repo = StatsRepository(db)
 
     async def create_job(self, data: JobCreate) -> JobDetail:
         """Create a new job."""
@@ -20,6 +25,7 @@ class JobService:
             job_text_raw=data.job_text_raw,
             requirements_json=data.requirements_json,
         )
+        await self.stats_repo.increment({JOBS_COUNTER: 1})
         return JobDetail.model_validate(job)
 
     async def get_job(self, job_id: str) -> JobDetail:
@@ -65,9 +71,27 @@ class JobService:
 
         return JobDetail.model_validate(job)
 
-    async def delete_job(self, job_id: str) -> bool:
-        """Delete a job."""
+    async def delete_job(self, job_id: str) -> UnreferencedFiles:
+        """Delete a job.
+
+        Returns:
+            Raw files and cached texts no longer referenced by any document.
+            The caller deletes them once the transaction has been committed.
+        """
         job = await self.job_repo.get_by_id(job_id)
         if not job:
             raise NotFoundException(f"Job {job_id} not found")
-        return await self.job_repo.delete(job)
+
+        object_uris = await self.document_repo.get_object_uris_by_job(job_id)
+        file_hashes = await self.document_repo.get_file_hashes_by_job(job_id)
+        # The job's candidates are deleted with it
+        counters = await self.stats_repo.compute_counters(job_id)
+        await self.job_repo.delete(job)
+        await self.stats_repo.increment({name: -value for name, value in counters.items()})
+
+        referenced_uris = await self.document_repo.get_referenced_object_uris(object_uris)
+        referenced_hashes = await self.document_repo.get_referenced_file_hashes(file_hashes)
+        return UnreferencedFiles(
+            raw_uris=[uri for uri in object_uris if uri not in referenced_uris],
+            text_hashes=[h for h in file_hashes if h not in referenced_hashes],
+        )
@@ -0,0 +1,58 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.repositories.job_repository import JobRepository
+from app.repositories.rescore_run_repository import RescoreRunRepository
+from app.repositories.score_config_repository import ScoreConfigRepository
+from app.schemas.rescore import RescoreRunResponse
+
+
+class RescoreService:
+    """Service for bulk rescoring with a score config version.
+
+    Runs are only recorded here; the worker picks up pending runs and
+    recomputes scores from stored extractions and embeddings.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.run_repo = RescoreRunRepository(db)
+        self.config_repo = ScoreConfigRepository(db)
+        self.job_repo = JobRepository(db)
+
+    async def start_run(
+        self, score_config_version: int | None = None, job_id: str | None = None
+    ) -> RescoreRunResponse:
+        """Queue a rescore run for every candidate, or for one job.
+
+        Args:
+            score_config_version: Config version to apply (defaults to latest)
+            job_id: Restrict the run to one job
+
+        Returns:
+            The created run
+        """
+        if job_id and not await self.job_repo.get_by_id(job_id):
+            raise NotFoundException(f"Job {job_id} not found")
+
+        if score_config_version is None:
+            config = await self.config_repo.get_latest()
+            if not config:
+                raise BadRequestException("No score config has been published")
+            score_config_version = config.version
+
+        total = await self.run_repo.count_scorable_candidates(job_id)
+        run = await self.run_repo.create_run(score_config_version, job_id, total)
+        return RescoreRunResponse.model_validate(run)
+
+    async def get_run(self, run_id: str) -> RescoreRunResponse:
+        """Get a rescore run by ID."""
+        run = await self.run_repo.get_by_id(run_id)
+        if not run:
+            raise NotFoundException(f"Rescore run {run_id} not found")
+        return RescoreRunResponse.model_validate(run)
+
+    async def list_runs(self, limit: int = 20) -> list[RescoreRunResponse]:
+        """List recent rescore runs."""
+        runs = await self.run_repo.get_recent(limit)
+        return [RescoreRunResponse.model_validate(run) for run in runs]
@@ -0,0 +1,65 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_publish_score_config_queues_rescore_run(client: AsyncClient):
+    """Test that publishing a score config queues a rescore run."""
+    response = await client.post("/admin/score-config", json={"nice_top_n": 5})
+    assert response.status_code == 201
+    data = response.json()
+    assert data["nice_top_n"] == 5
+    run_id = data["rescore_run_id"]
+    assert run_id
+
+    response = await client.get(f"/admin/rescore-runs/{run_id}")
+    assert response.status_code == 200
+    run = response.json()
+    assert run["score_config_version"] == data["version"]
+    assert run["status"] == "PENDING"
+    assert run["job_id"] is None
+    assert run["total"] == 0
+    assert run["candidates_per_second"] is None
+
+
+@pytest.mark.asyncio
+async def test_publish_score_config_without_rescore(client: AsyncClient):
+    """Test publishing a score config with rescoring disabled."""
+    response = await client.post("/admin/score-config", json={"rescore": False})
+    assert response.status_code == 201
+    assert response.json()["rescore_run_id"] is None
+
+    response = await client.get("/admin/rescore-runs")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_start_rescore_run_for_job(client: AsyncClient):
+    """Test starting a rescore run for a single job."""
+    await client.post("/admin/score-config", json={"rescore": False})
+    job = await client.post(
+        "/jobs", json={"title": "Test Job", "job_text_raw": "Test description"}
+    )
+    job_id = job.json()["job_id"]
+
+    response = await client.post("/admin/rescore-runs", json={"job_id": job_id})
+    assert response.status_code == 201
+    run = response.json()
+    assert run["job_id"] == job_id
+    assert run["progress"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_start_rescore_run_errors(client: AsyncClient):
+    """Test rescore run validation errors."""
+    # No score config published yet
+    response = await client.post("/admin/rescore-runs", json={})
+    assert response.status_code == 400
+
+    await client.post("/admin/score-config", json={"rescore": False})
+    response = await client.post("/admin/rescore-runs", json={"job_id": "non-existent-id"})
+    assert response.status_code == 404
+
+    response = await client.get("/admin/rescore-runs/non-existent-id")
+    assert response.status_code == 404
@@ -0,0 +1,214 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Candidate, Explanation, Job, Score
+
+
+@pytest_asyncio.fixture
+async def ranked_candidates(db_session: AsyncSession) -> list[str]:
+    """Create a job with candidates of known rank, returning their IDs in ranked order."""
+    db_session.add(Job(job_id="job-1", title="Test Job", job_text_raw="Test"))
+    submitted_at = datetime(2024, 1, 1)
+    # Ties on score and submission time are broken by candidate ID
+    for candidate_id, rank_fit, minutes in [
+        ("c1", 90, 0),
+        ("c2", 75, 5),
+        ("c3", 75, 0),
+        ("c4", 75, 0),
+        ("c5", 40, 0),
+        ("c6", -1, 10),
+        ("c7", -1, 0),
+    ]:
+        db_session.add(
+            Candidate(
+                candidate_id=candidate_id,
+                job_id="job-1",
+                rank_fit=rank_fit,
+                submitted_at=submitted_at + timedelta(minutes=minutes),
+            )
+        )
+    await db_session.commit()
+    return ["c1", "c2", "c4", "c3", "c5", "c6", "c7"]
+
+
+@pytest.mark.asyncio
+async def test_list_candidates_with_cursor(client: AsyncClient, ranked_candidates: list[str]):
+    """Test that following X-Next-Cursor walks the whole ranking once."""
+    seen = []
+    params = {"limit": 3}
+    while True:
+        response = await client.get("/jobs/job-1/candidates", params=params)
+        assert response.status_code == 200
+        seen += [item["candidate_id"] for item in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params["cursor"] = cursor
+
+    assert seen == ranked_candidates
+
+
+@pytest.mark.asyncio
+async def test_list_candidates_with_offset(client: AsyncClient, ranked_candidates: list[str]):
+    """Test that offset pagination still works."""
+    response = await client.get("/jobs/job-1/candidates", params={"limit": 2, "offset": 5})
+    assert response.status_code == 200
+    assert [item["candidate_id"] for item in response.json()] == ranked_candidates[5:]
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_list_candidates_cursor_with_offset(
+    client: AsyncClient, ranked_candidates: list[str]
+):
+    """Test that a cursor cannot be combined with an offset."""
+    response = await client.get("/jobs/job-1/candidates", params={"limit": 3})
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get(
+        "/jobs/job-1/candidates", params={"limit": 3, "cursor": cursor, "offset": 3}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_candidates_invalid_cursor(client: AsyncClient, ranked_candidates: list[str]):
+    """Test that a malformed cursor is rejected."""
+    for cursor in ["not-a-cursor", "WzFd"]:
+        response = await client.get("/jobs/job-1/candidates", params={"cursor": cursor})
+        assert response.status_code == 400
+
+    response = await client.get(
+        "/jobs/job-1/candidates", params={"cursor": "WzFd", "sort_by_score": False}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_candidates_item_fields(client: AsyncClient, db_session: AsyncSession):
+    """Test that list items are built from the score, explanation and latest decision."""
+    db_session.add(Job(job_id="job-1", title="Test Job", job_text_raw="Test"))
+    db_session.add(
+        Candidate(candidate_id="c1", job_id="job-1", rank_fit=82, latest_decision="hold")
+    )
+    db_session.add(Candidate(candidate_id="c2", job_id="job-1"))
+    await db_session.flush()
+    db_session.add(
+        Score(
+            candidate_id="c1",
+            total_fit_0_100=82,
+            must_gaps_json=["Go", "Kubernetes"],
+            must_gaps_count=2,
+            score_config_version=1,
+        )
+    )
+    db_session.add(
+        Explanation(
+            candidate_id="c1",
+            explanation_json={
+                "summary": "A long summary",
+                "strengths": ["s1", "s2", "s3", "s4"],
+                "concerns": ["c1"],
+            },
+        )
+    )
+    await db_session.commit()
+
+    response = await client.get("/jobs/job-1/candidates")
+    assert response.status_code == 200
+    scored, unscored = response.json()
+    assert scored["total_fit_0_100"] == 82
+    assert scored["must_gaps_count"] == 2
+    assert scored["strengths_top3"] == ["s1", "s2", "s3"]
+    assert scored["concerns_top3"] == ["c1"]
+    assert scored["decided_state"] == "hold"
+    assert unscored["total_fit_0_100"] is None
+    assert unscored["strengths_top3"] == []
+    assert unscored["decided_state"] is None
+
+
+@pytest_asyncio.fixture
+async def filterable_candidates(db_session: AsyncSession) -> None:
+    """Create a job with candidates across statuses, decisions, scores and must gaps."""
+    db_session.add(Job(job_id="job-1", title="Test Job", job_text_raw="Test"))
+    rows = [
+        # candidate_id, status, latest_decision, score, must gaps
+        ("c1", "DONE", "pass", 90, 0),
+        ("c2", "DONE", "hold", 70, 2),
+        ("c3", "DONE", None, 55, 1),
+        ("c4", "ERROR", None, None, None),
+        ("c5", "PROCESSING", None, None, None),
+    ]
+    for candidate_id, status, decision, score, gaps in rows:
+        db_session.add(
+            Candidate(
+                candidate_id=candidate_id,
+                job_id="job-1",
+                status=status,
+                latest_decision=decision,
+                rank_fit=-1 if score is None else score,
+            )
+        )
+        if score is not None:
+            db_session.add(
+                Score(
+                    candidate_id=candidate_id,
+                    total_fit_0_100=score,
+                    must_gaps_json=["gap"] * gaps,
+                    must_gaps_count=gaps,
+                    score_config_version=1,
+                )
+            )
+    await db_session.commit()
+
+
+async def list_ids(client: AsyncClient, **params) -> list[str]:
+    """List the IDs of a job's ranked candidates matching the filters."""
+    response = await client.get("/jobs/job-1/candidates", params=params)
+    assert response.status_code == 200
+    return [item["candidate_id"] for item in response.json()]
+
+
+@pytest.mark.asyncio
+async def test_list_candidates_filters(client: AsyncClient, filterable_candidates: None):
+    """Test filtering by status, decision, score range and must gaps."""
+    # Unscored candidates submitted together are ordered by descending ID
+    assert await list_ids(client, status=["ERROR", "PROCESSING"]) == ["c5", "c4"]
+    assert await list_ids(client, decision=["pass", "undecided"]) == ["c1", "c3", "c5", "c4"]
+    assert await list_ids(client, min_score=60) == ["c1", "c2"]
+    assert await list_ids(client, max_score=70) == ["c2", "c3"]
+    assert await list_ids(client, has_must_gaps=True) == ["c2", "c3"]
+    assert await list_ids(client, has_must_gaps=False) == ["c1"]
+    assert await list_ids(client, status="DONE", decision="undecided") == ["c3"]
+    assert await list_ids(client, sort_by_score=False, min_score=60) in (
+        ["c1", "c2"],
+        ["c2", "c1"],
+    )
+
+    response = await client.get("/jobs/job-1/candidates", params={"decision": "maybe"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_candidates_facets(client: AsyncClient, filterable_candidates: None):
+    """Test that facets count every filter but their own."""
+    response = await client.get(
+        "/jobs/job-1/candidates",
+        params={"status": "DONE", "has_must_gaps": True, "include_facets": True},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["candidate_id"] for item in data["items"]] == ["c2", "c3"]
+    assert data["next_cursor"] is None
+    assert data["facets"] == {
+        # Candidates with must gaps, by status
+        "status": {"NEW": 0, "PROCESSING": 0, "DONE": 2, "ERROR": 0},
+        # DONE candidates with must gaps, by decision
+        "decision": {"pass": 0, "hold": 1, "reject": 0, "undecided": 1},
+        # DONE candidates, by must gaps
+        "must_gaps": {"none": 1, "some": 2},
+    }
@@ -0,0 +1,99 @@
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Candidate, Decision, Job
+from app.repositories.stats_repository import StatsRepository
+
+
+@pytest_asyncio.fixture
+async def candidates(db_session: AsyncSession) -> None:
+    """Create a job with candidates in several statuses and decisions."""
+    db_session.add(Job(job_id="job-1", title="Test Job", job_text_raw="Test"))
+    for candidate_id, status in [("c1", "DONE"), ("c2", "DONE"), ("c3", "NEW"), ("c4", "ERROR")]:
+        db_session.add(Candidate(candidate_id=candidate_id, job_id="job-1", status=status))
+    await db_session.flush()
+    for decision_id, candidate_id, decision, day in [
+        ("d1", "c1", "hold", 1),
+        ("d2", "c1", "pass", 2),
+        ("d3", "c2", "reject", 1),
+    ]:
+        decided_at = datetime(2024, 1, day)
+        db_session.add(
+            Decision(
+                decision_id=decision_id,
+                candidate_id=candidate_id,
+                decision=decision,
+                decided_at=decided_at,
+            )
+        )
+        candidate = await db_session.get(Candidate, candidate_id)
+        candidate.latest_decision = decision
+        candidate.latest_decided_at = decided_at
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_dashboard_stats_without_counters(client: AsyncClient, candidates: None):
+    """Test that stats are aggregated from the tables when no counters exist."""
+    response = await client.get("/dashboard/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_jobs"] == 1
+    assert data["total_candidates"] == 4
+    assert data["candidates_by_status"] == {"NEW": 1, "PROCESSING": 0, "DONE": 2, "ERROR": 1}
+    assert data["candidates_by_decision"] == {"pass": 1, "hold": 0, "reject": 1, "undecided": 2}
+    assert len(data["recent_candidates"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_dashboard_counters_follow_changes(
+    client: AsyncClient, db_session: AsyncSession, candidates: None
+):
+    """Test that the counters stay equal to a fresh aggregation."""
+    stats_repo = StatsRepository(db_session)
+    await stats_repo.rebuild()
+    await db_session.commit()
+
+    response = await client.post("/candidates/c3/decision", json={"decision": "pass"})
+    assert response.status_code == 201
+    response = await client.post("/candidates/c1/decision", json={"decision": "reject"})
+    assert response.status_code == 201
+    response = await client.post(
+        "/jobs", json={"title": "Another Job", "job_text_raw": "Another job description"}
+    )
+    assert response.status_code == 201
+
+    assert await stats_repo.get_counters() == await stats_repo.compute_counters()
+    data = (await client.get("/dashboard/stats")).json()
+    assert data["total_jobs"] == 2
+    assert data["candidates_by_decision"] == {"pass": 1, "hold": 0, "reject": 2, "undecided": 1}
+
+    response = await client.delete("/jobs/job-1")
+    assert response.status_code == 204
+    counters = await stats_repo.get_counters()
+    assert counters == await stats_repo.compute_counters()
+    assert counters["jobs"] == 1
+    assert sum(value for name, value in counters.items() if name != "jobs") == 0
+
+
+@pytest.mark.asyncio
+async def test_dashboard_counters_follow_status_updates(
+    client: AsyncClient, db_session: AsyncSession, candidates: None
+):
+    """Test that a status change through PATCH moves the status counters."""
+    stats_repo = StatsRepository(db_session)
+    await stats_repo.rebuild()
+    await db_session.commit()
+
+    response = await client.patch("/candidates/c3", json={"status": "DONE"})
+    assert response.status_code == 200
+    assert response.json()["status"] == "DONE"
+
+    counters = await stats_repo.get_counters()
+    assert counters == await stats_repo.compute_counters()
+    assert counters["status:NEW"] == 0
+    assert counters["status:DONE"] == 3
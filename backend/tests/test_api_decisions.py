@@ -0,0 +1,42 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Candidate, Job
+
+
+@pytest_asyncio.fixture
+async def candidate_id(db_session: AsyncSession) -> str:
+    """Create a job with one candidate."""
+    db_session.add(Job(job_id="job-1", title="Test Job", job_text_raw="Test"))
+    db_session.add(Candidate(candidate_id="candidate-1", job_id="job-1"))
+    await db_session.commit()
+    return "candidate-1"
+
+
+@pytest.mark.asyncio
+async def test_create_decision_sets_latest_decision(
+    client: AsyncClient, db_session: AsyncSession, candidate_id: str
+):
+    """Test that the newest decision is copied to the candidate."""
+    for decision in ["hold", "pass"]:
+        response = await client.post(
+            f"/candidates/{candidate_id}/decision", json={"decision": decision}
+        )
+        assert response.status_code == 201
+
+    candidate = await db_session.get(Candidate, candidate_id)
+    assert candidate.latest_decision == "pass"
+    assert candidate.latest_decided_at is not None
+
+    response = await client.get("/jobs/job-1/candidates")
+    assert response.status_code == 200
+    assert response.json()[0]["decided_state"] == "pass"
+
+
+@pytest.mark.asyncio
+async def test_create_decision_candidate_not_found(client: AsyncClient):
+    """Test deciding on a non-existent candidate."""
+    response = await client.post("/candidates/missing/decision", json={"decision": "pass"})
+    assert response.status_code == 404
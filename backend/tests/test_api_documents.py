@@ -0,0 +1,279 @@
+import hashlib
+import socket
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.core import database
+from app.core.storage import StorageService
+from app.core.wakeup import NOTIFY_WORKERS_KEY
+from app.models import Candidate, Document, Job
+
+settings = get_settings()
+
+PDF_CONTENT = b"%PDF-1.4\n" + b"0123456789" * 1000
+
+
+@pytest.fixture(autouse=True)
+def storage_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point file storage at a temporary directory."""
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+    monkeypatch.setattr(settings, "upload_chunk_size", 1024)
+    return tmp_path
+
+
+@pytest_asyncio.fixture
+async def candidate_id(db_session: AsyncSession) -> str:
+    """Create a job with one candidate."""
+    db_session.add(Job(job_id="job-1", title="Test Job", job_text_raw="Test"))
+    db_session.add(Candidate(candidate_id="candidate-1", job_id="job-1"))
+    await db_session.commit()
+    return "candidate-1"
+
+
+async def upload(client: AsyncClient, candidate_id: str, content: bytes, filename="cv.pdf"):
+    """Upload a document for a candidate."""
+    return await client.post(
+        f"/candidates/{candidate_id}/documents",
+        files={"file": (filename, content, "application/pdf")},
+        data={"type": "resume"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_upload_document_streams_to_storage(
+    client: AsyncClient, storage_dir: Path, candidate_id: str
+):
+    """Test that an upload is stored and hashed."""
+    response = await upload(client, candidate_id, PDF_CONTENT)
+    assert response.status_code == 201
+    data = response.json()
+    file_hash = hashlib.sha256(PDF_CONTENT).hexdigest()
+    assert data["file_hash"] == file_hash
+    assert data["object_uri"] == f"raw/{file_hash[:2]}/{file_hash[2:4]}/{file_hash}"
+    assert (storage_dir / data["object_uri"]).read_bytes() == PDF_CONTENT
+
+    # No temporary files are left behind
+    assert [p for p in (storage_dir / "raw").rglob("*") if p.is_file()] == [
+        storage_dir / data["object_uri"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_upload_same_file_twice_is_idempotent(
+    client: AsyncClient, storage_dir: Path, candidate_id: str
+):
+    """Test that re-uploading the same file returns the existing document."""
+    first = await upload(client, candidate_id, PDF_CONTENT)
+    second = await upload(client, candidate_id, PDF_CONTENT)
+
+    assert second.status_code == 201
+    assert second.json()["document_id"] == first.json()["document_id"]
+    assert len([p for p in (storage_dir / "raw").rglob("*") if p.is_file()]) == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_same_file_for_other_candidate_shares_storage(
+    client: AsyncClient, db_session: AsyncSession, storage_dir: Path, candidate_id: str
+):
+    """Test that identical files of different candidates are stored once."""
+    db_session.add(Candidate(candidate_id="candidate-2", job_id="job-1"))
+    await db_session.commit()
+
+    first = await upload(client, candidate_id, PDF_CONTENT)
+    second = await upload(client, "candidate-2", PDF_CONTENT)
+
+    assert second.json()["document_id"] != first.json()["document_id"]
+    assert second.json()["object_uri"] == first.json()["object_uri"]
+    assert len([p for p in (storage_dir / "raw").rglob("*") if p.is_file()]) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_job_removes_unreferenced_files(
+    client: AsyncClient, db_session: AsyncSession, storage_dir: Path, candidate_id: str
+):
+    """Test that deleting a job removes only raw files no other job references."""
+    db_session.add(Job(job_id="job-2", title="Other Job", job_text_raw="Test"))
+    db_session.add(Candidate(candidate_id="candidate-2", job_id="job-2"))
+    await db_session.commit()
+
+    shared = (await upload(client, candidate_id, PDF_CONTENT)).json()
+    await upload(client, "candidate-2", PDF_CONTENT)
+    own = (await upload(client, candidate_id, PDF_CONTENT + b"own")).json()
+    own_hash = own["file_hash"]
+    cached_text = storage_dir / "text" / own_hash[:2] / own_hash[2:4] / f"{own_hash}.v1.txt"
+    cached_text.parent.mkdir(parents=True)
+    cached_text.write_text("extracted")
+    candidate_text = storage_dir / "text" / "candidates" / "job-1" / f"{candidate_id}.json"
+    candidate_text.parent.mkdir(parents=True)
+    candidate_text.write_text("{}")
+
+    response = await client.delete("/jobs/job-1")
+    assert response.status_code == 204
+    assert (storage_dir / shared["object_uri"]).exists()
+    assert not (storage_dir / own["object_uri"]).exists()
+    assert not cached_text.exists()
+    assert not candidate_text.exists()
+
+
+@pytest.mark.asyncio
+async def test_delete_job_keeps_text_cached_for_other_documents(
+    client: AsyncClient, db_session: AsyncSession, storage_dir: Path, candidate_id: str
+):
+    """Test that cached text is kept while any document has the same content hash."""
+    own = (await upload(client, candidate_id, PDF_CONTENT)).json()
+    file_hash = own["file_hash"]
+    cached_text = storage_dir / "text" / file_hash[:2] / file_hash[2:4] / f"{file_hash}.v1.txt"
+    cached_text.parent.mkdir(parents=True)
+    cached_text.write_text("extracted")
+    # A document of another job stored before raw files were content-addressed
+    db_session.add(Job(job_id="job-2", title="Other Job", job_text_raw="Test"))
+    db_session.add(Candidate(candidate_id="candidate-2", job_id="job-2"))
+    db_session.add(
+        Document(
+            document_id="legacy-doc",
+            candidate_id="candidate-2",
+            type="resume",
+            original_filename="cv.pdf",
+            object_uri="raw/legacy_cv.pdf",
+            file_hash=file_hash,
+            text_uri=f"text/{file_hash[:2]}/{file_hash[2:4]}/{file_hash}.v1.txt",
+        )
+    )
+    await db_session.commit()
+
+    response = await client.delete("/jobs/job-1")
+    assert response.status_code == 204
+    assert not (storage_dir / own["object_uri"]).exists()
+    assert cached_text.exists()
+
+
+@pytest.mark.asyncio
+async def test_delete_job_keeps_files_reused_by_pending_upload(
+    client: AsyncClient, storage_dir: Path, candidate_id: str
+):
+    """Test that a raw file reused by an upload that is not committed yet is kept."""
+    own = (await upload(client, candidate_id, PDF_CONTENT)).json()
+
+    async def chunks():
+        yield PDF_CONTENT
+
+    # Another upload has stored the same content but not created its document yet
+    stored = await StorageService().save_raw_stream(chunks(), "cv.pdf")
+    assert (stored.uri, stored.created) == (own["object_uri"], False)
+
+    response = await client.delete("/jobs/job-1")
+    assert response.status_code == 204
+    assert (storage_dir / own["object_uri"]).exists()
+
+
+@pytest.mark.asyncio
+async def test_upload_too_large(
+    client: AsyncClient, storage_dir: Path, candidate_id: str, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that uploads over the size limit are rejected while streaming."""
+    monkeypatch.setattr(settings, "max_upload_size", 4096)
+
+    response = await upload(client, candidate_id, PDF_CONTENT)
+    assert response.status_code == 413
+    assert [p for p in (storage_dir / "raw").rglob("*") if p.is_file()] == []
+
+
+@pytest.mark.asyncio
+async def test_upload_unsupported_type(
+    client: AsyncClient, storage_dir: Path, candidate_id: str
+):
+    """Test that unsupported file types are rejected before storing."""
+    response = await upload(client, candidate_id, b"hello", filename="notes.txt")
+    assert response.status_code == 400
+    assert [p for p in (storage_dir / "raw").rglob("*") if p.is_file()] == []
+
+
+@pytest.mark.asyncio
+async def test_download_document(client: AsyncClient, candidate_id: str):
+    """Test that a download is streamed with cache validators."""
+    document = (await upload(client, candidate_id, PDF_CONTENT)).json()
+
+    response = await client.get(f"/documents/{document['document_id']}/download")
+    assert response.status_code == 200
+    assert response.content == PDF_CONTENT
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["etag"] == f'"{document["file_hash"]}"'
+    assert response.headers["accept-ranges"] == "bytes"
+    assert "last-modified" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_download_document_not_modified(client: AsyncClient, candidate_id: str):
+    """Test that a matching If-None-Match returns 304 without a body."""
+    document = (await upload(client, candidate_id, PDF_CONTENT)).json()
+
+    response = await client.get(
+        f"/documents/{document['document_id']}/download",
+        headers={"If-None-Match": f'"{document["file_hash"]}"'},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_download_document_range(client: AsyncClient, candidate_id: str):
+    """Test that Range requests return partial content."""
+    document = (await upload(client, candidate_id, PDF_CONTENT)).json()
+
+    response = await client.get(
+        f"/documents/{document['document_id']}/download",
+        headers={"Range": "bytes=100-199"},
+    )
+    assert response.status_code == 206
+    assert response.content == PDF_CONTENT[100:200]
+    assert response.headers["content-range"] == f"bytes 100-199/{len(PDF_CONTENT)}"
+
+
+@pytest.fixture
+def wakeup_listener(storage_dir: Path) -> Iterator[socket.socket]:
+    """Bind a worker wakeup socket in the storage directory."""
+    wakeup_dir = storage_dir / ".wakeup"
+    wakeup_dir.mkdir()
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    listener.bind(str(wakeup_dir / "worker.sock"))
+    listener.setblocking(False)
+    yield listener
+    listener.close()
+
+
+@pytest.mark.asyncio
+async def test_upload_requests_worker_wakeup(
+    client: AsyncClient, db_session: AsyncSession, candidate_id: str
+):
+    """Test that enqueueing text extraction asks for a wakeup after commit."""
+    await upload(client, candidate_id, PDF_CONTENT)
+    assert db_session.info.get(NOTIFY_WORKERS_KEY) is True
+
+
+@pytest.mark.asyncio
+async def test_get_db_wakes_workers_after_commit(
+    db_session: AsyncSession, wakeup_listener: socket.socket, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that get_db notifies workers only once the transaction committed."""
+    monkeypatch.setattr(database, "AsyncSessionLocal", lambda: db_session)
+
+    dependency = database.get_db()
+    session = await anext(dependency)
+    session.info[NOTIFY_WORKERS_KEY] = True
+    with pytest.raises(RuntimeError):
+        await dependency.athrow(RuntimeError("request failed"))
+    with pytest.raises(BlockingIOError):
+        wakeup_listener.recv(64)
+
+    dependency = database.get_db()
+    session = await anext(dependency)
+    session.info[NOTIFY_WORKERS_KEY] = True
+    with pytest.raises(StopAsyncIteration):
+        await anext(dependency)
+    assert wakeup_listener.recv(64) == b""
@@ -0,0 +1,22 @@
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from worker.database import Base
+
+
+@pytest_asyncio.fixture(scope="function")
+async def session_factory(tmp_path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Create a session factory on a fresh SQLite database for a test.
+
+    The database is a file so that sessions from the factory use separate
+    connections and see each other's commits, like worker processes do.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'worker.db'}", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
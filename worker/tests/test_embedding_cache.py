@@ -0,0 +1,53 @@
+from worker.embedding_cache import VectorLRU, chunk_texts, estimate_tokens, hash_text
+
+
+class TestVectorLRU:
+    def test_evicts_least_recently_used(self):
+        lru = VectorLRU(maxsize=2)
+        lru.put(("m", "a"), [1.0])
+        lru.put(("m", "b"), [2.0])
+        assert lru.get(("m", "a")) == [1.0]
+
+        lru.put(("m", "c"), [3.0])
+        assert len(lru) == 2
+        assert lru.get(("m", "b")) is None
+        assert lru.get(("m", "a")) == [1.0]
+        assert lru.get(("m", "c")) == [3.0]
+
+    def test_keys_include_model(self):
+        lru = VectorLRU(maxsize=4)
+        lru.put(("small", hash_text("Python")), [1.0])
+        assert lru.get(("large", hash_text("Python"))) is None
+
+    def test_zero_size_disables_cache(self):
+        lru = VectorLRU(maxsize=0)
+        lru.put(("m", "a"), [1.0])
+        assert lru.get(("m", "a")) is None
+
+
+class TestHashText:
+    def test_stable_sha256(self):
+        assert hash_text("AWS") == hash_text("AWS")
+        assert hash_text("AWS") != hash_text("GCP")
+        assert len(hash_text("AWS")) == 64
+
+
+class TestChunkTexts:
+    def test_single_batch_when_within_limits(self):
+        texts = ["summary", "AWS", "Docker", "Go"]
+        assert chunk_texts(texts, max_inputs=16, max_tokens=1000) == [texts]
+
+    def test_splits_on_input_count(self):
+        texts = [f"t{i}" for i in range(5)]
+        batches = chunk_texts(texts, max_inputs=2, max_tokens=1000)
+        assert batches == [["t0", "t1"], ["t2", "t3"], ["t4"]]
+
+    def test_splits_on_token_budget(self):
+        long_text = "x" * 300
+        budget = estimate_tokens(long_text) * 2
+        batches = chunk_texts([long_text] * 3, max_inputs=100, max_tokens=budget)
+        assert [len(batch) for batch in batches] == [2, 1]
+
+    def test_oversized_text_gets_own_batch(self):
+        batches = chunk_texts(["a", "x" * 3000, "b"], max_inputs=100, max_tokens=10)
+        assert batches == [["a"], ["x" * 3000], ["b"]]
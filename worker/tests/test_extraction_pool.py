@@ -0,0 +1,84 @@
+import asyncio
+import io
+import time
+
+import pytest
+from docx import Document
+from pypdf import PdfWriter
+
+from worker.extractors.pdf_extractor import PDFExtractor
+from worker.extractors.pool import ExtractionPool, ExtractionTimeoutError, page_ranges
+from worker.extractors.word_extractor import WordExtractor
+
+
+@pytest.fixture
+def pool():
+    pool = ExtractionPool(max_workers=2, timeout=10)
+    yield pool
+    pool.shutdown()
+
+
+class TestPageRanges:
+    def test_splits_into_chunks(self):
+        assert page_ranges(45, 20) == [(0, 20), (20, 40), (40, 45)]
+
+    def test_single_chunk(self):
+        assert page_ranges(3, 20) == [(0, 3)]
+
+    def test_no_pages(self):
+        assert page_ranges(0, 20) == []
+
+
+class TestExtractionPool:
+    @pytest.mark.asyncio
+    async def test_runs_calls_in_order(self, pool):
+        results = await pool.run_all([(abs, (-1,)), (abs, (-2,)), (abs, (-3,))])
+        assert results == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_pool_and_recovers(self, pool):
+        pool.timeout = 0.5
+        with pytest.raises(ExtractionTimeoutError):
+            await pool.run_all([(time.sleep, (30,))])
+
+        pool.timeout = 10
+        assert await pool.run_all([(abs, (-4,))]) == [4]
+
+    @pytest.mark.asyncio
+    async def test_timeout_only_fails_the_slow_document(self, pool):
+        # Start both processes so that start-up time is not charged to the documents
+        await pool.run_all([(time.sleep, (0.1,)), (time.sleep, (0.1,))])
+
+        pool.timeout = 1.5
+        slow = pool.run_all([(time.sleep, (30,))])
+        # Run one after another in the other process, longer in total than the timeout
+        normal = [pool.run_all([(time.sleep, (0.5,)), (abs, (-i,))]) for i in range(4)]
+        results = await asyncio.gather(slow, *normal, return_exceptions=True)
+
+        assert isinstance(results[0], ExtractionTimeoutError)
+        assert results[1:] == [[None, i] for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_word_extraction_runs_in_pool(self, pool):
+        document = Document()
+        document.add_paragraph("Python engineer")
+        table = document.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "AWS"
+        table.cell(0, 1).text = "5 years"
+        buffer = io.BytesIO()
+        document.save(buffer)
+
+        extracted = await WordExtractor(pool).extract(buffer.getvalue())
+        assert extracted.text == "Python engineer\n\nAWS | 5 years"
+
+    @pytest.mark.asyncio
+    async def test_pdf_extraction_runs_in_pool(self, pool):
+        writer = PdfWriter()
+        for _ in range(3):
+            writer.add_blank_page(width=200, height=200)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+
+        # Blank pages are parsed in the pool but have no text
+        with pytest.raises(ValueError, match="No text"):
+            await PDFExtractor(pool).extract(buffer.getvalue())
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from worker import leases, main
+from worker.leases import (
+    WORKER_ID,
+    extend_leases,
+    lease_expiry,
+    reap_expired_leases,
+    settings,
+)
+from worker.models import Candidate, Job, JobsQueue, StatsCounter
+
+
+@pytest_asyncio.fixture
+async def db(session_factory, monkeypatch):
+    """Point lease maintenance and job completion at the test database."""
+    monkeypatch.setattr(leases, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(main, "AsyncSessionLocal", session_factory)
+    async with session_factory() as session:
+        session.add(Job(job_id="job-1", title="Backend", job_text_raw="Python"))
+        session.add(Candidate(candidate_id="cand-1", job_id="job-1", status="PROCESSING"))
+        session.add(StatsCounter(name="status:PROCESSING", value=1))
+        session.add(StatsCounter(name="status:ERROR", value=0))
+        await session.commit()
+    return session_factory
+
+
+async def add_job(db, queue_id: str, **values) -> None:
+    async with db() as session:
+        session.add(
+            JobsQueue(
+                queue_id=queue_id,
+                candidate_id="cand-1",
+                job_type="EMBED",
+                status="RUNNING",
+                attempts=1,
+                worker_id=WORKER_ID,
+                **values,
+            )
+        )
+        await session.commit()
+
+
+async def get(db, model, key):
+    async with db() as session:
+        return await session.get(model, key)
+
+
+class TestLeases:
+    def test_lease_expiry(self):
+        now = datetime(2024, 1, 1)
+        assert lease_expiry(now) == now + timedelta(seconds=settings.job_lease_seconds)
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_extends_only_jobs_in_flight(self, db):
+        expiring = datetime.utcnow() + timedelta(seconds=5)
+        await add_job(db, "in-flight", leased_until=expiring)
+        await add_job(db, "orphaned", leased_until=expiring)
+        await add_job(db, "other-worker", leased_until=expiring)
+        async with db() as session:
+            (await session.get(JobsQueue, "other-worker")).worker_id = "other"
+            await session.commit()
+
+        assert await extend_leases({"in-flight", "other-worker"}) == 1
+        assert (await get(db, JobsQueue, "in-flight")).leased_until > expiring
+        assert (await get(db, JobsQueue, "orphaned")).leased_until == expiring
+        assert (await get(db, JobsQueue, "other-worker")).leased_until == expiring
+        assert await extend_leases(set()) == 0
+
+    @pytest.mark.asyncio
+    async def test_reaper_requeues_with_backoff(self, db):
+        expired = datetime.utcnow() - timedelta(seconds=1)
+        await add_job(db, "q1", leased_until=expired)
+        await add_job(db, "q2", leased_until=datetime.utcnow() + timedelta(minutes=5))
+
+        assert await reap_expired_leases() == 1
+
+        job = await get(db, JobsQueue, "q1")
+        assert job.status == "READY"
+        assert job.worker_id is None and job.leased_until is None
+        assert job.available_at > datetime.utcnow()
+        assert "expired" in job.last_error
+        assert (await get(db, JobsQueue, "q2")).status == "RUNNING"
+        assert (await get(db, Candidate, "cand-1")).status == "PROCESSING"
+
+    @pytest.mark.asyncio
+    async def test_reaper_fails_job_out_of_attempts(self, db):
+        await add_job(db, "q1", leased_until=datetime.utcnow() - timedelta(seconds=1))
+        async with db() as session:
+            (await session.get(JobsQueue, "q1")).attempts = settings.max_retries
+            await session.commit()
+
+        assert await reap_expired_leases() == 1
+
+        assert (await get(db, JobsQueue, "q1")).status == "FAILED"
+        assert (await get(db, Candidate, "cand-1")).status == "ERROR"
+        assert (await get(db, StatsCounter, "status:PROCESSING")).value == 0
+        assert (await get(db, StatsCounter, "status:ERROR")).value == 1
+
+    @pytest.mark.asyncio
+    async def test_completion_refused_after_lease_lost(self, db):
+        await add_job(db, "q1", leased_until=datetime.utcnow() + timedelta(minutes=5))
+        job = await get(db, JobsQueue, "q1")
+        async with db() as session:
+            # The reaper re-queued the job and another worker claimed it
+            (await session.get(JobsQueue, "q1")).worker_id = "other"
+            await session.commit()
+
+        assert await main.complete_job(job) is None
+
+        assert (await get(db, JobsQueue, "q1")).status == "RUNNING"
+        async with db() as session:
+            # No next stage was enqueued
+            assert await session.scalar(select(func.count()).select_from(JobsQueue)) == 1
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+
+from worker.config import get_settings
+from worker.models import Candidate, Extraction, Job, JobExtraction
+from worker.prompts.extraction_prompt import JobRequirementsPrompt
+from worker.tasks.llm_extraction import LLMExtractionTask, hash_job_text
+
+settings = get_settings()
+
+JOB_TEXT = "Backend engineer, Python required"
+JOB_RESULT = {
+    "job_requirements": {"must": [], "nice": [], "role_expectation": "Backend"},
+    "evidence": {"job": {}},
+}
+CANDIDATE_RESULT = {
+    "candidate_profile": {"skills": ["Python"]},
+    "evidence": {"candidate": {}},
+}
+
+
+class FakeStorage:
+    async def read_candidate_text(self, job_id: str, candidate_id: str):
+        return SimpleNamespace(text=f"Resume of {candidate_id} for {job_id}")
+
+
+class RacingOpenAIClient:
+    """Stores the job extraction from another session before returning it."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    async def extract_structured(self, system_prompt, user_prompt, response_format):
+        if system_prompt == JobRequirementsPrompt.SYSTEM_PROMPT:
+            async with self.session_factory() as other:
+                other.add(
+                    JobExtraction(
+                        job_id="job-1",
+                        job_text_hash=hash_job_text(JOB_TEXT),
+                        llm_model=settings.llm_model,
+                        requirements_json=JOB_RESULT["job_requirements"],
+                        evidence_json={},
+                    )
+                )
+                await other.commit()
+            return JOB_RESULT
+        return CANDIDATE_RESULT
+
+
+class TestLLMExtractionTask:
+    @pytest.mark.asyncio
+    async def test_job_extraction_lost_to_another_worker(self, session_factory):
+        async with session_factory() as db:
+            db.add(Job(job_id="job-1", title="Backend", job_text_raw=JOB_TEXT))
+            db.add(Candidate(candidate_id="cand-1", job_id="job-1"))
+            await db.commit()
+
+        async with session_factory() as db:
+            task = LLMExtractionTask(db, FakeStorage(), RacingOpenAIClient(session_factory))
+            result = await task.execute("cand-1")
+
+            assert result.job_requirements.role_expectation == "Backend"
+            assert result.candidate_profile.skills == ["Python"]
+            assert await db.get(Extraction, "cand-1") is not None
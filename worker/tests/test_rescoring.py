@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from worker import rescoring
+from worker.leases import WORKER_ID
+from worker.models import Candidate, Extraction, Job, RescoreRun, Score, ScoreConfig
+from worker.rescoring import claim_rescore_run, process_rescore_run
+from worker.score_config_cache import ScoreConfigCache
+from worker.scorers.scoring_profile import ScoringProfile
+from worker.tasks.score_calculation import ScoreCalculationTask
+
+JOB_REQUIREMENTS = {"must": [{"text": "Python", "skill": "python"}], "nice": []}
+PROFILE = {"skills": ["python"]}
+
+
+def make_config(version: int) -> ScoreConfig:
+    return ScoreConfig(
+        version=version,
+        weights_json={"must": 0.45, "nice": 0.20, "year": 0.20, "role": 0.15},
+        must_cap_enabled=True,
+        must_cap_value=20.0,
+        nice_top_n=3,
+        role_distance_json={},
+    )
+
+
+@pytest_asyncio.fixture
+async def db(session_factory, monkeypatch):
+    """Point the rescoring loop at a test database with two scorable candidates."""
+    monkeypatch.setattr(rescoring, "AsyncSessionLocal", session_factory)
+    rescoring.score_config_cache.invalidate()
+    async with session_factory() as session:
+        session.add_all([make_config(1), make_config(2)])
+        session.add(Job(job_id="job-1", title="Backend", job_text_raw="Python"))
+        for candidate_id in ("c1", "c2"):
+            session.add(Candidate(candidate_id=candidate_id, job_id="job-1"))
+            session.add(
+                Extraction(
+                    candidate_id=candidate_id,
+                    job_requirements_json=JOB_REQUIREMENTS,
+                    candidate_profile_json=PROFILE,
+                )
+            )
+        await session.commit()
+    return session_factory
+
+
+class StaleConfigCache(ScoreConfigCache):
+    """A cache that has not noticed config version 2 yet."""
+
+    async def get_latest(self, db) -> ScoringProfile:
+        return await self.get_version(db, 1)
+
+
+async def add_run(db, run_id: str, version: int = 1, **values) -> None:
+    async with db() as session:
+        values = {"status": "PENDING", "created_at": datetime(2024, 1, 1), **values}
+        session.add(RescoreRun(run_id=run_id, score_config_version=version, total=2, **values))
+        await session.commit()
+
+
+async def get(db, model, key):
+    async with db() as session:
+        return await session.get(model, key)
+
+
+class TestClaimRescoreRun:
+    @pytest.mark.asyncio
+    async def test_waits_for_a_live_run(self, db):
+        await add_run(
+            db,
+            "running",
+            status="RUNNING",
+            worker_id="other",
+            leased_until=datetime.utcnow() + timedelta(minutes=5),
+        )
+        await add_run(db, "pending", version=2)
+
+        assert await claim_rescore_run() is None
+        assert (await get(db, RescoreRun, "pending")).status == "PENDING"
+
+    @pytest.mark.asyncio
+    async def test_takes_over_an_expired_run(self, db):
+        await add_run(
+            db,
+            "stale",
+            status="RUNNING",
+            worker_id="crashed",
+            leased_until=datetime.utcnow() - timedelta(seconds=1),
+            processed=1,
+        )
+
+        run = await claim_rescore_run()
+
+        assert run.run_id == "stale"
+        stored = await get(db, RescoreRun, "stale")
+        assert stored.worker_id == WORKER_ID
+        assert stored.leased_until > datetime.utcnow()
+        assert stored.processed == 0
+
+
+class TestProcessRescoreRun:
+    @pytest.mark.asyncio
+    async def test_scores_candidates_and_completes(self, db):
+        await add_run(db, "run-1")
+        await claim_rescore_run()
+
+        await process_rescore_run("run-1")
+
+        run = await get(db, RescoreRun, "run-1")
+        assert (run.status, run.processed, run.worker_id) == ("DONE", 2, None)
+        for candidate_id in ("c1", "c2"):
+            score = await get(db, Score, candidate_id)
+            assert score.score_config_version == 1
+            assert (await get(db, Candidate, candidate_id)).rank_fit == score.total_fit_0_100
+
+    @pytest.mark.asyncio
+    async def test_keeps_scores_of_a_newer_version(self, db):
+        async with db() as session:
+            session.add(Score(candidate_id="c1", total_fit_0_100=77, score_config_version=2))
+            (await session.get(Candidate, "c1")).rank_fit = 77
+            await session.commit()
+        await add_run(db, "run-1")
+        await claim_rescore_run()
+
+        await process_rescore_run("run-1")
+
+        score = await get(db, Score, "c1")
+        assert (score.score_config_version, score.total_fit_0_100) == (2, 77)
+        assert (await get(db, Candidate, "c1")).rank_fit == 77
+        assert (await get(db, Score, "c2")).score_config_version == 1
+
+    @pytest.mark.asyncio
+    async def test_lost_run_is_left_to_its_new_owner(self, db):
+        await add_run(db, "run-1")
+        await claim_rescore_run()
+        async with db() as session:
+            # The lease expired and another worker took the run over
+            (await session.get(RescoreRun, "run-1")).worker_id = "other"
+            await session.commit()
+
+        await process_rescore_run("run-1")
+
+        run = await get(db, RescoreRun, "run-1")
+        assert (run.status, run.worker_id, run.processed) == ("RUNNING", "other", 0)
+        assert await get(db, Score, "c1") is None
+
+
+class TestScoreCalculationTask:
+    @pytest.mark.asyncio
+    async def test_keeps_scores_of_a_newer_version(self, db):
+        async with db() as session:
+            session.add(Score(candidate_id="c1", total_fit_0_100=77, score_config_version=2))
+            (await session.get(Candidate, "c1")).rank_fit = 77
+            await session.commit()
+
+        async with db() as session:
+            task = ScoreCalculationTask(session, config_cache=StaleConfigCache(ttl=30))
+            await task.execute("c1")
+
+        score = await get(db, Score, "c1")
+        assert (score.score_config_version, score.total_fit_0_100) == (2, 77)
+        assert (await get(db, Candidate, "c1")).rank_fit == 77
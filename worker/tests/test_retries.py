@@ -0,0 +1,53 @@
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+
+import httpx
+import openai
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from worker.extractors.pool import ExtractionTimeoutError
+from worker.retries import backoff_delay, is_transient_error, settings
+
+REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def status_error(cls, status_code: int) -> Exception:
+    response = httpx.Response(status_code, request=REQUEST)
+    return cls("error", response=response, body=None)
+
+
+class TestIsTransientError:
+    def test_openai_rate_limit_and_outages(self):
+        assert is_transient_error(status_error(openai.RateLimitError, 429))
+        assert is_transient_error(status_error(openai.InternalServerError, 503))
+        assert is_transient_error(openai.APITimeoutError(request=REQUEST))
+        assert is_transient_error(openai.APIConnectionError(request=REQUEST))
+
+    def test_timeouts_and_connection_errors(self):
+        assert is_transient_error(TimeoutError())
+        assert is_transient_error(ConnectionResetError())
+        assert is_transient_error(OperationalError("SELECT 1", {}, Exception("gone away")))
+
+    def test_dead_parsing_process(self):
+        assert is_transient_error(BrokenProcessPool("process died"))
+
+    def test_permanent_errors(self):
+        assert not is_transient_error(status_error(openai.BadRequestError, 400))
+        assert not is_transient_error(status_error(openai.AuthenticationError, 401))
+        assert not is_transient_error(IntegrityError("INSERT", {}, Exception("duplicate")))
+        assert not is_transient_error(ValueError("No documents found"))
+        assert not is_transient_error(ExtractionTimeoutError("too slow"))
+
+
+class TestBackoffDelay:
+    def test_doubles_per_attempt_with_jitter(self):
+        base = settings.retry_backoff_base
+        for attempts, full in ((1, base), (2, base * 2), (3, base * 4)):
+            delay = backoff_delay(attempts)
+            assert timedelta(seconds=full / 2) <= delay <= timedelta(seconds=full)
+
+    def test_is_capped(self):
+        assert backoff_delay(100) <= timedelta(seconds=settings.retry_backoff_max)
+
+    def test_is_jittered(self):
+        assert len({backoff_delay(3) for _ in range(20)}) > 1
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from worker.models import JobsQueue
+from worker.scheduler import JobScheduler
+
+
+def make_queue(job_types: list[str]) -> list[JobsQueue]:
+    return [
+        JobsQueue(queue_id=f"q{i}", candidate_id=f"c{i}", job_type=job_type, attempts=1)
+        for i, job_type in enumerate(job_types)
+    ]
+
+
+class TestJobScheduler:
+    @pytest.mark.asyncio
+    async def test_respects_per_type_limits(self):
+        queue = make_queue(["EMBED"] * 6 + ["SCORE"] * 2)
+        running = {"EMBED": 0, "SCORE": 0}
+        peak = {"EMBED": 0, "SCORE": 0}
+        processed = []
+
+        async def claim(job_type: str, limit: int) -> list[JobsQueue]:
+            jobs = [j for j in queue if j.job_type == job_type][:limit]
+            for job in jobs:
+                queue.remove(job)
+            return jobs
+
+        async def process(job: JobsQueue) -> None:
+            running[job.job_type] += 1
+            peak[job.job_type] = max(peak[job.job_type], running[job.job_type])
+            await asyncio.sleep(0.01)
+            running[job.job_type] -= 1
+            processed.append(job.queue_id)
+            if len(processed) == 8:
+                scheduler.stop()
+
+        scheduler = JobScheduler(
+            claim=claim,
+            process=process,
+            limits={"EMBED": 2, "SCORE": 4},
+            poll_interval=0.01,
+        )
+        await asyncio.wait_for(scheduler.run(), timeout=5)
+
+        assert len(processed) == 8
+        assert peak["EMBED"] == 2
+        assert peak["SCORE"] == 2
+
+    @pytest.mark.asyncio
+    async def test_drains_in_flight_jobs_on_stop(self):
+        queue = make_queue(["LLM_EXTRACT"] * 3)
+        finished = []
+
+        async def claim(job_type: str, limit: int) -> list[JobsQueue]:
+            jobs = queue[:limit]
+            del queue[:limit]
+            return jobs
+
+        async def process(job: JobsQueue) -> None:
+            await asyncio.sleep(0.05)
+            finished.append(job.queue_id)
+
+        scheduler = JobScheduler(
+            claim=claim,
+            process=process,
+            limits={"LLM_EXTRACT": 3},
+            poll_interval=0.01,
+            shutdown_timeout=5,
+        )
+        run = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.01)
+        assert scheduler.in_flight == 3
+        assert scheduler.in_flight_ids == {"q0", "q1", "q2"}
+
+        scheduler.stop()
+        await asyncio.wait_for(run, timeout=5)
+        assert sorted(finished) == ["q0", "q1", "q2"]
+        assert scheduler.in_flight_ids == set()
+
+    @pytest.mark.asyncio
+    async def test_continues_next_stage_in_process(self):
+        queue = make_queue(["TEXT_EXTRACT"] * 4)
+        claimed_types = []
+        processed = []
+        running = {"TEXT_EXTRACT": 0, "EMBED": 0}
+        peak = {"TEXT_EXTRACT": 0, "EMBED": 0}
+
+        async def claim(job_type: str, limit: int) -> list[JobsQueue]:
+            jobs = [j for j in queue if j.job_type == job_type][:limit]
+            for job in jobs:
+                queue.remove(job)
+                claimed_types.append(job_type)
+            return jobs
+
+        async def process(job: JobsQueue) -> JobsQueue | None:
+            running[job.job_type] += 1
+            peak[job.job_type] = max(peak[job.job_type], running[job.job_type])
+            await asyncio.sleep(0.01)
+            running[job.job_type] -= 1
+            processed.append((job.candidate_id, job.job_type))
+            if len(processed) == 8:
+                scheduler.stop()
+
+            if job.job_type != "TEXT_EXTRACT":
+                return None
+            next_job = JobsQueue(
+                queue_id=f"{job.queue_id}-next", candidate_id=job.candidate_id, job_type="EMBED"
+            )
+            if scheduler.reserve("EMBED"):
+                return next_job
+            queue.append(next_job)
+            return None
+
+        scheduler = JobScheduler(
+            claim=claim,
+            process=process,
+            limits={"TEXT_EXTRACT": 4, "EMBED": 1},
+            poll_interval=0.01,
+        )
+        await asyncio.wait_for(scheduler.run(), timeout=5)
+
+        assert sorted(processed) == sorted(
+            [(f"c{i}", job_type) for i in range(4) for job_type in ("TEXT_EXTRACT", "EMBED")]
+        )
+        # Continued jobs still count against the next stage's limit
+        assert peak["EMBED"] == 1
+        # At least one job skipped the queue, the rest were claimed from it
+        assert 0 < claimed_types.count("EMBED") < 4
+        assert scheduler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_reserve_refused_when_stopping(self):
+        scheduler = JobScheduler(
+            claim=None, process=None, limits={"EMBED": 2}, poll_interval=0.01  # type: ignore[arg-type]
+        )
+        assert scheduler.reserve("EMBED")
+        scheduler.stop()
+        assert not scheduler.reserve("EMBED")
+        assert scheduler.free_slots("EMBED") == 1
@@ -0,0 +1,102 @@
+import pytest
+
+from worker.models import ScoreConfig
+from worker.score_config_cache import ScoreConfigCache
+from worker.scorers.scoring_profile import ScoringProfile
+
+
+def make_config(version: int, nice_top_n: int = 3) -> ScoreConfig:
+    return ScoreConfig(
+        version=version,
+        weights_json={"must": 0.45, "nice": 0.20, "year": 0.20, "role": 0.15},
+        must_cap_enabled=True,
+        must_cap_value=20.0,
+        nice_top_n=nice_top_n,
+        role_distance_json={"IC": {"IC": 1.0, "Lead": 0.5}},
+    )
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class FakeSession:
+    """Serves score configs and counts queries."""
+
+    def __init__(self, configs: list[ScoreConfig]):
+        self.configs = {config.version: config for config in configs}
+        self.version_checks = 0
+        self.loads = 0
+
+    async def execute(self, stmt):
+        self.version_checks += 1
+        return FakeResult(max(self.configs) if self.configs else None)
+
+    async def get(self, model, version):
+        self.loads += 1
+        return self.configs.get(version)
+
+
+class TestScoringProfile:
+    def test_built_from_config(self):
+        config = make_config(7, nice_top_n=5)
+        profile = ScoringProfile.from_config(config)
+        assert profile.version == 7
+        assert profile.nice_scorer.top_n == 5
+        assert profile.calculator.must_cap_value == 20.0
+
+        # The profile does not share mutable state with the config row
+        config.role_distance_json["IC"]["Lead"] = 0.0
+        assert profile.role_scorer.role_distance["IC"]["Lead"] == 0.5
+
+    def test_is_frozen(self):
+        profile = ScoringProfile.from_config(make_config(1))
+        with pytest.raises(AttributeError):
+            profile.version = 2  # type: ignore[misc]
+
+
+class TestScoreConfigCache:
+    @pytest.mark.asyncio
+    async def test_reuses_profile_within_ttl(self):
+        db = FakeSession([make_config(1)])
+        cache = ScoreConfigCache(ttl=60)
+
+        first = await cache.get_latest(db)
+        second = await cache.get_latest(db)
+
+        assert first is second
+        assert db.version_checks == 1
+        assert db.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_picks_up_new_version_after_invalidate(self):
+        db = FakeSession([make_config(1)])
+        cache = ScoreConfigCache(ttl=60)
+        assert (await cache.get_latest(db)).version == 1
+
+        db.configs[2] = make_config(2)
+        assert (await cache.get_latest(db)).version == 1
+
+        cache.invalidate()
+        assert (await cache.get_latest(db)).version == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_does_not_reload(self):
+        db = FakeSession([make_config(1)])
+        cache = ScoreConfigCache(ttl=0)
+
+        await cache.get_latest(db)
+        await cache.get_latest(db)
+
+        assert db.version_checks == 2
+        assert db.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_no_config(self):
+        cache = ScoreConfigCache(ttl=60)
+        with pytest.raises(ValueError):
+            await cache.get_latest(FakeSession([]))
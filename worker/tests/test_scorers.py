@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 
+from worker.clients.embedding_client import EmbeddingClient
 from worker.scorers.must_scorer import MustScorer
 from worker.scorers.year_scorer import YearScorer
 from worker.scorers.role_scorer import RoleScorer
@@ -102,6 +104,49 @@ class TestRoleScorer:
         assert score == 1.0
 
 
+def reference_nice_score(candidate, nice_embeddings, top_n):
+    """Pairwise implementation the vectorized scorer must match."""
+    sims = sorted(
+        (EmbeddingClient.cosine_similarity(candidate, vector) for _, vector in nice_embeddings),
+        reverse=True,
+    )[:top_n]
+    return max(0.0, min(1.0, (sum(sims) / len(sims) + 1) / 2))
+
+
+class TestNiceScorer:
+    def test_matches_pairwise_reference(self):
+        rng = np.random.default_rng(0)
+        nice_embeddings = [(f"n{i}", rng.standard_normal(64)) for i in range(7)]
+        for top_n in (1, 3, 7, 10):
+            scorer = NiceScorer(top_n=top_n)
+            for _ in range(5):
+                candidate = rng.standard_normal(64)
+                assert scorer.calculate(candidate, nice_embeddings) == pytest.approx(
+                    reference_nice_score(candidate, nice_embeddings, top_n), abs=1e-5
+                )
+
+    def test_batch_matches_single(self):
+        rng = np.random.default_rng(1)
+        nice_embeddings = [(f"n{i}", rng.standard_normal(32)) for i in range(5)]
+        candidates = rng.standard_normal((20, 32))
+        scorer = NiceScorer(top_n=3)
+
+        batch = scorer.calculate_batch(candidates, NiceScorer.build_matrix(nice_embeddings))
+
+        assert batch.shape == (20,)
+        for candidate, score in zip(candidates, batch):
+            assert score == pytest.approx(scorer.calculate(candidate, nice_embeddings), abs=1e-6)
+
+    def test_identical_vectors_score_one(self):
+        scorer = NiceScorer(top_n=3)
+        assert scorer.calculate([1.0, 0.0], [("n1", [2.0, 0.0])]) == pytest.approx(1.0)
+
+    def test_no_embeddings(self):
+        scorer = NiceScorer()
+        assert scorer.calculate(None, [("n1", [1.0])]) == 0.0
+        assert scorer.calculate([1.0], []) == 0.0
+
+
 class TestTotalFitCalculator:
     def test_calculation(self):
         calculator = TotalFitCalculator()
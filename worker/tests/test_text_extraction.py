@@ -0,0 +1,174 @@
+from types import SimpleNamespace
+
+import pytest
+
+from worker import storage as storage_module
+from worker.extractors.extracted_text import ExtractedText, PageSpan
+from worker.storage import StorageService
+from worker.tasks import text_extraction
+from worker.tasks.text_extraction import TextExtractionTask
+from worker.text_artifact import CandidateText
+
+FILE_HASH = "ab" * 32
+
+
+class CountingExtractor:
+    def __init__(self, pages: list[tuple[int, str]]):
+        self.pages = pages
+        self.calls = 0
+
+    async def extract(self, content: bytes, max_chars: int | None = None) -> ExtractedText:
+        self.calls += 1
+        return ExtractedText.from_pages(self.pages, max_chars)
+
+
+def make_document(document_id: str, file_hash: str | None = FILE_HASH):
+    return SimpleNamespace(
+        document_id=document_id,
+        object_uri="raw/cv.pdf",
+        original_filename="cv.pdf",
+        file_hash=file_hash,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch) -> StorageService:
+    monkeypatch.setattr(storage_module.settings, "storage_path", str(tmp_path))
+    monkeypatch.setattr(text_extraction.settings, "extract_max_chars", 0)
+    service = StorageService()
+    (tmp_path / "raw" / "cv.pdf").write_bytes(b"%PDF-1.4\n")
+    return service
+
+
+@pytest.fixture
+def task(storage) -> TextExtractionTask:
+    task = TextExtractionTask(db=None, storage=storage)
+    task.pdf_extractor = CountingExtractor([(1, "Python 5 years"), (2, "AWS")])
+    return task
+
+
+class TestTextCache:
+    def test_cache_uri_is_content_addressed(self):
+        uri = StorageService.text_cache_uri(FILE_HASH, "v1")
+        assert uri == f"text/ab/ab/{FILE_HASH}.v1.txt"
+
+    @pytest.mark.asyncio
+    async def test_identical_files_are_extracted_once(self, task, storage):
+        first_uri, first_text, first_pages = await task._get_document_text(
+            make_document("d1"), "c1"
+        )
+        second_uri, second_text, second_pages = await task._get_document_text(
+            make_document("d2"), "c2"
+        )
+
+        assert first_uri == second_uri
+        assert first_uri == StorageService.text_cache_uri(FILE_HASH, "v1")
+        assert first_text == second_text
+        assert first_text == "--- Page 1 ---\nPython 5 years\n\n--- Page 2 ---\nAWS"
+        assert first_pages == second_pages
+        assert task.pdf_extractor.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_extractor_version_is_part_of_key(self, task, monkeypatch):
+        await task._get_document_text(make_document("d1"), "c1")
+        monkeypatch.setattr(text_extraction, "TEXT_EXTRACTOR_VERSION", "v-next")
+        await task._get_document_text(make_document("d2"), "c2")
+
+        assert task.pdf_extractor.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_char_budget_is_part_of_key(self, task, storage, monkeypatch):
+        full_uri, _, _ = await task._get_document_text(make_document("d1"), "c1")
+        monkeypatch.setattr(text_extraction.settings, "extract_max_chars", 20)
+        short_uri, short_text, _ = await task._get_document_text(make_document("d2"), "c2")
+
+        assert short_uri != full_uri
+        assert len(short_text) == 20
+        assert task.pdf_extractor.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_page_offsets_are_saved(self, task, storage):
+        uri, _, _ = await task._get_document_text(make_document("d1"), "c1")
+
+        pages = await storage.read_page_index(uri)
+        assert [page["page"] for page in pages] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_documents_without_hash_are_not_cached(self, task):
+        await task._get_document_text(make_document("d1", file_hash=None), "c1")
+        await task._get_document_text(make_document("d2", file_hash=None), "c1")
+
+        assert task.pdf_extractor.calls == 2
+
+
+class TestExtractedText:
+    def test_page_offsets(self):
+        extracted = ExtractedText.from_pages([(1, "Python"), (3, "AWS")])
+
+        assert extracted.text == "--- Page 1 ---\nPython\n\n--- Page 3 ---\nAWS"
+        assert extracted.pages == [PageSpan(1, 0, 21), PageSpan(3, 23, 41)]
+        assert extracted.page_of("AWS") == 3
+        assert extracted.page_of("Python") == 1
+        assert extracted.page_of("Kubernetes") is None
+        assert not extracted.truncated
+
+    def test_stops_consuming_pages_at_budget(self):
+        consumed = []
+
+        def pages():
+            for page_num in range(1, 101):
+                consumed.append(page_num)
+                yield page_num, "x" * 100
+
+        extracted = ExtractedText.from_pages(pages(), max_chars=250)
+
+        assert len(extracted.text) == 250
+        assert extracted.truncated
+        assert extracted.pages[-1].end == 250
+        assert consumed == [1, 2, 3]
+
+    def test_text_without_pages(self):
+        assert ExtractedText.from_text("abcdef", max_chars=3) == ExtractedText(
+            text="abc", truncated=True
+        )
+        assert ExtractedText.from_text("abc").pages == []
+
+
+class TestCandidateText:
+    def make_artifact(self) -> CandidateText:
+        return CandidateText.build(
+            [
+                ("d1", "resume", "--- Page 1 ---\nPython", [{"page": 1, "start": 0, "end": 21}]),
+                ("d2", "cv", "Led a team of 5", []),
+            ]
+        )
+
+    def test_matches_legacy_combined_text(self):
+        artifact = self.make_artifact()
+        assert artifact.text == (
+            "[RESUME]\n--- Page 1 ---\nPython\n\n---\n\n[CV]\nLed a team of 5"
+        )
+        for document in artifact.documents:
+            assert artifact.text[document.start : document.end].startswith(
+                f"[{document.type.upper()}]"
+            )
+
+    def test_locate_quote(self):
+        artifact = self.make_artifact()
+        assert artifact.locate("Python") == ("d1", 1)
+        assert artifact.locate("team of 5") == ("d2", None)
+        assert artifact.locate("Kubernetes") is None
+
+    def test_roundtrip(self):
+        artifact = self.make_artifact()
+        assert CandidateText.from_bytes(artifact.to_bytes()) == artifact
+
+    @pytest.mark.asyncio
+    async def test_storage_replaces_previous_artifact(self, storage):
+        uri = await storage.save_candidate_text("job-1", "c1", self.make_artifact())
+        assert uri == "text/candidates/job-1/c1.json"
+
+        updated = CandidateText.build([("d1", "resume", "Go", [])])
+        await storage.save_candidate_text("job-1", "c1", updated)
+        assert await storage.read_candidate_text("job-1", "c1") == updated
+        assert await storage.read_candidate_text("job-1", "c2") is None
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from worker.vector_codec import decode_vector, encode_vector, read_vector
+
+
+class TestVectorCodec:
+    def test_float32_round_trip(self):
+        vector = [0.1, -0.25, 3.5, 0.0]
+        blob, dim, dtype = encode_vector(vector)
+        assert (dim, dtype) == (4, "float32")
+        assert len(blob) == 16
+        decoded = decode_vector(blob, dim, dtype)
+        np.testing.assert_array_equal(decoded, np.asarray(vector, dtype=np.float32))
+
+    def test_float16_halves_size(self):
+        vector = np.linspace(-1, 1, 1536)
+        blob, dim, dtype = encode_vector(vector, "float16")
+        assert len(blob) == 1536 * 2
+        decoded = decode_vector(blob, dim, dtype)
+        np.testing.assert_allclose(decoded, vector, atol=1e-3)
+
+    def test_decode_is_zero_copy(self):
+        blob, dim, dtype = encode_vector([1.0, 2.0])
+        decoded = decode_vector(blob, dim, dtype)
+        assert not decoded.flags.owndata
+        assert not decoded.flags.writeable
+
+    def test_dimension_mismatch(self):
+        blob, _, dtype = encode_vector([1.0, 2.0])
+        with pytest.raises(ValueError):
+            decode_vector(blob, 3, dtype)
+
+    def test_unsupported_dtype(self):
+        with pytest.raises(ValueError):
+            encode_vector([1.0], "int8")
+
+
+class TestReadVector:
+    def test_prefers_blob(self):
+        blob, dim, dtype = encode_vector([1.0, 2.0])
+        vector = read_vector(blob, dim, dtype, legacy=[9.0, 9.0])
+        np.testing.assert_array_equal(vector, [1.0, 2.0])
+
+    def test_falls_back_to_legacy_json(self):
+        vector = read_vector(None, None, None, legacy=[1.0, 2.0])
+        np.testing.assert_array_equal(vector, [1.0, 2.0])
+
+    def test_nothing_stored(self):
+        assert read_vector(None, None, None) is None
@@ -0,0 +1,97 @@
+import asyncio
+import socket
+
+import pytest
+
+from worker.models import JobsQueue
+from worker.scheduler import JobScheduler
+from worker.wakeup import WakeupListener, notify_workers
+
+
+@pytest.fixture
+def wakeup_dir(tmp_path_factory):
+    # Unix socket paths are limited to ~100 characters
+    return tmp_path_factory.mktemp("wk")
+
+
+class TestWakeup:
+    @pytest.mark.asyncio
+    async def test_notify_sets_event(self, wakeup_dir):
+        listener = WakeupListener(wakeup_dir)
+        assert listener.start()
+        try:
+            assert notify_workers(wakeup_dir) == 1
+            await asyncio.wait_for(listener.event.wait(), timeout=1)
+        finally:
+            listener.close()
+        assert not listener.path.exists()
+
+    def test_removes_stale_sockets(self, wakeup_dir):
+        stale = wakeup_dir / "dead.sock"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(str(stale))
+        sock.close()
+
+        assert notify_workers(wakeup_dir) == 0
+        assert not stale.exists()
+
+    def test_missing_directory(self, tmp_path):
+        assert notify_workers(tmp_path / "missing") == 0
+
+
+class TestSchedulerWakeup:
+    @pytest.mark.asyncio
+    async def test_wakeup_interrupts_idle_wait(self):
+        queue: list[JobsQueue] = []
+        processed = []
+        wakeup = asyncio.Event()
+
+        async def claim(job_type: str, limit: int) -> list[JobsQueue]:
+            jobs = queue[:limit]
+            del queue[:limit]
+            return jobs
+
+        async def process(job: JobsQueue) -> None:
+            processed.append(job.queue_id)
+            scheduler.stop()
+
+        scheduler = JobScheduler(
+            claim=claim,
+            process=process,
+            limits={"EMBED": 1},
+            poll_interval=60,
+            wakeup=wakeup,
+        )
+        run = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)
+
+        queue.append(JobsQueue(queue_id="q0", candidate_id="c0", job_type="EMBED", attempts=1))
+        wakeup.set()
+        await asyncio.wait_for(run, timeout=1)
+        assert processed == ["q0"]
+
+    @pytest.mark.asyncio
+    async def test_backs_off_while_queue_is_empty(self):
+        claims = []
+
+        async def claim(job_type: str, limit: int) -> list[JobsQueue]:
+            claims.append(asyncio.get_running_loop().time())
+            return []
+
+        scheduler = JobScheduler(
+            claim=claim,
+            process=None,  # type: ignore[arg-type]
+            limits={"EMBED": 1},
+            poll_interval=0.4,
+            min_poll_interval=0.05,
+        )
+        run = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(1)
+        scheduler.stop()
+        await asyncio.wait_for(run, timeout=1)
+
+        gaps = [later - earlier for earlier, later in zip(claims, claims[1:])]
+        assert gaps[0] < 0.1
+        assert max(gaps) < 0.5
+        # 0.05 + 0.1 + 0.2 + 0.4 + 0.4 ... instead of a claim every 0.05s
+        assert len(claims) <= 7
@@ -0,0 +1,92 @@
+"""Convert legacy JSON embedding vectors to binary storage.
+
+Usage:
+    python -m worker.backfill_vectors [--batch-size N] [--dtype float32|float16]
+
+Rows that only have the JSON ``vector`` column are encoded into
+``vector_blob``/``vector_dim``/``vector_dtype`` and the JSON value is cleared.
+Safe to re-run; already converted rows are skipped.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from sqlalchemy import null, select
+
+from worker.config import get_settings
+from worker.database import AsyncSessionLocal
+from worker.models import Embedding, EmbeddingCache
+from worker.vector_codec import SUPPORTED_DTYPES, encode_vector
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+async def backfill_model(
+    model: type[Embedding] | type[EmbeddingCache], batch_size: int, dtype: str
+) -> int:
+    """Backfill one table in batches, committing after each batch.
+
+    Args:
+        model: Embedding or EmbeddingCache
+        batch_size: Rows converted per transaction
+        dtype: Storage dtype
+
+    Returns:
+        Number of rows converted
+    """
+    converted = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            stmt = (
+                select(model)
+                .where(model.vector_blob.is_(None), model.vector.isnot(None))
+                .limit(batch_size)
+            )
+            result = await db.execute(stmt)
+            rows = list(result.scalars().all())
+            if not rows:
+                break
+
+            for row in rows:
+                row.vector_blob, row.vector_dim, row.vector_dtype = encode_vector(row.vector, dtype)
+                # SQL NULL rather than a JSON 'null' literal
+                row.vector = null()
+
+            await db.commit()
+            converted += len(rows)
+            logger.info(f"{model.__tablename__}: converted {converted} row(s)")
+
+    return converted
+
+
+async def backfill(batch_size: int, dtype: str) -> None:
+    """Backfill every table that stores embedding vectors."""
+    for model in (EmbeddingCache, Embedding):
+        converted = await backfill_model(model, batch_size, dtype)
+        logger.info(f"{model.__tablename__}: done, {converted} row(s) converted")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--dtype",
+        choices=SUPPORTED_DTYPES,
+        default=settings.embedding_storage_dtype,
+    )
+    args = parser.parse_args()
+    asyncio.run(backfill(args.batch_size, args.dtype))
+
+
+if __name__ == "__main__":
+    main()
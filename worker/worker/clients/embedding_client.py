@@ -88,8 +88,8 @@ class EmbeddingClient:
         Returns:
             Cosine similarity (0 to 1)
         """
-        a = np.array(vec1)
-        b = np.array(vec2)
+        a = np.asarray(vec1, dtype=np.float64)
+        b = np.asarray(vec2, dtype=np.float64)
         return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
 
 
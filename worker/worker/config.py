@@ -16,13 +16,46 @@ class Settings(BaseSettings):
     storage_path: str = "/storage"
 
     # Worker settings
-    poll_interval: int = 5  # seconds
+    poll_interval: int = 5  # seconds, longest wait between polls of an empty queue
+    min_poll_interval: float = 0.5  # seconds, first wait after the queue runs empty
+    wakeup_enabled: bool = True  # listen for enqueue notifications on a Unix socket
     max_retries: int = 3
     batch_size: int = 10
+    shutdown_timeout: int = 60  # seconds to wait for in-flight jobs on SIGTERM
+    job_lease_seconds: int = 300  # a claimed job is re-queued if its lease is not renewed
+    heartbeat_interval: int = 60  # seconds between lease renewals and reaper runs
+    retry_backoff_base: float = 30  # seconds before the first retry, doubled per attempt
+    retry_backoff_max: float = 3600  # longest retry backoff in seconds
+    pipeline_fused: bool = True  # run a candidate's next stage right away when a slot is free
+
+    # Concurrency limits (jobs in flight per worker process, per job type)
+    text_extract_concurrency: int = 4
+    llm_extract_concurrency: int = 4
+    embed_concurrency: int = 16
+    score_concurrency: int = 32
+    explain_concurrency: int = 4
+
+    # Document parsing (process pool)
+    extract_pool_workers: int = 2  # parsing processes per worker
+    extract_timeout: int = 120  # seconds per document
+    extract_memory_limit_mb: int = 1024  # address space cap per parsing process, 0 = none
+    extract_pages_per_chunk: int = 20  # PDF pages parsed per pool call
+    extract_max_chars: int = 200000  # text kept per document for the LLM prompt, 0 = all
+    text_artifact_compression: str = ""  # "" or "zstd" (requires the zstandard extra)
+
+    # Scoring
+    score_config_ttl: int = 30  # seconds between checks for a new score config version
+
+    # Bulk rescoring
+    rescore_batch_size: int = 500  # candidates scored per transaction
 
     # LLM settings
     llm_model: str = "gpt-4o"
     embedding_model: str = "text-embedding-3-small"
+    embedding_cache_size: int = 4096  # vectors kept in the in-process LRU
+    embedding_batch_max_inputs: int = 2048  # API limit on inputs per request
+    embedding_batch_max_tokens: int = 250000  # approximate tokens per request
+    embedding_storage_dtype: str = "float32"  # "float32" or "float16" (half the size)
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,211 @@
+"""Content-addressed embedding cache shared across candidates and jobs."""
+
+import hashlib
+import logging
+from collections import OrderedDict
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from worker.clients.embedding_client import EmbeddingClient, get_embedding_client
+from worker.config import get_settings
+from worker.models import EmbeddingCache
+from worker.vector_codec import encode_vector, read_vector
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def hash_text(text: str) -> str:
+    """Return the SHA-256 hex digest used as the cache key for a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text.
+
+    Japanese text is close to one token per character while English is about
+    four characters per token, so counting UTF-8 bytes / 3 stays on the safe
+    side for both without pulling in a tokenizer.
+    """
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def chunk_texts(texts: list[str], max_inputs: int, max_tokens: int) -> list[list[str]]:
+    """Split texts into request-sized batches.
+
+    Args:
+        texts: Texts to embed
+        max_inputs: Maximum number of inputs per request
+        max_tokens: Maximum approximate tokens per request
+
+    Returns:
+        Batches in the original order; a single text over the token budget
+        gets a batch of its own
+    """
+    batches: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if current and (len(current) >= max_inputs or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+class VectorLRU:
+    """Bounded in-process LRU of embedding vectors keyed by (model, text hash)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: tuple[str, str]) -> np.ndarray | None:
+        vector = self._items.get(key)
+        if vector is not None:
+            self._items.move_to_end(key)
+        return vector
+
+    def put(self, key: tuple[str, str], vector: np.ndarray) -> None:
+        if self.maxsize <= 0:
+            return
+        self._items[key] = vector
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+
+# Shared by every task in the worker process
+_memory_cache = VectorLRU(settings.embedding_cache_size)
+
+
+class EmbeddingCacheService:
+    """Look up embeddings by text, creating and persisting them on a miss.
+
+    Lookups go through the in-process LRU first, then the embedding_cache
+    table; only texts missing from both are sent to the Embeddings API.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        embedding_client: EmbeddingClient | None = None,
+        model: str | None = None,
+        memory_cache: VectorLRU | None = None,
+    ):
+        self.db = db
+        self._embedding_client = embedding_client
+        self.model = model or settings.embedding_model
+        self.memory_cache = memory_cache if memory_cache is not None else _memory_cache
+
+    @property
+    def embedding_client(self) -> EmbeddingClient:
+        if self._embedding_client is None:
+            self._embedding_client = get_embedding_client()
+        return self._embedding_client
+
+    async def get_or_create(self, text: str) -> np.ndarray:
+        """Get the embedding for a single text."""
+        vectors = await self.get_or_create_many([text])
+        return vectors[text]
+
+    async def get_or_create_many(self, texts: list[str]) -> dict[str, np.ndarray]:
+        """Get embeddings for texts, creating the missing ones.
+
+        Missing texts are sent in as few batched API requests as the input
+        and token limits allow.
+
+        Args:
+            texts: Texts to embed (duplicates are embedded once)
+
+        Returns:
+            Mapping of text to embedding vector
+        """
+        vectors = await self.lookup_many(texts)
+        missing = [text for text in dict.fromkeys(texts) if text not in vectors]
+        if not missing:
+            return vectors
+
+        logger.info(f"Embedding cache miss for {len(missing)} of {len(set(texts))} text(s)")
+        batches = chunk_texts(
+            missing,
+            max_inputs=settings.embedding_batch_max_inputs,
+            max_tokens=settings.embedding_batch_max_tokens,
+        )
+        for batch in batches:
+            batch_vectors = await self.embedding_client.create_embeddings_batch(
+                batch, model=self.model
+            )
+            for text, values in zip(batch, batch_vectors):
+                vector = np.asarray(values, dtype=np.float32)
+                await self._store(hash_text(text), vector)
+                vectors[text] = vector
+
+        return vectors
+
+    async def lookup_many(self, texts: list[str]) -> dict[str, np.ndarray]:
+        """Get cached embeddings for texts without calling the API.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Mapping of text to embedding vector for the texts found
+        """
+        vectors: dict[str, np.ndarray] = {}
+        pending: dict[str, list[str]] = {}
+
+        for text in dict.fromkeys(texts):
+            text_hash = hash_text(text)
+            vector = self.memory_cache.get((self.model, text_hash))
+            if vector is not None:
+                vectors[text] = vector
+            else:
+                pending.setdefault(text_hash, []).append(text)
+
+        if pending:
+            stmt = select(EmbeddingCache).where(
+                EmbeddingCache.embedding_model == self.model,
+                EmbeddingCache.text_hash.in_(list(pending)),
+            )
+            result = await self.db.execute(stmt)
+            for row in result.scalars().all():
+                vector = read_vector(row.vector_blob, row.vector_dim, row.vector_dtype, row.vector)
+                if vector is None:
+                    continue
+                self.memory_cache.put((self.model, row.text_hash), vector)
+                for text in pending[row.text_hash]:
+                    vectors[text] = vector
+
+        return vectors
+
+    async def _store(self, text_hash: str, vector: np.ndarray) -> None:
+        """Persist a new vector, tolerating a concurrent insert of the same key."""
+        self.memory_cache.put((self.model, text_hash), vector)
+        blob, dim, dtype = encode_vector(vector, settings.embedding_storage_dtype)
+        try:
+            async with self.db.begin_nested():
+                self.db.add(
+                    EmbeddingCache(
+                        embedding_model=self.model,
+                        text_hash=text_hash,
+                        vector_blob=blob,
+                        vector_dim=dim,
+                        vector_dtype=dtype,
+                    )
+                )
+        except IntegrityError:
+            # Another candidate of the same job stored it first
+            logger.debug(f"Embedding {text_hash[:12]} already cached")
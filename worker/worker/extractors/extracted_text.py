@@ -0,0 +1,87 @@
+"""Extracted document text with page offsets."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+PAGE_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class PageSpan:
+    """Character range of one page within the extracted text."""
+
+    page: int
+    start: int
+    end: int
+
+
+@dataclass
+class ExtractedText:
+    """Text of a document, truncated to a character budget.
+
+    Attributes:
+        text: Extracted text
+        pages: Character range of each page in ``text`` (empty for formats
+            without pages)
+        truncated: True if the document had more text than the budget
+    """
+
+    text: str
+    pages: list[PageSpan] = field(default_factory=list)
+    truncated: bool = False
+
+    def page_at(self, offset: int) -> int | None:
+        """Get the page number containing a character offset."""
+        for span in self.pages:
+            if span.start <= offset < span.end:
+                return span.page
+        return None
+
+    def page_of(self, quote: str) -> int | None:
+        """Get the page number of the first occurrence of a quote, e.g. an evidence quote."""
+        offset = self.text.find(quote)
+        return self.page_at(offset) if offset >= 0 else None
+
+    @classmethod
+    def from_pages(
+        cls, pages: Iterable[tuple[int, str]], max_chars: int | None = None
+    ) -> "ExtractedText":
+        """Join page texts, stopping once ``max_chars`` is reached.
+
+        ``pages`` is consumed lazily, so pages past the budget are never
+        requested from a generator.
+
+        Args:
+            pages: (page number, page text) pairs in page order
+            max_chars: Character budget, or None for no limit
+        """
+        parts: list[str] = []
+        spans: list[PageSpan] = []
+        length = 0
+        truncated = False
+
+        for page_num, page_text in pages:
+            if max_chars is not None and length >= max_chars:
+                truncated = True
+                break
+
+            start = length + (len(PAGE_SEPARATOR) if parts else 0)
+            part = f"--- Page {page_num} ---\n{page_text}"
+            if max_chars is not None and start + len(part) > max_chars:
+                part = part[: max(max_chars - start, 0)]
+                truncated = True
+
+            parts.append(part)
+            length = start + len(part)
+            spans.append(PageSpan(page=page_num, start=start, end=length))
+            if truncated:
+                break
+
+        return cls(text=PAGE_SEPARATOR.join(parts), pages=spans, truncated=truncated)
+
+    @classmethod
+    def from_text(cls, text: str, max_chars: int | None = None) -> "ExtractedText":
+        """Wrap text without pages, truncating it to ``max_chars``."""
+        if max_chars is not None and len(text) > max_chars:
+            return cls(text=text[:max_chars], truncated=True)
+        return cls(text=text)
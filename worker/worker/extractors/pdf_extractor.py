@@ -1,44 +1,74 @@
-import io
 import logging
 
-from pypdf import PdfReader
+from worker.config import get_settings
+from worker.extractors.extracted_text import ExtractedText
+from worker.extractors.pool import (
+    ExtractionBudget,
+    ExtractionPool,
+    count_pdf_pages,
+    extract_pdf_pages,
+    get_extraction_pool,
+    page_ranges,
+)
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
 class PDFExtractor:
     """Extract text from PDF files."""
 
-    async def extract(self, content: bytes) -> str:
+    def __init__(self, pool: ExtractionPool | None = None):
+        self.pool = pool or get_extraction_pool()
+
+    async def extract(self, content: bytes, max_chars: int | None = None) -> ExtractedText:
         """Extract text from PDF content.
 
+        Parsing runs in the extraction process pool. Pages are extracted in
+        ranges, one range per pool process at a time, and extraction stops
+        as soon as ``max_chars`` is reached, so the rest of a long document
+        is never parsed.
+
         Args:
             content: PDF file content as bytes
+            max_chars: Character budget, or None to extract every page
 
         Returns:
-            Extracted text
+            Extracted text with page offsets
 
         Raises:
             Exception: If extraction fails
         """
         try:
-            pdf_file = io.BytesIO(content)
-            reader = PdfReader(pdf_file)
-
-            text_parts = []
-            for page_num, page in enumerate(reader.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(f"--- Page {page_num} ---\n{page_text}")
-                except Exception as e:
-                    logger.warning(f"Failed to extract page {page_num}: {e}")
-                    continue
-
-            if not text_parts:
+            # One budget for the whole document, charged while its calls run
+            budget = ExtractionBudget(self.pool.timeout)
+            [page_count] = await self.pool.run_all([(count_pdf_pages, (content,))], budget)
+            ranges = page_ranges(page_count, settings.extract_pages_per_chunk)
+
+            pages: list[tuple[int, str]] = []
+            length = 0
+            for wave_start in range(0, len(ranges), self.pool.max_workers):
+                if max_chars is not None and length >= max_chars:
+                    break
+                wave = ranges[wave_start : wave_start + self.pool.max_workers]
+                calls = [
+                    (extract_pdf_pages, (content, start, stop, max_chars)) for start, stop in wave
+                ]
+                chunks = await self.pool.run_all(calls, budget)
+                for chunk in chunks:
+                    pages.extend(chunk)
+                    length += sum(len(page_text) for _, page_text in chunk)
+
+            if not pages:
                 raise ValueError("No text could be extracted from PDF")
 
-            return "\n\n".join(text_parts)
+            extracted = ExtractedText.from_pages(pages, max_chars)
+            if extracted.truncated:
+                logger.info(
+                    f"PDF text truncated to {max_chars} characters "
+                    f"(page {extracted.pages[-1].page} of {page_count})"
+                )
+            return extracted
 
         except Exception as e:
             logger.error(f"PDF extraction failed: {e}")
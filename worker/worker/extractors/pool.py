@@ -0,0 +1,303 @@
+"""Process pool for CPU-bound document parsing.
+
+pypdf and python-docx are pure Python and hold the GIL, so parsing on the
+event loop (or in a thread) stalls every other coroutine in the worker.
+Parsing functions here run in a separate process pool; they are plain
+module-level functions so they can be pickled to the child processes.
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+from docx import Document
+from pypdf import PdfReader
+
+from worker.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class ExtractionTimeoutError(Exception):
+    """Raised when parsing a document takes longer than the configured timeout."""
+
+
+def _limit_memory(max_bytes: int) -> None:
+    """Cap the address space of a pool process (Unix only)."""
+    if max_bytes <= 0:
+        return
+    try:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, max_bytes))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not set extraction memory limit: {e}")
+
+
+def count_pdf_pages(content: bytes) -> int:
+    """Count the pages of a PDF."""
+    return len(PdfReader(io.BytesIO(content)).pages)
+
+
+def iter_pdf_pages(content: bytes, start: int, stop: int) -> Iterator[tuple[int, str]]:
+    """Lazily yield the text of pages ``start`` to ``stop`` (0-based, exclusive) of a PDF.
+
+    Pages are only parsed when the next item is requested.
+
+    Yields:
+        (1-based page number, text) for pages with text
+    """
+    reader = PdfReader(io.BytesIO(content))
+    for index in range(start, min(stop, len(reader.pages))):
+        try:
+            page_text = reader.pages[index].extract_text()
+        except Exception as e:
+            logger.warning(f"Failed to extract page {index + 1}: {e}")
+            continue
+        if page_text:
+            yield index + 1, page_text
+
+
+def extract_pdf_pages(
+    content: bytes, start: int, stop: int, max_chars: int | None = None
+) -> list[tuple[int, str]]:
+    """Extract the text of a range of PDF pages, stopping after ``max_chars``.
+
+    Returns:
+        List of (1-based page number, text) for pages with text
+    """
+    pages = []
+    length = 0
+    for page_num, page_text in iter_pdf_pages(content, start, stop):
+        pages.append((page_num, page_text))
+        length += len(page_text)
+        if max_chars is not None and length >= max_chars:
+            break
+    return pages
+
+
+def extract_docx_parts(content: bytes) -> list[str]:
+    """Extract paragraph and table texts from a Word document."""
+    document = Document(io.BytesIO(content))
+
+    text_parts = []
+
+    # Extract paragraphs
+    for para in document.paragraphs:
+        if para.text.strip():
+            text_parts.append(para.text)
+
+    # Extract tables
+    for table in document.tables:
+        table_text = []
+        for row in table.rows:
+            row_text = [cell.text.strip() for cell in row.cells]
+            table_text.append(" | ".join(row_text))
+        if table_text:
+            text_parts.append("\n".join(table_text))
+
+    return text_parts
+
+
+def page_ranges(page_count: int, pages_per_chunk: int) -> list[tuple[int, int]]:
+    """Split ``page_count`` pages into (start, stop) ranges of at most ``pages_per_chunk``."""
+    step = max(pages_per_chunk, 1)
+    return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+
+class ExtractionBudget:
+    """Time a document may spend being parsed in pool processes.
+
+    The clock only runs while at least one of the document's calls is
+    running in a process, so time spent queued behind other documents'
+    calls is not counted.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._spent = 0.0
+        self._running = 0
+        self._started = 0.0
+
+    def remaining(self) -> float:
+        """Seconds left in the budget."""
+        spent = self._spent
+        if self._running:
+            spent += time.monotonic() - self._started
+        return self.timeout - spent
+
+    def start(self) -> None:
+        """Note that a call of the document started running."""
+        if self._running == 0:
+            self._started = time.monotonic()
+        self._running += 1
+
+    def stop(self) -> None:
+        """Note that a call of the document stopped running."""
+        self._running -= 1
+        if self._running == 0:
+            self._spent += time.monotonic() - self._started
+
+
+class ExtractionPool:
+    """Run parsing functions in a process pool with a timeout.
+
+    Each pool process is a single-process executor of its own, and a call
+    holds one process from submission to result. A call that exceeds its
+    document's budget, or whose process dies (for example on hitting the
+    memory limit), kills and replaces only that process; calls running in
+    the other processes are not affected.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout: float,
+        memory_limit_mb: int = 0,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._executors: list[ProcessPoolExecutor | None] = [None] * max_workers
+        self._idle: asyncio.Queue[int] | None = None
+
+    def _get_executor(self, slot: int) -> ProcessPoolExecutor:
+        executor = self._executors[slot]
+        if executor is None:
+            executor = self._executors[slot] = ProcessPoolExecutor(
+                max_workers=1,
+                # Forking would copy the event loop and open DB connections
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_limit_memory,
+                initargs=(self.memory_limit_mb * 1024 * 1024,),
+            )
+        return executor
+
+    async def _acquire(self) -> int:
+        """Wait for an idle process slot."""
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for slot in range(self.max_workers):
+                self._idle.put_nowait(slot)
+        return await self._idle.get()
+
+    async def run(
+        self, fn: Callable[..., T], *args: Any, budget: ExtractionBudget | None = None
+    ) -> T:
+        """Run ``fn(*args)`` in a pool process within ``budget``.
+
+        Args:
+            fn: Picklable function to run
+            budget: Budget of the document, defaults to the pool's timeout
+
+        Raises:
+            ExtractionTimeoutError: If the budget runs out before ``fn`` returns
+            BrokenProcessPool: If the process running ``fn`` died
+        """
+        budget = budget or ExtractionBudget(self.timeout)
+        slot = await self._acquire()
+        try:
+            # The budget may have run out while this call waited for a process
+            if budget.remaining() <= 0:
+                raise ExtractionTimeoutError(
+                    f"Document extraction timed out after {budget.timeout}s"
+                )
+            loop = asyncio.get_running_loop()
+            budget.start()
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(self._get_executor(slot), fn, *args),
+                    timeout=budget.remaining(),
+                )
+            except TimeoutError:
+                # Work already running in a process cannot be cancelled, only killed
+                self._kill(slot)
+                raise ExtractionTimeoutError(
+                    f"Document extraction timed out after {budget.timeout}s"
+                ) from None
+            except (BrokenProcessPool, asyncio.CancelledError):
+                self._kill(slot)
+                raise
+            finally:
+                budget.stop()
+        finally:
+            self._idle.put_nowait(slot)
+
+    async def run_all(
+        self,
+        calls: list[tuple[Callable[..., T], tuple]],
+        budget: ExtractionBudget | None = None,
+    ) -> list[T]:
+        """Run several calls of one document in parallel under a shared budget.
+
+        Every call runs to completion (or to the end of the budget) even if
+        another call fails, so no work is left behind in the pool.
+
+        Args:
+            calls: List of (function, args) tuples
+            budget: Budget of the document, defaults to the pool's timeout
+
+        Returns:
+            Results in the order of ``calls``
+
+        Raises:
+            ExtractionTimeoutError: If the calls do not finish within the budget
+        """
+        budget = budget or ExtractionBudget(self.timeout)
+        results = await asyncio.gather(
+            *(self.run(fn, *args, budget=budget) for fn, args in calls),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _kill(self, slot: int) -> None:
+        """Kill the process of a slot; its next call starts a new one."""
+        executor, self._executors[slot] = self._executors[slot], None
+        if executor is None:
+            return
+        # ProcessPoolExecutor has no public way to kill workers before Python 3.14
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Shut the pool down, waiting for running calls."""
+        for slot, executor in enumerate(self._executors):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+                self._executors[slot] = None
+
+
+_pool: ExtractionPool | None = None
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """Get the process-wide extraction pool."""
+    global _pool
+    if _pool is None:
+        _pool = ExtractionPool(
+            max_workers=settings.extract_pool_workers,
+            timeout=settings.extract_timeout,
+            memory_limit_mb=settings.extract_memory_limit_mb,
+        )
+    return _pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Shut down the process-wide extraction pool, if started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
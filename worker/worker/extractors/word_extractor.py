@@ -1,7 +1,7 @@
-import io
 import logging
 
-from docx import Document
+from worker.extractors.extracted_text import ExtractedText
+from worker.extractors.pool import ExtractionPool, extract_docx_parts, get_extraction_pool
 
 logger = logging.getLogger(__name__)
 
@@ -9,42 +9,31 @@ logger = logging.getLogger(__name__)
 class WordExtractor:
     """Extract text from Word documents (.docx)."""
 
-    async def extract(self, content: bytes) -> str:
+    def __init__(self, pool: ExtractionPool | None = None):
+        self.pool = pool or get_extraction_pool()
+
+    async def extract(self, content: bytes, max_chars: int | None = None) -> ExtractedText:
         """Extract text from Word document content.
 
+        Parsing runs in the extraction process pool.
+
         Args:
             content: Word document content as bytes
+            max_chars: Character budget, or None for no limit
 
         Returns:
-            Extracted text
+            Extracted text (Word documents have no page offsets)
 
         Raises:
             Exception: If extraction fails
         """
         try:
-            doc_file = io.BytesIO(content)
-            document = Document(doc_file)
-
-            text_parts = []
-
-            # Extract paragraphs
-            for para in document.paragraphs:
-                if para.text.strip():
-                    text_parts.append(para.text)
-
-            # Extract tables
-            for table in document.tables:
-                table_text = []
-                for row in table.rows:
-                    row_text = [cell.text.strip() for cell in row.cells]
-                    table_text.append(" | ".join(row_text))
-                if table_text:
-                    text_parts.append("\n".join(table_text))
+            [text_parts] = await self.pool.run_all([(extract_docx_parts, (content,))])
 
             if not text_parts:
                 raise ValueError("No text could be extracted from Word document")
 
-            return "\n\n".join(text_parts)
+            return ExtractedText.from_text("\n\n".join(text_parts), max_chars)
 
         except Exception as e:
             logger.error(f"Word extraction failed: {e}")
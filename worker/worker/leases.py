@@ -0,0 +1,131 @@
+"""Leases on claimed queue jobs.
+
+A worker that claims a job holds it until ``leased_until``. While the job
+runs, a heartbeat keeps extending the lease; if the worker dies, the lease
+expires and the reaper returns the job to READY (after a backoff) or fails
+it once it has used up its attempts.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections.abc import Callable, Collection
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+
+from worker.config import get_settings
+from worker.database import AsyncSessionLocal
+from worker.models import CandidateStatus, JobsQueue, QueueStatus
+from worker.retries import backoff_delay
+from worker.stats import set_candidate_status
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Identifies this worker process in jobs_queue.worker_id
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"[:64]
+
+
+def lease_expiry(now: datetime | None = None) -> datetime:
+    """Get the expiry time of a lease taken or extended now."""
+    return (now or datetime.utcnow()) + timedelta(seconds=settings.job_lease_seconds)
+
+
+async def extend_leases(queue_ids: Collection[str], worker_id: str = WORKER_ID) -> int:
+    """Extend the leases of the jobs this worker is running.
+
+    Only jobs in ``queue_ids`` are extended. A job leased to this worker
+    that is no longer in flight (for example after its task was cancelled)
+    lets its lease expire, so the reaper picks it up.
+
+    Args:
+        queue_ids: Queue IDs of the jobs in flight
+
+    Returns:
+        Number of leases extended
+    """
+    if not queue_ids:
+        return 0
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(JobsQueue)
+            .where(
+                JobsQueue.queue_id.in_(list(queue_ids)),
+                JobsQueue.worker_id == worker_id,
+                JobsQueue.status == QueueStatus.RUNNING.value,
+            )
+            .values(leased_until=lease_expiry())
+        )
+        await db.commit()
+        return result.rowcount
+
+
+async def reap_expired_leases(limit: int = 100) -> int:
+    """Return jobs whose lease expired to the queue, or fail them.
+
+    Jobs with attempts left become READY again after an exponential
+    backoff; the others are marked FAILED along with their candidate.
+
+    Returns:
+        Number of jobs reaped
+    """
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        stmt = (
+            select(JobsQueue)
+            .where(
+                JobsQueue.status == QueueStatus.RUNNING.value,
+                JobsQueue.leased_until < now,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(stmt)
+        jobs = list(result.scalars().all())
+
+        for job in jobs:
+            error = f"Lease held by {job.worker_id} expired at {job.leased_until}"
+            job.worker_id = None
+            job.leased_until = None
+            job.last_error = error
+
+            if job.attempts >= settings.max_retries:
+                job.status = QueueStatus.FAILED.value
+                await set_candidate_status(
+                    db, job.candidate_id, CandidateStatus.ERROR, error[:1000]
+                )
+                logger.error(f"Job {job.queue_id} failed: {error}")
+            else:
+                job.status = QueueStatus.READY.value
+                job.available_at = now + backoff_delay(job.attempts)
+                logger.warning(f"Job {job.queue_id} re-queued: {error}")
+
+        await db.commit()
+        return len(jobs)
+
+
+async def run_lease_maintenance(
+    stopping: asyncio.Event,
+    in_flight: Callable[[], Collection[str]],
+    worker_id: str = WORKER_ID,
+) -> None:
+    """Send heartbeats and reap expired leases until ``stopping`` is set.
+
+    Args:
+        stopping: Set to stop maintenance
+        in_flight: Get the queue IDs of the jobs this worker is running
+    """
+    while not stopping.is_set():
+        try:
+            await extend_leases(in_flight(), worker_id)
+            await reap_expired_leases()
+        except Exception as e:
+            logger.error(f"Error in lease maintenance: {e}")
+
+        try:
+            await asyncio.wait_for(stopping.wait(), timeout=settings.heartbeat_interval)
+        except TimeoutError:
+            pass
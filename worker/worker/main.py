@@ -2,20 +2,29 @@
 
 import asyncio
 import logging
+import signal
 import sys
 import uuid
+from datetime import datetime, timedelta
 
-from sqlalchemy import select, update
+from sqlalchemy import or_, select, update
 
 from worker.config import get_settings
 from worker.database import AsyncSessionLocal
-from worker.models import Candidate, CandidateStatus, JobsQueue, JobType, QueueStatus
+from worker.extractors.pool import shutdown_extraction_pool
+from worker.leases import WORKER_ID, lease_expiry, run_lease_maintenance
+from worker.models import CandidateStatus, JobsQueue, JobType, QueueStatus
+from worker.rescoring import run_rescoring_loop
+from worker.retries import backoff_delay, is_transient_error
+from worker.scheduler import JobScheduler
+from worker.stats import set_candidate_status
 from worker.storage import get_storage
 from worker.tasks.embedding_generation import EmbeddingGenerationTask
 from worker.tasks.explanation_generation import ExplanationGenerationTask
 from worker.tasks.llm_extraction import LLMExtractionTask
 from worker.tasks.score_calculation import ScoreCalculationTask
 from worker.tasks.text_extraction import TextExtractionTask
+from worker.wakeup import WakeupListener, get_wakeup_dir, notify_workers
 
 # Configure logging
 logging.basicConfig(
@@ -28,91 +37,177 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-async def get_next_job() -> tuple[JobsQueue | None, asyncio.Lock]:
-    """Get the next ready job from queue."""
+async def claim_jobs(job_type: str | None = None, limit: int | None = None) -> list[JobsQueue]:
+    """Atomically claim up to ``limit`` ready jobs and mark them as running.
+
+    The rows are locked with SKIP LOCKED so that concurrent workers never
+    claim the same job, and the whole batch is leased in one transaction.
+    Jobs waiting out a retry backoff (``available_at`` in the future) are
+    skipped. The batch size is capped by ``settings.batch_size``.
+    """
+    limit = min(limit or settings.batch_size, settings.batch_size)
+    now = datetime.utcnow()
+    leased_until = lease_expiry(now)
     async with AsyncSessionLocal() as db:
+        stmt = select(JobsQueue).where(
+            JobsQueue.status == QueueStatus.READY.value,
+            or_(JobsQueue.available_at.is_(None), JobsQueue.available_at <= now),
+        )
+        if job_type:
+            stmt = stmt.where(JobsQueue.job_type == job_type)
         stmt = (
-            select(JobsQueue)
-            .where(JobsQueue.status == QueueStatus.READY.value)
-            .order_by(JobsQueue.created_at.asc())
-            .limit(1)
+            stmt.order_by(JobsQueue.created_at.asc())
+            .limit(limit)
             .with_for_update(skip_locked=True)
         )
         result = await db.execute(stmt)
-        job = result.scalar_one_or_none()
-
-        if job:
-            # Mark as running
-            job.status = QueueStatus.RUNNING.value
-            job.attempts += 1
+        jobs = list(result.scalars().all())
+
+        if jobs:
+            # Mark the whole batch as running, leased to this worker
+            await db.execute(
+                update(JobsQueue)
+                .where(JobsQueue.queue_id.in_([job.queue_id for job in jobs]))
+                .values(
+                    status=QueueStatus.RUNNING.value,
+                    attempts=JobsQueue.attempts + 1,
+                    worker_id=WORKER_ID,
+                    leased_until=leased_until,
+                )
+            )
             await db.commit()
-            await db.refresh(job)
 
-        return job, asyncio.Lock()
+        return jobs
+
 
+def owned_by_worker(queue_id: str):
+    """Filter for a job that is still RUNNING under this worker's lease."""
+    return (
+        (JobsQueue.queue_id == queue_id)
+        & (JobsQueue.status == QueueStatus.RUNNING.value)
+        & (JobsQueue.worker_id == WORKER_ID)
+    )
+
+
+async def mark_job_failed(queue_id: str, error: str) -> bool:
+    """Mark a job as failed.
 
-async def mark_job_done(queue_id: str) -> None:
-    """Mark a job as done."""
+    Returns:
+        False if the job's lease was lost to the reaper and nothing changed
+    """
     async with AsyncSessionLocal() as db:
         stmt = (
             update(JobsQueue)
-            .where(JobsQueue.queue_id == queue_id)
-            .values(status=QueueStatus.DONE.value)
+            .where(owned_by_worker(queue_id))
+            .values(status=QueueStatus.FAILED.value, last_error=error[:1000], leased_until=None)
         )
-        await db.execute(stmt)
+        result = await db.execute(stmt)
         await db.commit()
+        return result.rowcount > 0
+
 
+async def schedule_retry(queue_id: str, error: str, delay: timedelta) -> bool:
+    """Return a failed job to the queue, to be claimed again after ``delay``.
 
-async def mark_job_failed(queue_id: str, error: str) -> None:
-    """Mark a job as failed."""
+    Returns:
+        False if the job's lease was lost to the reaper and nothing changed
+    """
     async with AsyncSessionLocal() as db:
         stmt = (
             update(JobsQueue)
-            .where(JobsQueue.queue_id == queue_id)
-            .values(status=QueueStatus.FAILED.value, last_error=error[:1000])
+            .where(owned_by_worker(queue_id))
+            .values(
+                status=QueueStatus.READY.value,
+                last_error=error[:1000],
+                available_at=datetime.utcnow() + delay,
+                worker_id=None,
+                leased_until=None,
+            )
         )
-        await db.execute(stmt)
+        result = await db.execute(stmt)
         await db.commit()
+        return result.rowcount > 0
 
 
 async def update_candidate_error(candidate_id: str, error: str) -> None:
     """Update candidate with error status."""
     async with AsyncSessionLocal() as db:
-        stmt = (
-            update(Candidate)
-            .where(Candidate.candidate_id == candidate_id)
-            .values(status=CandidateStatus.ERROR.value, error_message=error[:1000])
-        )
-        await db.execute(stmt)
+        await set_candidate_status(db, candidate_id, CandidateStatus.ERROR, error[:1000])
         await db.commit()
 
 
-async def enqueue_next_job(candidate_id: str, current_job_type: str) -> None:
-    """Enqueue the next job in the pipeline."""
-    next_job_map = {
-        JobType.TEXT_EXTRACT.value: JobType.LLM_EXTRACT.value,
-        JobType.LLM_EXTRACT.value: JobType.EMBED.value,
-        JobType.EMBED.value: JobType.SCORE.value,
-        JobType.SCORE.value: JobType.EXPLAIN.value,
-    }
+NEXT_JOB_TYPE = {
+    JobType.TEXT_EXTRACT.value: JobType.LLM_EXTRACT.value,
+    JobType.LLM_EXTRACT.value: JobType.EMBED.value,
+    JobType.EMBED.value: JobType.SCORE.value,
+    JobType.SCORE.value: JobType.EXPLAIN.value,
+}
+
+
+async def complete_job(job: JobsQueue, scheduler: JobScheduler | None = None) -> JobsQueue | None:
+    """Mark a job as done and enqueue the next job in the pipeline.
+
+    Both happen in one transaction, which is the checkpoint for the stage.
+    If ``scheduler`` has a free slot for the next stage, the next job is
+    created already RUNNING and returned so that the scheduler runs it right
+    away (fused pipeline); otherwise it is created READY for any worker to
+    claim.
+
+    Returns:
+        The next job if it was claimed for in-process execution
+    """
+    next_type = NEXT_JOB_TYPE.get(job.job_type)
+    fused = next_type is not None and scheduler is not None and scheduler.reserve(next_type)
 
-    next_type = next_job_map.get(current_job_type)
-    if next_type:
+    try:
         async with AsyncSessionLocal() as db:
-            new_job = JobsQueue(
-                queue_id=str(uuid.uuid4()),
-                candidate_id=candidate_id,
-                job_type=next_type,
-                status=QueueStatus.READY.value,
-                attempts=0,
+            result = await db.execute(
+                update(JobsQueue)
+                .where(owned_by_worker(job.queue_id))
+                .values(status=QueueStatus.DONE.value, leased_until=None)
             )
-            db.add(new_job)
+            if result.rowcount == 0:
+                # The lease expired and the job was re-queued; its new run enqueues the next stage
+                logger.warning(f"Lease on job {job.queue_id} was lost, not enqueueing next job")
+                await db.rollback()
+                if fused:
+                    scheduler.release(next_type)
+                return None
+
+            next_job = None
+            if next_type:
+                next_job = JobsQueue(
+                    queue_id=str(uuid.uuid4()),
+                    candidate_id=job.candidate_id,
+                    job_type=next_type,
+                    status=QueueStatus.RUNNING.value if fused else QueueStatus.READY.value,
+                    attempts=1 if fused else 0,
+                    worker_id=WORKER_ID if fused else None,
+                    leased_until=lease_expiry() if fused else None,
+                )
+                db.add(next_job)
             await db.commit()
-            logger.info(f"Enqueued next job: {next_type} for candidate {candidate_id}")
+    except BaseException:
+        if fused:
+            scheduler.release(next_type)
+        raise
+
+    if next_job:
+        logger.info(
+            f"Enqueued next job: {next_type} for candidate {job.candidate_id}"
+            + (" (continuing in-process)" if fused else "")
+        )
+        if not fused and settings.wakeup_enabled:
+            notify_workers(get_wakeup_dir(settings.storage_path))
+    return next_job if fused else None
 
 
-async def process_job(job: JobsQueue) -> None:
-    """Process a single job."""
+async def process_job(job: JobsQueue, scheduler: JobScheduler | None = None) -> JobsQueue | None:
+    """Process a single job.
+
+    Returns:
+        The candidate's next job if it was claimed to run in-process
+    """
     logger.info(f"Processing job {job.queue_id}: {job.job_type} for candidate {job.candidate_id}")
 
     try:
@@ -142,54 +237,107 @@ async def process_job(job: JobsQueue) -> None:
             else:
                 raise ValueError(f"Unknown job type: {job.job_type}")
 
-        # Mark job as done
-        await mark_job_done(job.queue_id)
+        # Mark job as done and enqueue next job in pipeline
+        next_job = await complete_job(job, scheduler)
         logger.info(f"Job {job.queue_id} completed successfully")
-
-        # Enqueue next job in pipeline
-        await enqueue_next_job(job.candidate_id, job.job_type)
+        return next_job
 
     except Exception as e:
-        error_msg = str(e)
-        logger.error(f"Job {job.queue_id} failed: {error_msg}")
+        error_msg = str(e) or type(e).__name__
 
-        # Mark job as failed
-        await mark_job_failed(job.queue_id, error_msg)
+        if is_transient_error(e) and job.attempts < settings.max_retries:
+            delay = backoff_delay(job.attempts)
+            logger.warning(
+                f"Job {job.queue_id} failed (attempt {job.attempts}/{settings.max_retries}), "
+                f"retrying in {delay.total_seconds():.0f}s: {error_msg}"
+            )
+            await schedule_retry(job.queue_id, error_msg, delay)
+            return None
 
-        # Update candidate status if max retries exceeded
-        if job.attempts >= settings.max_retries:
+        logger.error(f"Job {job.queue_id} failed: {error_msg}")
+        if is_transient_error(e):
             logger.error(
                 f"Max retries ({settings.max_retries}) exceeded for job {job.queue_id}"
             )
+
+        # A failed job is not retried automatically, so the candidate needs attention
+        if await mark_job_failed(job.queue_id, error_msg):
             await update_candidate_error(job.candidate_id, error_msg)
+        return None
 
 
-async def poll_loop() -> None:
-    """Main polling loop."""
+def get_concurrency_limits() -> dict[str, int]:
+    """Get the per-job-type concurrency limits from settings."""
+    return {
+        JobType.TEXT_EXTRACT.value: settings.text_extract_concurrency,
+        JobType.LLM_EXTRACT.value: settings.llm_extract_concurrency,
+        JobType.EMBED.value: settings.embed_concurrency,
+        JobType.SCORE.value: settings.score_concurrency,
+        JobType.EXPLAIN.value: settings.explain_concurrency,
+    }
+
+
+async def run_worker() -> None:
+    """Run the job scheduler and the rescoring loop until SIGTERM/SIGINT.
+
+    In-flight queue jobs are drained on shutdown; an unfinished rescore run
+    is returned to PENDING between batches.
+    """
+    limits = get_concurrency_limits()
     logger.info(
-        f"Worker started. Polling interval: {settings.poll_interval}s, "
-        f"Max retries: {settings.max_retries}"
+        f"Worker started. Polling interval: {settings.min_poll_interval}-"
+        f"{settings.poll_interval}s, "
+        f"Max retries: {settings.max_retries}, Concurrency: {limits}, "
+        f"Fused pipeline: {settings.pipeline_fused}, Worker ID: {WORKER_ID}"
     )
 
-    while True:
-        try:
-            job, _ = await get_next_job()
+    async def process(job: JobsQueue) -> JobsQueue | None:
+        # In fused mode a finished stage hands the candidate to the next stage directly
+        return await process_job(job, scheduler if settings.pipeline_fused else None)
+
+    listener = WakeupListener(get_wakeup_dir(settings.storage_path))
+    wakeup = listener.event if settings.wakeup_enabled and listener.start() else None
+
+    scheduler = JobScheduler(
+        claim=claim_jobs,
+        process=process,
+        limits=limits,
+        poll_interval=settings.poll_interval,
+        shutdown_timeout=settings.shutdown_timeout,
+        wakeup=wakeup,
+        min_poll_interval=settings.min_poll_interval,
+    )
 
-            if job:
-                await process_job(job)
-            else:
-                # No jobs available, wait before polling again
-                await asyncio.sleep(settings.poll_interval)
+    stopping = asyncio.Event()
 
-        except Exception as e:
-            logger.error(f"Error in poll loop: {e}")
-            await asyncio.sleep(settings.poll_interval)
+    def shutdown() -> None:
+        stopping.set()
+        scheduler.stop()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, shutdown)
+
+    rescoring = asyncio.create_task(run_rescoring_loop(stopping))
+    # Heartbeats continue while in-flight jobs drain after shutdown is requested
+    drained = asyncio.Event()
+    lease_maintenance = asyncio.create_task(
+        run_lease_maintenance(drained, lambda: scheduler.in_flight_ids)
+    )
+    try:
+        await scheduler.run()
+        await rescoring
+    finally:
+        drained.set()
+        await lease_maintenance
+        listener.close()
+        shutdown_extraction_pool()
 
 
 def main() -> None:
     """Main entry point."""
     logger.info("Starting worker...")
-    asyncio.run(poll_loop())
+    asyncio.run(run_worker())
 
 
 if __name__ == "__main__":
@@ -3,7 +3,19 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from worker.database import Base
@@ -36,6 +48,13 @@ class QueueStatus(str, Enum):
     FAILED = "FAILED"
 
 
+class RescoreStatus(str, Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
 class EmbeddingKind(str, Enum):
     CANDIDATE_SUMMARY = "candidate_summary"
     NICE_REQ = "nice_req"
@@ -54,6 +73,20 @@ class Job(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
 
+class JobExtraction(Base):
+    """Job requirements extraction model (cached per job text and model)."""
+
+    __tablename__ = "job_extractions"
+
+    job_id: Mapped[str] = mapped_column(String(36), ForeignKey("jobs.job_id"), primary_key=True)
+    job_text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    llm_model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    requirements_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    evidence_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    extract_version: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
 class Candidate(Base):
     """Candidate model."""
 
@@ -64,6 +97,9 @@ class Candidate(Base):
     display_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     status: Mapped[str] = mapped_column(String(20), default="NEW")
     error_message: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+    latest_decision: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    latest_decided_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    rank_fit: Mapped[int] = mapped_column(Integer, default=-1)
     submitted_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
 
@@ -111,7 +147,24 @@ class Embedding(Base):
     )
     kind: Mapped[str] = mapped_column(String(50), nullable=False)
     ref_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    vector: Mapped[list[float] | None] = mapped_column(JSON, nullable=True)
+    vector: Mapped[list[float] | None] = mapped_column(JSON, nullable=True)  # legacy
+    vector_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    vector_dim: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    vector_dtype: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
+class EmbeddingCache(Base):
+    """Content-addressed embedding cache model (shared across candidates)."""
+
+    __tablename__ = "embedding_cache"
+
+    embedding_model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    vector: Mapped[list[float] | None] = mapped_column(JSON, nullable=True)  # legacy
+    vector_blob: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    vector_dim: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    vector_dtype: Mapped[str | None] = mapped_column(String(10), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
 
@@ -129,6 +182,7 @@ class Score(Base):
     role_score: Mapped[float] = mapped_column(Float, default=0.0)
     total_fit_0_100: Mapped[int] = mapped_column(Integer, default=0)
     must_gaps_json: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    must_gaps_count: Mapped[int] = mapped_column(Integer, default=0)
     score_config_version: Mapped[int] = mapped_column(Integer, nullable=False)
     computed_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
@@ -159,6 +213,40 @@ class ScoreConfig(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
 
+class RescoreRun(Base):
+    """Rescore run model."""
+
+    __tablename__ = "rescore_runs"
+
+    run_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    score_config_version: Mapped[int] = mapped_column(
+        Integer, ForeignKey("score_config.version"), nullable=False
+    )
+    job_id: Mapped[str | None] = mapped_column(
+        String(36), ForeignKey("jobs.job_id"), nullable=True
+    )
+    status: Mapped[str] = mapped_column(String(20), default="PENDING")
+    total: Mapped[int] = mapped_column(Integer, default=0)
+    processed: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    worker_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    leased_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
+class StatsCounter(Base):
+    """Dashboard statistics counter model."""
+
+    __tablename__ = "stats_counters"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
 class JobsQueue(Base):
     """Job queue model."""
 
@@ -172,5 +260,8 @@ class JobsQueue(Base):
     status: Mapped[str] = mapped_column(String(20), default="READY")
     attempts: Mapped[int] = mapped_column(Integer, default=0)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    worker_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    leased_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    available_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
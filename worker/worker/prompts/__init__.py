@@ -1,4 +1,4 @@
 from worker.prompts.explanation_prompt import ExplanationPrompt
-from worker.prompts.extraction_prompt import ExtractionPrompt
+from worker.prompts.extraction_prompt import ExtractionPrompt, JobRequirementsPrompt
 
-__all__ = ["ExtractionPrompt", "ExplanationPrompt"]
+__all__ = ["ExtractionPrompt", "JobRequirementsPrompt", "ExplanationPrompt"]
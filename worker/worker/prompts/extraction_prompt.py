@@ -1,18 +1,28 @@
 """Extraction prompt templates."""
 
+import json
+from typing import Any
 
-class ExtractionPrompt:
-    """Prompts for LLM extraction."""
+
+class JobRequirementsPrompt:
+    """Prompts for extracting job requirements from a job posting.
+
+    Run once per job text and model; the result is cached and shared by
+    every candidate of the job.
+    """
 
     SYSTEM_PROMPT = """You are an information extraction engine for recruitment screening.
 Return ONLY valid JSON that conforms to the provided schema.
 Do not add any commentary, markdown, or extra keys.
 
 Rules:
-- Never infer or guess. If not clearly stated, set value to null and add the item to unknowns.
-- Extract evidence: provide a short quote (<= 20 words) from the input text that supports each extracted item.
-- Do not use sensitive attributes (age, gender, nationality, race, religion). If present, ignore them.
-- Normalize skill names to common industry terms where possible (e.g., "EKS" -> "Kubernetes", "S3" -> "AWS S3").
+- Never infer or guess. If not clearly stated, set value to null.
+- Extract evidence: provide a short quote (<= 20 words) from the input text
+  that supports each extracted item.
+- Do not use sensitive attributes (age, gender, nationality, race, religion).
+  If present, ignore them.
+- Normalize skill names to common industry terms where possible
+  (e.g., "EKS" -> "Kubernetes", "S3" -> "AWS S3").
 - Experience years must be numeric if explicitly supported; otherwise null.
 
 Output JSON Schema:
@@ -23,6 +33,41 @@ Output JSON Schema:
     "role_expectation": "IC|Lead|Manager|null",
     "year_requirements": {"skill_name": number_or_null}
   },
+  "evidence": {
+    "job": {"must:m1": "quote from job text"}
+  }
+}"""
+
+    USER_PROMPT_TEMPLATE = """Extract job requirements from the following job posting.
+
+[JOB_TEXT]
+{job_text}
+
+Return JSON matching the schema. Use null when unknown."""
+
+    @classmethod
+    def format_user_prompt(cls, job_text: str) -> str:
+        """Format the user prompt with job text."""
+        return cls.USER_PROMPT_TEMPLATE.format(job_text=job_text)
+
+
+class ExtractionPrompt:
+    """Prompts for LLM extraction of a candidate profile against job requirements."""
+
+    SYSTEM_PROMPT = """You are an information extraction engine for recruitment screening.
+Return ONLY valid JSON that conforms to the provided schema.
+Do not add any commentary, markdown, or extra keys.
+
+Rules:
+- Never infer or guess. If not clearly stated, set value to null and add the item to unknowns.
+- Extract evidence: provide a short quote (<= 20 words) from the input text that supports each extracted item.
+- Do not use sensitive attributes (age, gender, nationality, race, religion). If present, ignore them.
+- Normalize skill names to common industry terms where possible (e.g., "EKS" -> "Kubernetes", "S3" -> "AWS S3").
+  Prefer the skill names used in the skill_tags of the given job requirements.
+- Experience years must be numeric if explicitly supported; otherwise null.
+
+Output JSON Schema:
+{
   "candidate_profile": {
     "skills": ["skill1", "skill2"],
     "roles": ["IC|Lead|Manager"],
@@ -32,15 +77,16 @@ Output JSON Schema:
     "unknowns": ["unknown1"]
   },
   "evidence": {
-    "job": {"must:m1": "quote from job text"},
     "candidate": {"skill:Python": "quote from resume"}
   }
 }"""
 
-    USER_PROMPT_TEMPLATE = """Extract job requirements and candidate profile from the following texts.
+    USER_PROMPT_TEMPLATE = """Extract the candidate profile from the resume below.
+The job requirements have already been extracted; use them to decide which skills and
+experience are relevant.
 
-[JOB_TEXT]
-{job_text}
+[JOB_REQUIREMENTS]
+{job_requirements_json}
 
 [RESUME_TEXT]
 {resume_text}
@@ -48,9 +94,9 @@ Output JSON Schema:
 Return JSON matching the schema. Use null when unknown."""
 
     @classmethod
-    def format_user_prompt(cls, job_text: str, resume_text: str) -> str:
-        """Format the user prompt with job and resume text."""
+    def format_user_prompt(cls, job_requirements: dict[str, Any], resume_text: str) -> str:
+        """Format the user prompt with extracted job requirements and resume text."""
         return cls.USER_PROMPT_TEMPLATE.format(
-            job_text=job_text,
+            job_requirements_json=json.dumps(job_requirements, ensure_ascii=False),
             resume_text=resume_text,
         )
@@ -0,0 +1,390 @@
+"""Bulk rescoring of stored extractions with a score config version.
+
+One rescore run is RUNNING at a time. The worker running it holds a lease
+that is renewed with every batch. A run whose lease expired (its worker
+died) is taken over by the next worker to poll, and restarts from the
+first candidate since scores are recomputed idempotently.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from worker.config import get_settings
+from worker.database import AsyncSessionLocal
+from worker.embedding_cache import EmbeddingCacheService
+from worker.leases import WORKER_ID, lease_expiry
+from worker.models import (
+    Candidate,
+    Embedding,
+    EmbeddingKind,
+    Extraction,
+    RescoreRun,
+    RescoreStatus,
+    Score,
+)
+from worker.score_config_cache import score_config_cache
+from worker.scorers.nice_scorer import NiceScorer
+from worker.scorers.scoring_profile import ScoringProfile
+from worker.vector_codec import read_vector
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class RescoreRunLostError(Exception):
+    """Raised when a rescore run's lease expired and another worker took it over."""
+
+
+def owned_run(run_id: str):
+    """Filter for a rescore run that is still RUNNING under this worker's lease."""
+    return (
+        (RescoreRun.run_id == run_id)
+        & (RescoreRun.status == RescoreStatus.RUNNING.value)
+        & (RescoreRun.worker_id == WORKER_ID)
+    )
+
+
+@dataclass
+class _CandidateRow:
+    candidate_id: str
+    job_requirements: dict[str, Any]
+    candidate_profile: dict[str, Any]
+
+
+class RescoringEngine:
+    """Recompute scores from stored extractions and embeddings.
+
+    No LLM or embedding API calls are made: must/year/role scores come from
+    the stored extraction JSON, and nice scores from the stored candidate
+    summary vectors and the cached nice requirement vectors, scored one
+    matrix product per job and batch.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        profile: ScoringProfile,
+        batch_size: int | None = None,
+    ):
+        self.db = db
+        self.profile = profile
+        self.batch_size = batch_size or settings.rescore_batch_size
+        self.embedding_cache = EmbeddingCacheService(db)
+        # Nice requirement matrices keyed by the requirement texts of a job
+        self._nice_matrices: dict[tuple[str, ...], np.ndarray | None] = {}
+
+    async def run(self, run: RescoreRun, stopping: asyncio.Event | None = None) -> bool:
+        """Rescore every candidate covered by a run, committing per batch.
+
+        Args:
+            run: Claimed rescore run (status RUNNING)
+            stopping: Set to interrupt the run between batches
+
+        Returns:
+            True if the run completed, False if it was interrupted
+
+        Raises:
+            RescoreRunLostError: If the run was taken over by another worker
+        """
+        started = time.monotonic()
+        last_candidate_id = ""
+
+        while True:
+            if stopping is not None and stopping.is_set():
+                return False
+
+            rows = await self._get_batch(run.job_id, last_candidate_id)
+            if not rows:
+                break
+
+            await self.score_batch(rows)
+            last_candidate_id = rows[-1].candidate_id
+
+            # Record progress and renew the lease with the batch's scores
+            result = await self.db.execute(
+                update(RescoreRun)
+                .where(owned_run(run.run_id))
+                .values(processed=RescoreRun.processed + len(rows), leased_until=lease_expiry())
+            )
+            if result.rowcount == 0:
+                await self.db.rollback()
+                raise RescoreRunLostError(f"Lease on rescore run {run.run_id} was lost")
+            await self.db.commit()
+
+            elapsed = time.monotonic() - started
+            logger.info(
+                f"Rescore run {run.run_id}: {run.processed}/{run.total} candidates "
+                f"({run.processed / elapsed if elapsed > 0 else 0:.0f}/s)"
+            )
+
+        return True
+
+    async def score_batch(self, rows: list[_CandidateRow]) -> None:
+        """Compute and store scores for a batch of candidates.
+
+        Scores already computed with a newer config version are left alone,
+        so a run for an older version never overwrites a newer one.
+        """
+        candidate_ids = [row.candidate_id for row in rows]
+        summaries, legacy_nice = await self._get_embeddings(candidate_ids)
+        nice_scores = await self._calculate_nice_scores(rows, summaries, legacy_nice)
+
+        # Locked until the batch commits, so the version check holds
+        stmt = select(Score).where(Score.candidate_id.in_(candidate_ids)).with_for_update()
+        result = await self.db.execute(stmt)
+        existing = {score.candidate_id: score for score in result.scalars().all()}
+
+        rank_fits = []
+        for row in rows:
+            score = existing.get(row.candidate_id)
+            if score and (score.score_config_version or 0) > self.profile.version:
+                continue
+            scores = self.profile.calculate(
+                row.job_requirements,
+                row.candidate_profile,
+                nice_score=nice_scores.get(row.candidate_id, 0.0),
+            )
+            values = {
+                "must_score": scores["must_score"],
+                "nice_score": scores["nice_score"],
+                "year_score": scores["year_score"],
+                "role_score": scores["role_score"],
+                "total_fit_0_100": scores["total_fit_0_100"],
+                "must_gaps_json": scores["must_gaps"],
+                "must_gaps_count": len(scores["must_gaps"]),
+                "score_config_version": self.profile.version,
+            }
+            if score:
+                for key, value in values.items():
+                    setattr(score, key, value)
+            else:
+                self.db.add(Score(candidate_id=row.candidate_id, **values))
+            rank_fits.append(
+                {"candidate_id": row.candidate_id, "rank_fit": scores["total_fit_0_100"]}
+            )
+
+        # Ranked candidate lists order by this copy of the score
+        if rank_fits:
+            await self.db.execute(update(Candidate), rank_fits)
+
+    async def _get_batch(self, job_id: str | None, after: str) -> list[_CandidateRow]:
+        """Get the next batch of extractions in candidate ID order."""
+        stmt = (
+            select(
+                Extraction.candidate_id,
+                Extraction.job_requirements_json,
+                Extraction.candidate_profile_json,
+            )
+            .where(Extraction.candidate_id > after)
+            .order_by(Extraction.candidate_id)
+            .limit(self.batch_size)
+        )
+        if job_id:
+            stmt = stmt.join(Candidate, Candidate.candidate_id == Extraction.candidate_id).where(
+                Candidate.job_id == job_id
+            )
+        result = await self.db.execute(stmt)
+        return [
+            _CandidateRow(
+                candidate_id=candidate_id,
+                job_requirements=job_requirements or {},
+                candidate_profile=candidate_profile or {},
+            )
+            for candidate_id, job_requirements, candidate_profile in result.all()
+        ]
+
+    async def _get_embeddings(
+        self, candidate_ids: list[str]
+    ) -> tuple[dict[str, np.ndarray], dict[str, list[tuple[str, np.ndarray]]]]:
+        """Get candidate summary vectors and legacy per-candidate nice vectors."""
+        stmt = select(Embedding).where(Embedding.candidate_id.in_(candidate_ids))
+        result = await self.db.execute(stmt)
+
+        summaries: dict[str, np.ndarray] = {}
+        legacy_nice: dict[str, list[tuple[str, np.ndarray]]] = {}
+        for emb in result.scalars().all():
+            vector = read_vector(emb.vector_blob, emb.vector_dim, emb.vector_dtype, emb.vector)
+            if vector is None:
+                continue
+            if emb.kind == EmbeddingKind.CANDIDATE_SUMMARY.value:
+                summaries[emb.candidate_id] = vector
+            elif emb.kind == EmbeddingKind.NICE_REQ.value:
+                legacy_nice.setdefault(emb.candidate_id, []).append((emb.ref_id, vector))
+        return summaries, legacy_nice
+
+    async def _get_nice_matrix(self, nice_texts: tuple[str, ...]) -> np.ndarray | None:
+        """Get the normalized nice requirement matrix for a job's requirement texts."""
+        if nice_texts not in self._nice_matrices:
+            cached = await self.embedding_cache.lookup_many(list(nice_texts))
+            nice_embeddings = [(text, cached[text]) for text in nice_texts if text in cached]
+            self._nice_matrices[nice_texts] = (
+                NiceScorer.build_matrix(nice_embeddings) if nice_embeddings else None
+            )
+        return self._nice_matrices[nice_texts]
+
+    async def _calculate_nice_scores(
+        self,
+        rows: list[_CandidateRow],
+        summaries: dict[str, np.ndarray],
+        legacy_nice: dict[str, list[tuple[str, np.ndarray]]],
+    ) -> dict[str, float]:
+        """Calculate nice scores, one matrix product per group of candidates of a job."""
+        groups: dict[tuple[str, ...], list[str]] = {}
+        scores: dict[str, float] = {}
+
+        for row in rows:
+            if row.candidate_id not in summaries:
+                scores[row.candidate_id] = 0.0
+                continue
+            nice_texts = tuple(
+                nice_req["text"]
+                for nice_req in row.job_requirements.get("nice", [])
+                if nice_req.get("text")
+            )
+            groups.setdefault(nice_texts, []).append(row.candidate_id)
+
+        for nice_texts, candidate_ids in groups.items():
+            nice_matrix = await self._get_nice_matrix(nice_texts) if nice_texts else None
+            if nice_matrix is None:
+                # Candidates embedded before the shared embedding cache existed
+                for candidate_id in candidate_ids:
+                    scores[candidate_id] = self.profile.nice_scorer.calculate(
+                        summaries[candidate_id], legacy_nice.get(candidate_id, [])
+                    )
+                continue
+
+            candidate_matrix = np.vstack([summaries[cid] for cid in candidate_ids])
+            batch_scores = self.profile.nice_scorer.calculate_batch(candidate_matrix, nice_matrix)
+            scores.update(zip(candidate_ids, (float(score) for score in batch_scores)))
+
+        return scores
+
+
+async def claim_rescore_run() -> RescoreRun | None:
+    """Claim the oldest pending rescore run, or take over one whose lease expired.
+
+    Nothing is claimed while another worker holds a live lease on a run,
+    so runs for different config versions are not applied at once.
+    """
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        running = await db.execute(
+            select(RescoreRun.run_id)
+            .where(
+                RescoreRun.status == RescoreStatus.RUNNING.value,
+                RescoreRun.leased_until >= now,
+            )
+            .limit(1)
+        )
+        if running.first():
+            return None
+
+        stmt = (
+            select(RescoreRun)
+            .where(
+                or_(
+                    RescoreRun.status == RescoreStatus.PENDING.value,
+                    and_(
+                        RescoreRun.status == RescoreStatus.RUNNING.value,
+                        or_(RescoreRun.leased_until.is_(None), RescoreRun.leased_until < now),
+                    ),
+                )
+            )
+            .order_by(RescoreRun.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(stmt)
+        run = result.scalar_one_or_none()
+        if run:
+            if run.status == RescoreStatus.RUNNING.value:
+                logger.warning(
+                    f"Lease on rescore run {run.run_id} held by {run.worker_id} expired, "
+                    "taking it over"
+                )
+            run.status = RescoreStatus.RUNNING.value
+            run.worker_id = WORKER_ID
+            run.leased_until = lease_expiry(now)
+            run.started_at = now
+            run.processed = 0
+            await db.commit()
+            # A new run usually means a new score config was just published
+            score_config_cache.invalidate()
+        return run
+
+
+async def process_rescore_run(run_id: str, stopping: asyncio.Event | None = None) -> None:
+    """Run a claimed rescore run to completion and record its outcome.
+
+    The outcome is only recorded while this worker still holds the run.
+    """
+    async with AsyncSessionLocal() as db:
+        run = await db.get(RescoreRun, run_id)
+        if not run:
+            return
+
+        try:
+            profile = await score_config_cache.get_version(db, run.score_config_version)
+            engine = RescoringEngine(db, profile)
+            completed = await engine.run(run, stopping)
+
+            if completed:
+                values = {"status": RescoreStatus.DONE.value, "finished_at": datetime.utcnow()}
+                logger.info(f"Rescore run {run.run_id} completed ({run.processed} candidates)")
+            else:
+                # Scores are recomputed idempotently, so the next worker restarts the run
+                values = {"status": RescoreStatus.PENDING.value}
+                logger.info(f"Rescore run {run.run_id} interrupted, returned to pending")
+            await db.execute(
+                update(RescoreRun)
+                .where(owned_run(run_id))
+                .values(worker_id=None, leased_until=None, **values)
+            )
+            await db.commit()
+
+        except RescoreRunLostError as e:
+            logger.warning(str(e))
+
+        except Exception as e:
+            logger.error(f"Rescore run {run_id} failed: {e}")
+            await db.rollback()
+            await db.execute(
+                update(RescoreRun)
+                .where(owned_run(run_id))
+                .values(
+                    status=RescoreStatus.FAILED.value,
+                    last_error=str(e)[:1000],
+                    finished_at=datetime.utcnow(),
+                    worker_id=None,
+                    leased_until=None,
+                )
+            )
+            await db.commit()
+
+
+async def run_rescoring_loop(stopping: asyncio.Event) -> None:
+    """Poll for pending rescore runs until ``stopping`` is set."""
+    while not stopping.is_set():
+        try:
+            run = await claim_rescore_run()
+            if run:
+                logger.info(
+                    f"Starting rescore run {run.run_id} (config v{run.score_config_version})"
+                )
+                await process_rescore_run(run.run_id, stopping)
+                continue
+        except Exception as e:
+            logger.error(f"Error in rescoring loop: {e}")
+
+        try:
+            await asyncio.wait_for(stopping.wait(), timeout=settings.poll_interval)
+        except TimeoutError:
+            pass
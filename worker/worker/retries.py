@@ -0,0 +1,53 @@
+"""Retry policy for failed queue jobs.
+
+Failures caused by the environment (OpenAI rate limits and outages,
+network timeouts, DB connection drops, a parsing process that died) are
+retried automatically after a jittered exponential backoff. Anything
+else, such as a malformed document or a bug, fails the job at once since
+retrying would fail the same way.
+"""
+
+import random
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+
+import openai
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from worker.config import get_settings
+
+settings = get_settings()
+
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError,
+    TimeoutError,
+    ConnectionError,
+    # Only the process that died is replaced; the document may parse on retry
+    BrokenProcessPool,
+)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Check whether a job that failed with ``error`` may succeed if retried."""
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    # Lost connections and deadlocks, not e.g. constraint violations
+    if isinstance(error, OperationalError):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+def backoff_delay(attempts: int) -> timedelta:
+    """Get the delay before retrying a job that has been attempted ``attempts`` times.
+
+    The delay doubles per attempt up to ``settings.retry_backoff_max``, and
+    a random half of it is jittered so that jobs failing together (e.g. on
+    one rate-limit spike) are not all retried at the same moment.
+    """
+    seconds = min(
+        settings.retry_backoff_base * 2 ** max(attempts - 1, 0),
+        settings.retry_backoff_max,
+    )
+    return timedelta(seconds=seconds / 2 + random.uniform(0, seconds / 2))
@@ -0,0 +1,209 @@
+"""Concurrent job scheduler with per-job-type concurrency limits."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from worker.models import JobsQueue
+
+logger = logging.getLogger(__name__)
+
+ClaimFn = Callable[[str, int], Awaitable[list[JobsQueue]]]
+# Returns the next job of the same candidate if it was claimed to be run right away
+ProcessFn = Callable[[JobsQueue], Awaitable[JobsQueue | None]]
+
+
+class JobScheduler:
+    """Keep several queue jobs in flight, bounded separately for each job type.
+
+    Every pipeline stage is I/O-bound (OpenAI calls, disk, DB), so a single
+    worker process can run many stages at once. Each job type gets its own
+    slot limit so that, for example, a burst of cheap SCORE jobs cannot starve
+    the LLM stages or exceed the OpenAI rate budget.
+
+    A job may hand over directly to the next pipeline stage: ``process``
+    reserves a slot for the next job type with ``reserve()`` and returns the
+    next job, which then runs in the same task without going through the
+    queue poll.
+
+    While the queue is empty the scheduler polls with exponential backoff,
+    from ``min_poll_interval`` up to ``poll_interval``, and polls again
+    immediately when the ``wakeup`` event is set.
+    """
+
+    def __init__(
+        self,
+        claim: ClaimFn,
+        process: ProcessFn,
+        limits: dict[str, int],
+        poll_interval: float,
+        shutdown_timeout: float | None = None,
+        wakeup: asyncio.Event | None = None,
+        min_poll_interval: float | None = None,
+    ):
+        self.claim = claim
+        self.process = process
+        self.limits = {job_type: limit for job_type, limit in limits.items() if limit > 0}
+        self.poll_interval = poll_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.wakeup = wakeup
+        self.min_poll_interval = min(min_poll_interval or poll_interval, poll_interval)
+        self._idle_interval = self.min_poll_interval
+
+        self._running: dict[str, int] = {job_type: 0 for job_type in self.limits}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._job_ids: set[str] = set()
+        self._stopping = asyncio.Event()
+        self._slot_freed = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently being processed."""
+        return len(self._tasks)
+
+    @property
+    def in_flight_ids(self) -> frozenset[str]:
+        """Queue IDs of the jobs currently being processed."""
+        return frozenset(self._job_ids)
+
+    def free_slots(self, job_type: str) -> int:
+        """Number of additional jobs of a type that may be started now."""
+        return self.limits.get(job_type, 0) - self._running.get(job_type, 0)
+
+    def reserve(self, job_type: str) -> bool:
+        """Take a slot for a job that will be continued in-process.
+
+        Returns:
+            False if the type has no free slot or the scheduler is stopping
+        """
+        if self._stopping.is_set() or self.free_slots(job_type) <= 0:
+            return False
+        self._running[job_type] += 1
+        return True
+
+    def release(self, job_type: str) -> None:
+        """Give back a slot taken with reserve() that will not be used."""
+        self._running[job_type] -= 1
+        self._slot_freed.set()
+
+    def stop(self) -> None:
+        """Stop claiming new jobs; in-flight jobs are allowed to finish."""
+        if not self._stopping.is_set():
+            logger.info(f"Shutdown requested, draining {self.in_flight} in-flight job(s)")
+            self._stopping.set()
+
+    async def run(self) -> None:
+        """Claim and dispatch jobs until stop() is called, then drain."""
+        while not self._stopping.is_set():
+            if self.wakeup is not None:
+                # Wakeups sent from now on may be for jobs this claim misses
+                self.wakeup.clear()
+            try:
+                started = await self._fill_slots()
+            except Exception as e:
+                logger.error(f"Error in scheduler loop: {e}")
+                await self._idle()
+                continue
+
+            if started:
+                self._idle_interval = self.min_poll_interval
+                continue
+
+            if any(self.free_slots(job_type) > 0 for job_type in self.limits):
+                # Queue is empty for every type with spare capacity
+                await self._idle()
+            else:
+                # All slots busy; wake up as soon as one is released
+                await self._wait_for_slot()
+
+        await self._drain()
+
+    async def _fill_slots(self) -> int:
+        """Claim jobs for every type with free capacity and start them."""
+        started = 0
+        for job_type in self.limits:
+            while not self._stopping.is_set():
+                free = self.free_slots(job_type)
+                if free <= 0:
+                    break
+                jobs = await self.claim(job_type, free)
+                if not jobs:
+                    break
+                for job in jobs:
+                    self._start(job)
+                    started += 1
+        return started
+
+    def _start(self, job: JobsQueue) -> None:
+        """Run a claimed job in its own task."""
+        self._running[job.job_type] = self._running.get(job.job_type, 0) + 1
+        task = asyncio.create_task(self._run_job(job), name=f"job-{job.queue_id}")
+        self._tasks.add(task)
+
+    async def _run_job(self, job: JobsQueue) -> None:
+        current: JobsQueue | None = job
+        try:
+            while current is not None:
+                next_job = None
+                self._job_ids.add(current.queue_id)
+                try:
+                    next_job = await self.process(current)
+                except Exception as e:
+                    # process_job handles its own failures; this is a last-resort guard
+                    logger.error(f"Unhandled error while processing job {current.queue_id}: {e}")
+                finally:
+                    self._job_ids.discard(current.queue_id)
+                    self.release(current.job_type)
+                # The next job's slot was reserved by process()
+                current = next_job
+        finally:
+            self._tasks.discard(asyncio.current_task())  # type: ignore[arg-type]
+
+    async def _idle(self) -> None:
+        """Wait before polling again, waking early on a wakeup or shutdown.
+
+        Each wait without a wakeup doubles the next one, up to poll_interval.
+        """
+        events = [self._stopping] + ([self.wakeup] if self.wakeup is not None else [])
+        waiters = {asyncio.create_task(event.wait()) for event in events}
+        try:
+            done, _ = await asyncio.wait(
+                waiters, timeout=self._idle_interval, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+        if done:
+            self._idle_interval = self.min_poll_interval
+        else:
+            self._idle_interval = min(self._idle_interval * 2, self.poll_interval)
+
+    async def _wait_for_slot(self) -> None:
+        """Wait until an in-flight job finishes or shutdown is requested."""
+        self._slot_freed.clear()
+        stop_waiter = asyncio.create_task(self._stopping.wait())
+        slot_waiter = asyncio.create_task(self._slot_freed.wait())
+        try:
+            await asyncio.wait({stop_waiter, slot_waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_waiter.cancel()
+            slot_waiter.cancel()
+
+    async def _drain(self) -> None:
+        """Wait for in-flight jobs, cancelling them after the shutdown timeout."""
+        if not self._tasks:
+            logger.info("Scheduler stopped")
+            return
+
+        pending = set(self._tasks)
+        done, pending = await asyncio.wait(pending, timeout=self.shutdown_timeout)
+        if pending:
+            logger.warning(
+                f"Shutdown timeout ({self.shutdown_timeout}s) reached, "
+                f"cancelling {len(pending)} job(s)"
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        logger.info("Scheduler stopped")
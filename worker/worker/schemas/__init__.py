@@ -1,7 +1,9 @@
 from worker.schemas.extraction_schema import (
+    CandidateExtractionResult,
     CandidateProfile,
     Evidence,
     ExtractionResult,
+    JobExtractionResult,
     JobRequirements,
     MustRequirement,
     NiceRequirement,
@@ -10,6 +12,8 @@ from worker.schemas.explanation_schema import ExplanationResult
 
 __all__ = [
     "ExtractionResult",
+    "JobExtractionResult",
+    "CandidateExtractionResult",
     "JobRequirements",
     "CandidateProfile",
     "Evidence",
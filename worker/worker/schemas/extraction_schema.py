@@ -48,6 +48,36 @@ class Evidence(BaseModel):
     candidate: dict[str, str] = Field(default_factory=dict)
 
 
+class JobExtractionResult(BaseModel):
+    """Job requirements extracted from a job posting alone."""
+
+    job_requirements: JobRequirements
+    evidence: dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "JobExtractionResult":
+        """Create from raw dictionary (LLM output)."""
+        return cls(
+            job_requirements=JobRequirements(**data.get("job_requirements", {})),
+            evidence=data.get("evidence", {}).get("job", {}),
+        )
+
+
+class CandidateExtractionResult(BaseModel):
+    """Candidate profile extracted from a resume against known job requirements."""
+
+    candidate_profile: CandidateProfile
+    evidence: dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CandidateExtractionResult":
+        """Create from raw dictionary (LLM output)."""
+        return cls(
+            candidate_profile=CandidateProfile(**data.get("candidate_profile", {})),
+            evidence=data.get("evidence", {}).get("candidate", {}),
+        )
+
+
 class ExtractionResult(BaseModel):
     """Complete extraction result from LLM."""
 
@@ -0,0 +1,87 @@
+"""In-process cache of the active score config."""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from worker.config import get_settings
+from worker.models import ScoreConfig
+from worker.scorers.scoring_profile import ScoringProfile
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class ScoreConfigCache:
+    """Cache scoring profiles per score config version.
+
+    The latest version number is re-checked at most once per ``ttl``
+    seconds with a cheap ``SELECT MAX(version)``; the full config row is
+    only loaded, and the scorers only rebuilt, when the version changes.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._profiles: dict[int, ScoringProfile] = {}
+        self._latest_version: int | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Force a version check on the next lookup."""
+        self._checked_at = 0.0
+
+    async def get_latest(self, db: AsyncSession) -> ScoringProfile:
+        """Get the profile for the latest score config version."""
+        if self._is_fresh():
+            return self._profiles[self._latest_version]  # type: ignore[index]
+
+        async with self._lock:
+            # Another task may have refreshed while we waited
+            if self._is_fresh():
+                return self._profiles[self._latest_version]  # type: ignore[index]
+
+            result = await db.execute(select(func.max(ScoreConfig.version)))
+            version = result.scalar_one_or_none()
+            if version is None:
+                raise ValueError("No score config found")
+
+            profile = await self._get_version_locked(db, version)
+            if version != self._latest_version:
+                logger.info(f"Using score config version {version}")
+            self._latest_version = version
+            self._checked_at = time.monotonic()
+            return profile
+
+    async def get_version(self, db: AsyncSession, version: int) -> ScoringProfile:
+        """Get the profile for a specific score config version."""
+        profile = self._profiles.get(version)
+        if profile:
+            return profile
+        async with self._lock:
+            return await self._get_version_locked(db, version)
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._latest_version is not None
+            and time.monotonic() - self._checked_at < self.ttl
+        )
+
+    async def _get_version_locked(self, db: AsyncSession, version: int) -> ScoringProfile:
+        profile = self._profiles.get(version)
+        if profile:
+            return profile
+
+        config = await db.get(ScoreConfig, version)
+        if not config:
+            raise ValueError(f"Score config version {version} not found")
+
+        profile = ScoringProfile.from_config(config)
+        self._profiles[version] = profile
+        return profile
+
+
+score_config_cache = ScoreConfigCache(ttl=settings.score_config_ttl)
@@ -1,6 +1,7 @@
 from worker.scorers.must_scorer import MustScorer
 from worker.scorers.nice_scorer import NiceScorer
 from worker.scorers.role_scorer import RoleScorer
+from worker.scorers.scoring_profile import ScoringProfile
 from worker.scorers.total_fit_calculator import TotalFitCalculator
 from worker.scorers.year_scorer import YearScorer
 
@@ -10,4 +11,5 @@ __all__ = [
     "RoleScorer",
     "NiceScorer",
     "TotalFitCalculator",
+    "ScoringProfile",
 ]
@@ -1,23 +1,47 @@
 """Nice-to-have requirements scorer using embeddings."""
 
 import logging
-from typing import Any
+from collections.abc import Sequence
 
-from worker.clients.embedding_client import EmbeddingClient
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length; all-zero rows are left as zeros."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
 class NiceScorer:
     """Calculate Nice score using embedding similarity."""
 
     def __init__(self, top_n: int = 3):
         self.top_n = top_n
 
+    @staticmethod
+    def build_matrix(
+        nice_embeddings: list[tuple[str, Sequence[float] | np.ndarray]],
+    ) -> np.ndarray:
+        """Stack nice requirement vectors into a row-normalized matrix.
+
+        Build this once per job and reuse it for every candidate.
+
+        Args:
+            nice_embeddings: List of (nice_id, embedding) tuples
+
+        Returns:
+            float32 matrix of shape (n_requirements, dim)
+        """
+        matrix = np.asarray([vector for _, vector in nice_embeddings], dtype=np.float32)
+        return normalize_rows(matrix)
+
     def calculate(
         self,
-        candidate_embedding: list[float] | None,
-        nice_embeddings: list[tuple[str, list[float]]],
+        candidate_embedding: Sequence[float] | np.ndarray | None,
+        nice_embeddings: list[tuple[str, Sequence[float] | np.ndarray]],
     ) -> float:
         """Calculate Nice score using cosine similarity.
 
@@ -28,32 +52,44 @@ class NiceScorer:
         Returns:
             Score between 0 and 1
         """
-        if not candidate_embedding or not nice_embeddings:
+        if candidate_embedding is None or len(candidate_embedding) == 0 or not nice_embeddings:
             logger.info("No embeddings available for Nice score, returning 0")
             return 0.0
 
-        # Calculate similarities
-        similarities = []
-        for nice_id, nice_vector in nice_embeddings:
-            sim = EmbeddingClient.cosine_similarity(candidate_embedding, nice_vector)
-            similarities.append((nice_id, sim))
+        nice_matrix = self.build_matrix(nice_embeddings)
+        candidates = np.asarray(candidate_embedding, dtype=np.float32)[np.newaxis, :]
+        score = float(self.calculate_batch(candidates, nice_matrix)[0])
 
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        logger.info(
+            f"Nice score: {score:.2f} (top {min(self.top_n, len(nice_embeddings))} similarities)"
+        )
+        return score
 
-        # Take top N
-        top_similarities = similarities[: self.top_n]
+    def calculate_batch(self, candidate_matrix: np.ndarray, nice_matrix: np.ndarray) -> np.ndarray:
+        """Calculate Nice scores for many candidates against one job.
 
-        if not top_similarities:
-            return 0.0
+        Args:
+            candidate_matrix: Candidate summary vectors, shape (n_candidates, dim)
+            nice_matrix: Row-normalized matrix from build_matrix, shape (n_requirements, dim)
 
-        # Average of top N
-        score = sum(sim for _, sim in top_similarities) / len(top_similarities)
+        Returns:
+            Scores between 0 and 1, shape (n_candidates,)
+        """
+        n_candidates = candidate_matrix.shape[0]
+        n_requirements = nice_matrix.shape[0]
+        top_n = min(self.top_n, n_requirements)
+        if n_candidates == 0 or top_n <= 0:
+            return np.zeros(n_candidates)
+
+        # Cosine similarities of every candidate to every requirement
+        candidates = normalize_rows(np.asarray(candidate_matrix, dtype=np.float32))
+        similarities = candidates @ nice_matrix.T
+
+        # Average of top N per candidate (order within the top N is irrelevant)
+        if top_n < n_requirements:
+            top_idx = np.argpartition(similarities, n_requirements - top_n, axis=1)[:, -top_n:]
+            similarities = np.take_along_axis(similarities, top_idx, axis=1)
+        mean = similarities.astype(np.float64).mean(axis=1)
 
         # Normalize to 0-1 range (cosine similarity can be negative)
-        score = max(0.0, min(1.0, (score + 1) / 2))
-
-        logger.info(
-            f"Nice score: {score:.2f} (top {len(top_similarities)} similarities)"
-        )
-        return score
+        return np.clip((mean + 1) / 2, 0.0, 1.0)
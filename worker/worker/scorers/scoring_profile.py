@@ -0,0 +1,79 @@
+"""Scorers configured for one score config version."""
+
+import copy
+from dataclasses import dataclass
+from typing import Any
+
+from worker.models import ScoreConfig
+from worker.scorers.must_scorer import MustScorer
+from worker.scorers.nice_scorer import NiceScorer
+from worker.scorers.role_scorer import RoleScorer
+from worker.scorers.total_fit_calculator import TotalFitCalculator
+from worker.scorers.year_scorer import YearScorer
+
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """Scorers built once for a score config version.
+
+    Profiles are never mutated after construction, so concurrent scoring
+    tasks can share one instance.
+    """
+
+    version: int
+    must_scorer: MustScorer
+    year_scorer: YearScorer
+    role_scorer: RoleScorer
+    nice_scorer: NiceScorer
+    calculator: TotalFitCalculator
+
+    @classmethod
+    def from_config(cls, config: ScoreConfig) -> "ScoringProfile":
+        """Build a profile from a score config row."""
+        return cls(
+            version=config.version,
+            must_scorer=MustScorer(),
+            year_scorer=YearScorer(),
+            role_scorer=RoleScorer(role_distance=copy.deepcopy(config.role_distance_json)),
+            nice_scorer=NiceScorer(top_n=config.nice_top_n),
+            calculator=TotalFitCalculator(
+                weights=dict(config.weights_json),
+                must_cap_enabled=config.must_cap_enabled,
+                must_cap_value=config.must_cap_value,
+            ),
+        )
+
+    def calculate(
+        self,
+        job_requirements: dict[str, Any],
+        candidate_profile: dict[str, Any],
+        nice_score: float,
+    ) -> dict[str, Any]:
+        """Calculate must/year/role scores and the total fit.
+
+        Args:
+            job_requirements: Extracted job requirements
+            candidate_profile: Extracted candidate profile
+            nice_score: Nice score computed from embeddings
+
+        Returns:
+            Score results dictionary
+        """
+        must_score, must_gaps = self.must_scorer.calculate(job_requirements, candidate_profile)
+        year_score = self.year_scorer.calculate(job_requirements, candidate_profile)
+        role_score = self.role_scorer.calculate(job_requirements, candidate_profile)
+        total_fit = self.calculator.calculate(
+            must_score=must_score,
+            nice_score=nice_score,
+            year_score=year_score,
+            role_score=role_score,
+            has_must_gaps=len(must_gaps) > 0,
+        )
+        return {
+            "must_score": must_score,
+            "nice_score": nice_score,
+            "year_score": year_score,
+            "role_score": role_score,
+            "total_fit_0_100": total_fit,
+            "must_gaps": must_gaps,
+        }
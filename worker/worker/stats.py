@@ -0,0 +1,55 @@
+"""Dashboard statistics counters.
+
+The API keeps a count of candidates per status in ``stats_counters`` (see
+the backend's StatsRepository). Status changes made by the worker go
+through ``set_candidate_status`` so the counters move in the same
+transaction.
+"""
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from worker.models import Candidate, CandidateStatus, StatsCounter
+
+
+def status_counter(status: str) -> str:
+    """Get the counter name for candidates with a status."""
+    return f"status:{status}"
+
+
+async def set_candidate_status(
+    db: AsyncSession,
+    candidate_id: str,
+    status: CandidateStatus,
+    error_message: str | None = None,
+) -> bool:
+    """Update a candidate's status and the status counters, without committing.
+
+    Returns:
+        False if the candidate does not exist
+    """
+    result = await db.execute(
+        select(Candidate.status).where(Candidate.candidate_id == candidate_id).with_for_update()
+    )
+    old_status = result.scalar_one_or_none()
+    if old_status is None:
+        return False
+
+    values = {"status": status.value}
+    if error_message is not None:
+        values["error_message"] = error_message
+    await db.execute(
+        update(Candidate).where(Candidate.candidate_id == candidate_id).values(**values)
+    )
+
+    if old_status != status.value:
+        # Same row order as the API to avoid deadlocks
+        for name, delta in sorted(
+            {status_counter(old_status): -1, status_counter(status.value): 1}.items()
+        ):
+            await db.execute(
+                update(StatsCounter)
+                .where(StatsCounter.name == name)
+                .values(value=StatsCounter.value + delta)
+            )
+    return True
@@ -1,9 +1,12 @@
+import json
+import os
 import uuid
 from pathlib import Path
 
 import aiofiles
 
 from worker.config import get_settings
+from worker.text_artifact import ZSTD_SUFFIX, CandidateText
 
 settings = get_settings()
 
@@ -37,6 +40,89 @@ class StorageService:
             await f.write(content)
         return f"text/{filename}"
 
+    @staticmethod
+    def text_cache_uri(file_hash: str, extractor_version: str) -> str:
+        """Get the URI of the cached text for a raw file hash and extractor version."""
+        return f"text/{file_hash[:2]}/{file_hash[2:4]}/{file_hash}.{extractor_version}.txt"
+
+    def exists(self, uri: str) -> bool:
+        """Check whether a file exists."""
+        return (self.base_path / uri).is_file()
+
+    @staticmethod
+    def page_index_uri(text_uri: str) -> str:
+        """Get the URI of the page offsets stored next to a text file."""
+        return text_uri.removesuffix(".txt") + ".pages.json"
+
+    async def save_text_cache(
+        self,
+        content: str,
+        file_hash: str,
+        extractor_version: str,
+        pages: list[dict] | None = None,
+    ) -> str:
+        """Save extracted text under its content-addressed URI and return the URI.
+
+        The text is written to a temporary file and renamed into place, so
+        concurrent workers extracting the same file never see partial text.
+        Page offsets, if any, are saved next to it as ``.pages.json``.
+        """
+        uri = self.text_cache_uri(file_hash, extractor_version)
+        if pages:
+            await self._write_atomic(self.page_index_uri(uri), json.dumps(pages))
+        await self._write_atomic(uri, content)
+        return uri
+
+    async def read_page_index(self, text_uri: str) -> list[dict]:
+        """Read the page offsets of a text file; empty if it has none."""
+        uri = self.page_index_uri(text_uri)
+        if not self.exists(uri):
+            return []
+        return json.loads(await self.read_text_file(uri))
+
+    @staticmethod
+    def candidate_text_uri(job_id: str, candidate_id: str, compressed: bool = False) -> str:
+        """Get the URI of a candidate's text artifact."""
+        suffix = ".json" + (ZSTD_SUFFIX if compressed else "")
+        return f"text/candidates/{job_id}/{candidate_id}{suffix}"
+
+    async def save_candidate_text(
+        self, job_id: str, candidate_id: str, artifact: CandidateText, compress: bool = False
+    ) -> str:
+        """Save a candidate's text artifact, replacing any previous one, and return its URI."""
+        uri = self.candidate_text_uri(job_id, candidate_id, compress)
+        await self._write_atomic(uri, artifact.to_bytes(compress))
+
+        # Drop an artifact written with the other compression setting
+        other = self.base_path / self.candidate_text_uri(job_id, candidate_id, not compress)
+        other.unlink(missing_ok=True)
+        return uri
+
+    async def read_candidate_text(self, job_id: str, candidate_id: str) -> CandidateText | None:
+        """Read a candidate's text artifact, or None if it has not been written."""
+        for compressed in (False, True):
+            filepath = self.base_path / self.candidate_text_uri(job_id, candidate_id, compressed)
+            if filepath.is_file():
+                async with aiofiles.open(filepath, "rb") as f:
+                    return CandidateText.from_bytes(await f.read(), compressed)
+        return None
+
+    async def _write_atomic(self, uri: str, content: str | bytes) -> None:
+        filepath = self.base_path / uri
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = filepath.with_name(f".{uuid.uuid4()}.tmp")
+        try:
+            if isinstance(content, bytes):
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    await f.write(content)
+            else:
+                async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
+                    await f.write(content)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     async def read_text_file(self, uri: str) -> str:
         """Read a text file by its URI."""
         filepath = self.base_path / uri
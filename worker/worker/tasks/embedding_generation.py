@@ -2,14 +2,19 @@ import logging
 import uuid
 from typing import Any
 
+import numpy as np
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from worker.clients.embedding_client import EmbeddingClient, get_embedding_client
+from worker.config import get_settings
+from worker.embedding_cache import EmbeddingCacheService
 from worker.models import Embedding, EmbeddingKind, Extraction
 from worker.schemas.extraction_schema import ExtractionResult
+from worker.vector_codec import encode_vector
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
 class EmbeddingGenerationTask:
@@ -22,10 +27,15 @@ class EmbeddingGenerationTask:
     ):
         self.db = db
         self.embedding_client = embedding_client or get_embedding_client()
+        self.cache = EmbeddingCacheService(db, self.embedding_client)
 
     async def execute(self, candidate_id: str) -> list[str]:
         """Generate embeddings for candidate and nice requirements.
 
+        The candidate summary vector is stored per candidate. Nice requirement
+        vectors only live in the shared embedding cache, since every candidate
+        of a job has the same nice requirements.
+
         Args:
             candidate_id: Candidate ID to process
 
@@ -42,38 +52,26 @@ class EmbeddingGenerationTask:
 
         embedding_ids = []
 
-        # Generate candidate summary embedding
+        # Embed the candidate summary and the job's nice requirements in one
+        # batched request; nice requirement vectors usually come from the cache
         candidate_text = self._build_candidate_text(extraction)
+        nice_texts = self._get_nice_texts(extraction)
+        texts = ([candidate_text] if candidate_text else []) + nice_texts
+        vectors = await self.cache.get_or_create_many(texts) if texts else {}
+
         if candidate_text:
-            candidate_vector = await self.embedding_client.create_embedding(candidate_text)
             embedding_id = await self._save_embedding(
                 candidate_id=candidate_id,
                 kind=EmbeddingKind.CANDIDATE_SUMMARY,
                 ref_id=None,
-                vector=candidate_vector,
+                vector=vectors[candidate_text],
             )
             embedding_ids.append(embedding_id)
 
-        # Generate nice requirement embeddings
-        job_requirements = extraction.job_requirements_json or {}
-        nice_requirements = job_requirements.get("nice", [])
-
-        for nice_req in nice_requirements:
-            nice_text = nice_req.get("text", "")
-            if nice_text:
-                nice_vector = await self.embedding_client.create_embedding(nice_text)
-                embedding_id = await self._save_embedding(
-                    candidate_id=candidate_id,
-                    kind=EmbeddingKind.NICE_REQ,
-                    ref_id=nice_req.get("id"),
-                    vector=nice_vector,
-                )
-                embedding_ids.append(embedding_id)
-
         await self.db.commit()
         logger.info(
             f"Embedding generation completed for candidate {candidate_id}: "
-            f"{len(embedding_ids)} embeddings created"
+            f"{len(embedding_ids)} embeddings created, {len(nice_texts)} nice requirement(s) cached"
         )
         return embedding_ids
 
@@ -91,6 +89,15 @@ class EmbeddingGenerationTask:
         stmt = delete(Embedding).where(Embedding.candidate_id == candidate_id)
         await self.db.execute(stmt)
 
+    def _get_nice_texts(self, extraction: Extraction) -> list[str]:
+        """Get non-empty nice requirement texts."""
+        job_requirements = extraction.job_requirements_json or {}
+        return [
+            nice_req["text"]
+            for nice_req in job_requirements.get("nice", [])
+            if nice_req.get("text")
+        ]
+
     def _build_candidate_text(self, extraction: Extraction) -> str:
         """Build text for candidate summary embedding."""
         profile = extraction.candidate_profile_json or {}
@@ -118,16 +125,19 @@ class EmbeddingGenerationTask:
         candidate_id: str,
         kind: EmbeddingKind,
         ref_id: str | None,
-        vector: list[float],
+        vector: np.ndarray,
     ) -> str:
         """Save embedding to database."""
         embedding_id = str(uuid.uuid4())
+        blob, dim, dtype = encode_vector(vector, settings.embedding_storage_dtype)
         embedding = Embedding(
             embedding_id=embedding_id,
             candidate_id=candidate_id,
             kind=kind.value,
             ref_id=ref_id,
-            vector=vector,
+            vector_blob=blob,
+            vector_dim=dim,
+            vector_dtype=dtype,
         )
         self.db.add(embedding)
         return embedding_id
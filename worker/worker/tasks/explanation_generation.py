@@ -5,9 +5,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from worker.clients.openai_client import OpenAIClient, get_openai_client
-from worker.models import Candidate, CandidateStatus, Explanation, Extraction, Score
+from worker.models import CandidateStatus, Explanation, Extraction, Score
 from worker.prompts.explanation_prompt import ExplanationPrompt
 from worker.schemas.explanation_schema import ExplanationResult
+from worker.stats import set_candidate_status
 
 logger = logging.getLogger(__name__)
 
@@ -124,9 +125,5 @@ class ExplanationGenerationTask:
         self, candidate_id: str, status: CandidateStatus
     ) -> None:
         """Update candidate status."""
-        stmt = select(Candidate).where(Candidate.candidate_id == candidate_id)
-        result = await self.db.execute(stmt)
-        candidate = result.scalar_one_or_none()
-        if candidate:
-            candidate.status = status.value
+        if await set_candidate_status(self.db, candidate_id, status):
             await self.db.commit()
@@ -1,19 +1,41 @@
+import asyncio
+import hashlib
 import logging
-from typing import Any
+import weakref
 
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from worker.clients.openai_client import OpenAIClient, get_openai_client
 from worker.config import get_settings
-from worker.models import Candidate, Document, Extraction, Job
-from worker.prompts.extraction_prompt import ExtractionPrompt
-from worker.schemas.extraction_schema import ExtractionResult
+from worker.models import Candidate, Document, Extraction, Job, JobExtraction
+from worker.prompts.extraction_prompt import ExtractionPrompt, JobRequirementsPrompt
+from worker.schemas.extraction_schema import (
+    CandidateExtractionResult,
+    Evidence,
+    ExtractionResult,
+    JobExtractionResult,
+    JobRequirements,
+)
 from worker.storage import StorageService
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+EXTRACT_VERSION = "v2"
+
+# One lock per (job_id, job_text_hash, llm_model) so that concurrent candidate
+# jobs for the same posting wait for a single job-requirements extraction.
+_job_extraction_locks: "weakref.WeakValueDictionary[tuple[str, str, str], asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def hash_job_text(job_text: str) -> str:
+    """Return the SHA-256 hex digest of a job text."""
+    return hashlib.sha256(job_text.encode("utf-8")).hexdigest()
+
 
 class LLMExtractionTask:
     """Task for extracting structured data using LLM."""
@@ -41,14 +63,19 @@ class LLMExtractionTask:
 
         # Get candidate and job
         candidate = await self._get_candidate(candidate_id)
-        job = await self._get_job(candidate.job_id)
+        job_id = candidate.job_id
+        job = await self._get_job(job_id)
+
+        # Job requirements are extracted once per job text and shared. This may
+        # commit or roll back, which expires the candidate and job loaded above.
+        job_extraction = await self._get_job_extraction(job)
 
         # Get extracted text from documents
-        resume_text = await self._get_extracted_text(candidate_id)
+        resume_text = await self._get_extracted_text(job_id, candidate_id)
 
-        # Call LLM for extraction
+        # Call LLM for candidate extraction against the cached requirements
         user_prompt = ExtractionPrompt.format_user_prompt(
-            job_text=job.job_text_raw,
+            job_requirements=job_extraction.job_requirements.model_dump(),
             resume_text=resume_text,
         )
 
@@ -59,7 +86,15 @@ class LLMExtractionTask:
         )
 
         # Parse and validate result
-        extraction = ExtractionResult.from_dict(result_dict)
+        candidate_extraction = CandidateExtractionResult.from_dict(result_dict)
+        extraction = ExtractionResult(
+            job_requirements=job_extraction.job_requirements,
+            candidate_profile=candidate_extraction.candidate_profile,
+            evidence=Evidence(
+                job=job_extraction.evidence,
+                candidate=candidate_extraction.evidence,
+            ),
+        )
 
         # Save to database
         await self._save_extraction(candidate_id, extraction)
@@ -85,8 +120,95 @@ class LLMExtractionTask:
             raise ValueError(f"Job not found: {job_id}")
         return job
 
-    async def _get_extracted_text(self, candidate_id: str) -> str:
-        """Get combined extracted text for candidate."""
+    async def _get_job_extraction(self, job: Job) -> JobExtractionResult:
+        """Get job requirements for a job, extracting them with the LLM on a cache miss.
+
+        Results are cached in job_extractions keyed by job ID, job text hash
+        and LLM model, so editing the job text or switching models triggers a
+        fresh extraction.
+
+        Args:
+            job: Job whose requirements are needed
+
+        Returns:
+            Job requirements and their supporting evidence
+        """
+        key = (job.job_id, hash_job_text(job.job_text_raw), settings.llm_model)
+
+        cached = await self._load_job_extraction(*key)
+        if cached:
+            return cached
+
+        lock = _job_extraction_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            _job_extraction_locks[key] = lock
+
+        async with lock:
+            # Another task may have finished the extraction while we waited
+            cached = await self._load_job_extraction(*key)
+            if cached:
+                return cached
+
+            logger.info(f"Extracting job requirements for job {job.job_id}")
+            result_dict = await self.openai_client.extract_structured(
+                system_prompt=JobRequirementsPrompt.SYSTEM_PROMPT,
+                user_prompt=JobRequirementsPrompt.format_user_prompt(job.job_text_raw),
+                response_format={"type": "json_object"},
+            )
+            job_extraction = JobExtractionResult.from_dict(result_dict)
+
+            self.db.add(
+                JobExtraction(
+                    job_id=key[0],
+                    job_text_hash=key[1],
+                    llm_model=key[2],
+                    requirements_json=job_extraction.job_requirements.model_dump(),
+                    evidence_json=job_extraction.evidence,
+                    extract_version=EXTRACT_VERSION,
+                )
+            )
+            try:
+                await self.db.commit()
+            except IntegrityError:
+                # Another worker process stored the same extraction first
+                await self.db.rollback()
+                cached = await self._load_job_extraction(*key)
+                if cached:
+                    return cached
+                raise
+
+            return job_extraction
+
+    async def _load_job_extraction(
+        self, job_id: str, job_text_hash: str, llm_model: str
+    ) -> JobExtractionResult | None:
+        """Load a cached job requirements extraction."""
+        stmt = select(JobExtraction).where(
+            JobExtraction.job_id == job_id,
+            JobExtraction.job_text_hash == job_text_hash,
+            JobExtraction.llm_model == llm_model,
+        )
+        result = await self.db.execute(stmt)
+        cached = result.scalar_one_or_none()
+        if not cached:
+            return None
+        return JobExtractionResult(
+            job_requirements=JobRequirements(**(cached.requirements_json or {})),
+            evidence=cached.evidence_json or {},
+        )
+
+    async def _get_extracted_text(self, job_id: str, candidate_id: str) -> str:
+        """Get combined extracted text for candidate.
+
+        Reads the candidate text artifact written by the text stage, falling
+        back to the per-document texts for candidates extracted before the
+        artifact existed.
+        """
+        artifact = await self.storage.read_candidate_text(job_id, candidate_id)
+        if artifact is not None:
+            return artifact.text
+
         stmt = select(Document).where(
             Document.candidate_id == candidate_id,
             Document.text_uri.isnot(None),
@@ -119,7 +241,7 @@ class LLMExtractionTask:
             existing.candidate_profile_json = extraction.candidate_profile.model_dump()
             existing.evidence_json = extraction.evidence.model_dump()
             existing.llm_model = settings.llm_model
-            existing.extract_version = "v1"
+            existing.extract_version = EXTRACT_VERSION
         else:
             new_extraction = Extraction(
                 candidate_id=candidate_id,
@@ -127,7 +249,7 @@ class LLMExtractionTask:
                 candidate_profile_json=extraction.candidate_profile.model_dump(),
                 evidence_json=extraction.evidence.model_dump(),
                 llm_model=settings.llm_model,
-                extract_version="v1",
+                extract_version=EXTRACT_VERSION,
             )
             self.db.add(new_extraction)
 
@@ -1,15 +1,14 @@
 import logging
 from typing import Any
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from worker.models import Embedding, EmbeddingKind, Extraction, Score, ScoreConfig
-from worker.scorers.must_scorer import MustScorer
-from worker.scorers.nice_scorer import NiceScorer
-from worker.scorers.role_scorer import RoleScorer
-from worker.scorers.total_fit_calculator import TotalFitCalculator
-from worker.scorers.year_scorer import YearScorer
+from worker.embedding_cache import EmbeddingCacheService
+from worker.models import Candidate, Embedding, EmbeddingKind, Extraction, Score
+from worker.score_config_cache import ScoreConfigCache, score_config_cache
+from worker.vector_codec import read_vector
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +16,9 @@ logger = logging.getLogger(__name__)
 class ScoreCalculationTask:
     """Task for calculating candidate scores."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, config_cache: ScoreConfigCache | None = None):
         self.db = db
-        self.must_scorer = MustScorer()
-        self.year_scorer = YearScorer()
-        self.role_scorer = RoleScorer()
-        self.nice_scorer = NiceScorer()
+        self.config_cache = config_cache or score_config_cache
 
     async def execute(self, candidate_id: str) -> dict[str, Any]:
         """Calculate all scores for a candidate.
@@ -40,61 +36,32 @@ class ScoreCalculationTask:
         job_requirements = extraction.job_requirements_json or {}
         candidate_profile = extraction.candidate_profile_json or {}
 
-        # Get score config
-        config = await self._get_score_config()
-
-        # Calculate Must score
-        must_score, must_gaps = self.must_scorer.calculate(
-            job_requirements, candidate_profile
-        )
-
-        # Calculate Year score
-        year_score = self.year_scorer.calculate(job_requirements, candidate_profile)
-
-        # Calculate Role score
-        self.role_scorer.role_distance = config.role_distance_json
-        role_score = self.role_scorer.calculate(job_requirements, candidate_profile)
+        # Scorers for the active score config (shared, never mutated)
+        profile = await self.config_cache.get_latest(self.db)
 
         # Calculate Nice score using embeddings
-        self.nice_scorer.top_n = config.nice_top_n
-        candidate_embedding, nice_embeddings = await self._get_embeddings(candidate_id)
-        nice_score = self.nice_scorer.calculate(candidate_embedding, nice_embeddings)
-
-        # Calculate total fit
-        calculator = TotalFitCalculator(
-            weights=config.weights_json,
-            must_cap_enabled=config.must_cap_enabled,
-            must_cap_value=config.must_cap_value,
-        )
-        total_fit = calculator.calculate(
-            must_score=must_score,
-            nice_score=nice_score,
-            year_score=year_score,
-            role_score=role_score,
-            has_must_gaps=len(must_gaps) > 0,
+        candidate_embedding, nice_embeddings = await self._get_embeddings(
+            candidate_id, job_requirements
         )
+        nice_score = profile.nice_scorer.calculate(candidate_embedding, nice_embeddings)
+
+        # Calculate Must/Year/Role scores and total fit
+        scores = profile.calculate(job_requirements, candidate_profile, nice_score)
 
         # Save scores
         await self._save_score(
             candidate_id=candidate_id,
-            must_score=must_score,
+            must_score=scores["must_score"],
             nice_score=nice_score,
-            year_score=year_score,
-            role_score=role_score,
-            total_fit=total_fit,
-            must_gaps=must_gaps,
-            config_version=config.version,
+            year_score=scores["year_score"],
+            role_score=scores["role_score"],
+            total_fit=scores["total_fit_0_100"],
+            must_gaps=scores["must_gaps"],
+            config_version=profile.version,
         )
 
         logger.info(f"Score calculation completed for candidate {candidate_id}")
-        return {
-            "must_score": must_score,
-            "nice_score": nice_score,
-            "year_score": year_score,
-            "role_score": role_score,
-            "total_fit_0_100": total_fit,
-            "must_gaps": must_gaps,
-        }
+        return scores
 
     async def _get_extraction(self, candidate_id: str) -> Extraction:
         """Get extraction for candidate."""
@@ -105,33 +72,46 @@ class ScoreCalculationTask:
             raise ValueError(f"No extraction found for candidate: {candidate_id}")
         return extraction
 
-    async def _get_score_config(self) -> ScoreConfig:
-        """Get latest score config."""
-        stmt = select(ScoreConfig).order_by(ScoreConfig.version.desc()).limit(1)
-        result = await self.db.execute(stmt)
-        config = result.scalar_one_or_none()
-        if not config:
-            raise ValueError("No score config found")
-        return config
-
     async def _get_embeddings(
-        self, candidate_id: str
-    ) -> tuple[list[float] | None, list[tuple[str, list[float]]]]:
-        """Get embeddings for scoring."""
+        self, candidate_id: str, job_requirements: dict[str, Any]
+    ) -> tuple[np.ndarray | None, list[tuple[str, np.ndarray]]]:
+        """Get embeddings for scoring.
+
+        Nice requirement vectors come from the shared embedding cache; per-
+        candidate NICE_REQ rows written before the cache existed are used as
+        a fallback.
+        """
         stmt = select(Embedding).where(Embedding.candidate_id == candidate_id)
         result = await self.db.execute(stmt)
         embeddings = list(result.scalars().all())
 
         candidate_embedding = None
-        nice_embeddings = []
+        legacy_nice_embeddings = []
 
         for emb in embeddings:
+            vector = read_vector(emb.vector_blob, emb.vector_dim, emb.vector_dtype, emb.vector)
+            if vector is None:
+                continue
             if emb.kind == EmbeddingKind.CANDIDATE_SUMMARY.value:
-                candidate_embedding = emb.vector
+                candidate_embedding = vector
             elif emb.kind == EmbeddingKind.NICE_REQ.value:
-                nice_embeddings.append((emb.ref_id, emb.vector))
+                legacy_nice_embeddings.append((emb.ref_id, vector))
+
+        nice_requirements = [
+            nice_req
+            for nice_req in job_requirements.get("nice", [])
+            if nice_req.get("text")
+        ]
+        cached = await EmbeddingCacheService(self.db).lookup_many(
+            [nice_req["text"] for nice_req in nice_requirements]
+        )
+        nice_embeddings = [
+            (nice_req.get("id"), cached[nice_req["text"]])
+            for nice_req in nice_requirements
+            if nice_req["text"] in cached
+        ]
 
-        return candidate_embedding, nice_embeddings
+        return candidate_embedding, nice_embeddings or legacy_nice_embeddings
 
     async def _save_score(
         self,
@@ -144,11 +124,25 @@ class ScoreCalculationTask:
         must_gaps: list[str],
         config_version: int,
     ) -> None:
-        """Save score to database."""
-        stmt = select(Score).where(Score.candidate_id == candidate_id)
+        """Save score to database.
+
+        A score already computed with a newer config version (for example by
+        a rescore run that started while this worker's config cache was
+        stale) is left alone, along with the candidate's rank.
+        """
+        # Locked until commit, so the version check holds
+        stmt = select(Score).where(Score.candidate_id == candidate_id).with_for_update()
         result = await self.db.execute(stmt)
         existing = result.scalar_one_or_none()
 
+        if existing and (existing.score_config_version or 0) > config_version:
+            logger.info(
+                f"Keeping score of candidate {candidate_id} computed with config "
+                f"v{existing.score_config_version} over v{config_version}"
+            )
+            await self.db.rollback()
+            return
+
         if existing:
             existing.must_score = must_score
             existing.nice_score = nice_score
@@ -156,6 +150,7 @@ class ScoreCalculationTask:
             existing.role_score = role_score
             existing.total_fit_0_100 = total_fit
             existing.must_gaps_json = must_gaps
+            existing.must_gaps_count = len(must_gaps)
             existing.score_config_version = config_version
         else:
             new_score = Score(
@@ -166,8 +161,15 @@ class ScoreCalculationTask:
                 role_score=role_score,
                 total_fit_0_100=total_fit,
                 must_gaps_json=must_gaps,
+                must_gaps_count=len(must_gaps),
                 score_config_version=config_version,
             )
             self.db.add(new_score)
 
+        # Ranked candidate lists order by this copy of the score
+        await self.db.execute(
+            update(Candidate)
+            .where(Candidate.candidate_id == candidate_id)
+            .values(rank_fit=total_fit)
+        )
         await self.db.commit()
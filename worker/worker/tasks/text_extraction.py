@@ -1,14 +1,26 @@
 import logging
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
 import magic
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from worker.config import get_settings
 from worker.extractors.pdf_extractor import PDFExtractor
 from worker.extractors.word_extractor import WordExtractor
 from worker.storage import StorageService
+from worker.text_artifact import CandidateText, use_compression
+
+if TYPE_CHECKING:
+    from worker.models import Document
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Bump when extractor output changes to invalidate cached texts
+TEXT_EXTRACTOR_VERSION = "v1"
 
 
 class TextExtractionTask:
@@ -23,14 +35,27 @@ class TextExtractionTask:
     async def execute(self, candidate_id: str) -> str | None:
         """Extract text from all documents for a candidate.
 
-        Returns the combined text URI or None if no documents.
+        Each document's text is cached on its own and linked through
+        ``Document.text_uri``. The candidate's combined text and a manifest
+        of document and page boundaries are written as one artifact, which
+        the LLM stage reads directly.
+
+        Returns the candidate text artifact URI or None if no documents.
         """
         logger.info(f"Starting text extraction for candidate {candidate_id}")
 
         # Get documents for candidate
-        from worker.models import Document
+        from worker.models import Candidate, Document
+
+        candidate = await self.db.get(Candidate, candidate_id)
+        if not candidate:
+            raise ValueError(f"Candidate not found: {candidate_id}")
 
-        stmt = select(Document).where(Document.candidate_id == candidate_id)
+        stmt = (
+            select(Document)
+            .where(Document.candidate_id == candidate_id)
+            .order_by(Document.created_at, Document.document_id)
+        )
         result = await self.db.execute(stmt)
         documents = list(result.scalars().all())
 
@@ -38,42 +63,15 @@ class TextExtractionTask:
             logger.warning(f"No documents found for candidate {candidate_id}")
             return None
 
-        all_text_parts = []
+        document_texts = []
 
         for doc in documents:
             try:
-                # Read raw file
-                content = await self.storage.read_raw_file(doc.object_uri)
-
-                # Determine file type
-                mime_type = magic.from_buffer(content, mime=True)
-                logger.info(f"Processing document {doc.document_id}, type: {mime_type}")
-
-                # Extract text based on file type
-                if mime_type == "application/pdf":
-                    text = await self.pdf_extractor.extract(content)
-                elif mime_type in [
-                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    "application/msword",
-                ]:
-                    text = await self.word_extractor.extract(content)
-                else:
-                    # Try to detect by extension
-                    ext = doc.original_filename.lower().split(".")[-1]
-                    if ext == "pdf":
-                        text = await self.pdf_extractor.extract(content)
-                    elif ext in ["docx", "doc"]:
-                        text = await self.word_extractor.extract(content)
-                    else:
-                        logger.warning(f"Unsupported file type: {mime_type}")
-                        continue
-
-                # Add document type label
-                doc_label = f"[{doc.type.upper()}]"
-                all_text_parts.append(f"{doc_label}\n{text}")
-
-                # Save individual document text
-                text_uri = await self.storage.save_text_file(text, candidate_id)
+                document_text = await self._get_document_text(doc, candidate_id)
+                if document_text is None:
+                    continue
+                text_uri, text, pages = document_text
+                document_texts.append((doc.document_id, doc.type, text, pages))
 
                 # Update document with text URI
                 stmt = (
@@ -83,20 +81,86 @@ class TextExtractionTask:
                 )
                 await self.db.execute(stmt)
 
-                logger.info(f"Extracted text from document {doc.document_id}")
-
             except Exception as e:
                 logger.error(f"Failed to extract text from document {doc.document_id}: {e}")
                 raise
 
-        if not all_text_parts:
+        if not document_texts:
             raise ValueError("No text could be extracted from any documents")
 
-        # Combine all text and save
-        combined_text = "\n\n---\n\n".join(all_text_parts)
-        combined_uri = await self.storage.save_text_file(combined_text, candidate_id)
+        artifact_uri = await self.storage.save_candidate_text(
+            candidate.job_id,
+            candidate_id,
+            CandidateText.build(document_texts),
+            compress=use_compression(settings.text_artifact_compression),
+        )
 
         await self.db.commit()
 
         logger.info(f"Text extraction completed for candidate {candidate_id}")
-        return combined_uri
+        return artifact_uri
+
+    async def _get_document_text(
+        self, doc: "Document", candidate_id: str
+    ) -> tuple[str, str, list[dict]] | None:
+        """Extract a document's text, reusing the cached text of identical files.
+
+        Extracted text is cached by file hash, extractor version and
+        character budget, so a file already extracted for another candidate
+        or job is not parsed again. Text beyond ``extract_max_chars`` is
+        never extracted.
+
+        Returns:
+            Tuple of (text URI, text, page spans), or None for unsupported files
+        """
+        max_chars = settings.extract_max_chars or None
+        cache_version = (
+            f"{TEXT_EXTRACTOR_VERSION}-{max_chars}" if max_chars else TEXT_EXTRACTOR_VERSION
+        )
+        if doc.file_hash:
+            cache_uri = self.storage.text_cache_uri(doc.file_hash, cache_version)
+            if self.storage.exists(cache_uri):
+                logger.info(f"Reusing extracted text for document {doc.document_id}")
+                text = await self.storage.read_text_file(cache_uri)
+                return cache_uri, text, await self.storage.read_page_index(cache_uri)
+
+        # Read raw file
+        content = await self.storage.read_raw_file(doc.object_uri)
+
+        # Determine file type
+        mime_type = magic.from_buffer(content, mime=True)
+        logger.info(f"Processing document {doc.document_id}, type: {mime_type}")
+
+        # Extract text based on file type
+        if mime_type == "application/pdf":
+            extracted = await self.pdf_extractor.extract(content, max_chars)
+        elif mime_type in [
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "application/msword",
+        ]:
+            extracted = await self.word_extractor.extract(content, max_chars)
+        else:
+            # Try to detect by extension
+            ext = doc.original_filename.lower().split(".")[-1]
+            if ext == "pdf":
+                extracted = await self.pdf_extractor.extract(content, max_chars)
+            elif ext in ["docx", "doc"]:
+                extracted = await self.word_extractor.extract(content, max_chars)
+            else:
+                logger.warning(f"Unsupported file type: {mime_type}")
+                return None
+
+        # Save individual document text, with page offsets for mapping quotes to pages
+        pages = [asdict(span) for span in extracted.pages]
+        if doc.file_hash:
+            text_uri = await self.storage.save_text_cache(
+                extracted.text, doc.file_hash, cache_version, pages=pages
+            )
+        else:
+            text_uri = await self.storage.save_text_file(extracted.text, candidate_id)
+
+        logger.info(
+            f"Extracted text from document {doc.document_id}"
+            + (" (truncated)" if extracted.truncated else "")
+        )
+        return text_uri, extracted.text, pages
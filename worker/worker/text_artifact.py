@@ -0,0 +1,132 @@
+"""Per-candidate text artifact consumed by the LLM stage.
+
+The text stage writes one file per candidate holding the combined text of
+all its documents and a manifest of where each document (and each PDF
+page) starts and ends in it. The file is JSON, optionally compressed with
+zstd when the ``zstandard`` package is installed.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = 1
+DOCUMENT_SEPARATOR = "\n\n---\n\n"
+ZSTD_SUFFIX = ".zst"
+
+
+@dataclass
+class DocumentSpan:
+    """Character range of one document within the candidate text."""
+
+    document_id: str
+    type: str
+    start: int
+    end: int
+    # Page spans ({"page", "start", "end"}) as offsets into the candidate text
+    pages: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class CandidateText:
+    """Combined text of a candidate's documents with a manifest of boundaries."""
+
+    text: str
+    documents: list[DocumentSpan] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, documents: list[tuple[str, str, str, list[dict]]]) -> "CandidateText":
+        """Combine document texts, each labelled with its type.
+
+        Args:
+            documents: (document_id, type, text, page spans relative to the text)
+        """
+        parts: list[str] = []
+        spans: list[DocumentSpan] = []
+        length = 0
+
+        for document_id, doc_type, text, pages in documents:
+            start = length + (len(DOCUMENT_SEPARATOR) if parts else 0)
+            label = f"[{doc_type.upper()}]\n"
+            part = f"{label}{text}"
+            text_start = start + len(label)
+
+            parts.append(part)
+            length = start + len(part)
+            spans.append(
+                DocumentSpan(
+                    document_id=document_id,
+                    type=doc_type,
+                    start=start,
+                    end=length,
+                    pages=[
+                        {
+                            "page": page["page"],
+                            "start": text_start + page["start"],
+                            "end": text_start + page["end"],
+                        }
+                        for page in pages
+                    ],
+                )
+            )
+
+        return cls(text=DOCUMENT_SEPARATOR.join(parts), documents=spans)
+
+    def locate(self, quote: str) -> tuple[str, int | None] | None:
+        """Find the document ID and page number of a quote, e.g. an evidence quote."""
+        offset = self.text.find(quote)
+        if offset < 0:
+            return None
+        for document in self.documents:
+            if document.start <= offset < document.end:
+                page = next(
+                    (p["page"] for p in document.pages if p["start"] <= offset < p["end"]),
+                    None,
+                )
+                return document.document_id, page
+        return None
+
+    def to_bytes(self, compress: bool = False) -> bytes:
+        """Serialize the artifact, compressed with zstd if requested."""
+        data = json.dumps(
+            {
+                "version": ARTIFACT_VERSION,
+                "documents": [asdict(document) for document in self.documents],
+                "text": self.text,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        if compress:
+            data = zstandard.ZstdCompressor().compress(data)
+        return data
+
+    @classmethod
+    def from_bytes(cls, data: bytes, compressed: bool = False) -> "CandidateText":
+        """Deserialize an artifact written by ``to_bytes``."""
+        if compressed:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read compressed text artifacts")
+            data = zstandard.ZstdDecompressor().decompress(data)
+        payload = json.loads(data)
+        return cls(
+            text=payload["text"],
+            documents=[DocumentSpan(**document) for document in payload["documents"]],
+        )
+
+
+def use_compression(compression: str) -> bool:
+    """Check whether the configured compression can be used."""
+    if compression != "zstd":
+        return False
+    if zstandard is None:
+        logger.warning("zstandard is not installed, writing uncompressed text artifacts")
+        return False
+    return True
@@ -0,0 +1,72 @@
+"""Binary encoding of embedding vectors for BLOB storage."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+SUPPORTED_DTYPES = ("float32", "float16")
+
+
+def encode_vector(
+    vector: Sequence[float] | np.ndarray, dtype: str = "float32"
+) -> tuple[bytes, int, str]:
+    """Encode a vector as little-endian bytes.
+
+    Args:
+        vector: Embedding vector
+        dtype: Storage dtype ("float32" or "float16")
+
+    Returns:
+        Tuple of (bytes, dimension, dtype)
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported vector dtype: {dtype}")
+    array = np.asarray(vector, dtype=np.dtype(dtype).newbyteorder("<"))
+    if array.ndim != 1:
+        raise ValueError(f"Expected a 1-D vector, got shape {array.shape}")
+    return array.tobytes(), int(array.shape[0]), dtype
+
+
+def decode_vector(blob: bytes, dim: int, dtype: str) -> np.ndarray:
+    """Decode bytes written by encode_vector without copying.
+
+    The returned array is a read-only view over ``blob``.
+
+    Args:
+        blob: Encoded vector bytes
+        dim: Vector dimension
+        dtype: Storage dtype
+
+    Returns:
+        1-D numpy array of the stored dtype
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported vector dtype: {dtype}")
+    array = np.frombuffer(blob, dtype=np.dtype(dtype).newbyteorder("<"))
+    if array.shape[0] != dim:
+        raise ValueError(f"Vector dimension mismatch: expected {dim}, got {array.shape[0]}")
+    return array
+
+
+def read_vector(
+    blob: bytes | None,
+    dim: int | None,
+    dtype: str | None,
+    legacy: list[float] | None = None,
+) -> np.ndarray | None:
+    """Read a stored vector, preferring the binary column over legacy JSON.
+
+    Args:
+        blob: vector_blob column value
+        dim: vector_dim column value
+        dtype: vector_dtype column value
+        legacy: vector JSON column value for rows not yet backfilled
+
+    Returns:
+        Vector as a numpy array, or None if nothing is stored
+    """
+    if blob is not None and dim is not None and dtype is not None:
+        return decode_vector(blob, dim, dtype)
+    if legacy is not None:
+        return np.asarray(legacy, dtype=np.float32)
+    return None
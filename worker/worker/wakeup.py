@@ -0,0 +1,102 @@
+"""Wake idle workers when new queue jobs are enqueued.
+
+Every worker binds a Unix datagram socket in a directory on the shared
+storage volume. Whoever enqueues work (the API or another worker) sends
+one empty datagram to every socket there. The message only means "the
+queue may have work"; jobs are still claimed from the DB, so a lost
+datagram just falls back to the worker's regular polling.
+"""
+
+import asyncio
+import logging
+import socket
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SOCKET_SUFFIX = ".sock"
+
+
+def get_wakeup_dir(storage_path: str) -> Path:
+    """Get the socket directory, shared with the API through the storage volume."""
+    return Path(storage_path) / ".wakeup"
+
+
+class WakeupListener:
+    """Receive wakeup datagrams and expose them as an asyncio event."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.path = self.directory / f"{uuid.uuid4().hex}{SOCKET_SUFFIX}"
+        self.event = asyncio.Event()
+        self._sock: socket.socket | None = None
+
+    def start(self) -> bool:
+        """Bind the socket and start listening on the running event loop.
+
+        Returns:
+            False if Unix sockets are unavailable; the worker then polls only
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.setblocking(False)
+            sock.bind(str(self.path))
+        except OSError as e:
+            logger.warning(f"Wakeup socket unavailable, polling only: {e}")
+            return False
+
+        self._sock = sock
+        asyncio.get_running_loop().add_reader(sock.fileno(), self._on_readable)
+        logger.info(f"Listening for wakeups on {self.path}")
+        return True
+
+    def _on_readable(self) -> None:
+        # Drain every pending datagram; one wakeup covers them all
+        while self._sock is not None:
+            try:
+                self._sock.recv(64)
+            except (BlockingIOError, InterruptedError):
+                break
+        self.event.set()
+
+    def close(self) -> None:
+        """Stop listening and remove the socket file."""
+        if self._sock is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        self.path.unlink(missing_ok=True)
+
+
+def notify_workers(directory: str | Path) -> int:
+    """Send a wakeup to every listening worker.
+
+    Sockets left behind by workers that died are removed.
+
+    Returns:
+        Number of workers notified
+    """
+    directory = Path(directory)
+    if not hasattr(socket, "AF_UNIX") or not directory.is_dir():
+        return 0
+
+    notified = 0
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.setblocking(False)
+        for path in directory.glob(f"*{SOCKET_SUFFIX}"):
+            try:
+                sock.sendto(b"", str(path))
+                notified += 1
+            except BlockingIOError:
+                # Receive buffer is full, so a wakeup is already pending
+                notified += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not notify {path}: {e}")
+    return notified